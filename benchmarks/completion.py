@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Compares the completion engine backends with the original window implementation.
+
+Every prefix is checked for identical results before it is timed. A second
+table simulates typing words one character at a time and compares the
+per-keystroke cost of fresh queries with an incrementally narrowed session,
+and with a session personalized by a history of PERSONAL_TERMS lookups:
+
+    python benchmarks/completion.py [--data-dir DIR] [--repeat N]
+"""
+
+import argparse
+import bisect
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "subprojects" / "wn"))
+
+from corpus import COMPLETION_PREFIXES
+
+from wordbook import base
+from wordbook.completion import CompletionEngine, CompletionSession, PersonalRanking, np
+from wordbook.history import frecency_key
+
+LIMIT = 10
+TYPED_WORDS = ["interstellar", "comprehensive", "photosynthesis", "understand", "zoology"]
+PERSONAL_TERMS = 5000
+
+
+def legacy_completion_items(wordlist: list[str], text: str, limit: int) -> list[str]:
+    """The ranking that used to live in WordbookWindow._get_completion_items, kept as a reference."""
+    if limit <= 0 or not text.strip() or not wordlist:
+        return []
+
+    typed_prefix = text.lstrip()
+    search_term = typed_prefix.casefold()
+    prefix_len = len(typed_prefix)
+    start_idx = bisect.bisect_left(wordlist, search_term, key=str.casefold)
+    end_idx = bisect.bisect_right(wordlist, f"{search_term}{chr(sys.maxunicode)}", key=str.casefold)
+    ranked_matches: list[tuple] = []
+    seen_lower: dict[str, tuple] = {}
+
+    for original_word in wordlist[start_idx:end_idx]:
+        display_lower = original_word.casefold()
+        prev = seen_lower.get(display_lower)
+        if prev is not None:
+            prev_rank, prev_word = prev
+            if prev_word[:prefix_len] != typed_prefix and original_word[:prefix_len] == typed_prefix:
+                old_idx = bisect.bisect_left(ranked_matches, (prev_rank, prev_word))
+                if old_idx < len(ranked_matches) and ranked_matches[old_idx] == (prev_rank, prev_word):
+                    ranked_matches[old_idx] = (prev_rank, original_word)
+                seen_lower[display_lower] = (prev_rank, original_word)
+            continue
+        suffix = display_lower[len(search_term) :]
+        rank = (
+            sum(char == " " for char in suffix),
+            sum(not char.isalnum() for char in suffix),
+            len(suffix),
+            display_lower,
+        )
+        seen_lower[display_lower] = (rank, original_word)
+        bisect.insort(ranked_matches, (rank, original_word))
+        if len(ranked_matches) > limit:
+            evicted = ranked_matches.pop()
+            seen_lower.pop(evicted[1].casefold(), None)
+
+    return [word for _rank, word in ranked_matches]
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare completion backends with the original implementation")
+    parser.add_argument("--data-dir", default=base.WN_DIR, help="Directory containing the extracted wn.db")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per prefix (default: 20)")
+    args = parser.parse_args()
+
+    base.wn.config.data_directory = args.data_dir
+    wn_instance = base.get_wn_instance()
+    if wn_instance is None:
+        return 1
+
+    wordlist = sorted(wn_instance.lemmas(), key=str.casefold)
+    backends = ["python"] + (["numpy"] if np is not None else [])
+    engines = {backend: CompletionEngine(wordlist, backend=backend) for backend in backends}
+
+    print(f"{'prefix':<8} {'legacy':>10} " + " ".join(f"{backend:>10}" for backend in backends))
+    mismatches = 0
+    for prefixes in COMPLETION_PREFIXES.values():
+        for prefix in prefixes:
+            expected = legacy_completion_items(wordlist, prefix, LIMIT)
+            for backend, engine in engines.items():
+                if engine.complete(prefix, LIMIT) != expected:
+                    mismatches += 1
+                    print(f"✗ {backend} backend differs from the original for '{prefix}'")
+
+            timings = [_median_ms(lambda prefix=prefix: legacy_completion_items(wordlist, prefix, LIMIT), args.repeat)]
+            timings += [
+                _median_ms(lambda engine=engine, prefix=prefix: engine.complete(prefix, LIMIT), args.repeat)
+                for engine in engines.values()
+            ]
+            print(f"{prefix:<8} " + " ".join(f"{timing:>8.3f}ms" for timing in timings))
+
+    print()
+    engine = engines[backends[-1]]
+    rng = random.Random(0)
+    personal = PersonalRanking(engine)
+    now = time.time()
+    start = time.perf_counter()
+    for term in rng.sample(wordlist, PERSONAL_TERMS) + TYPED_WORDS:
+        personal.update(term, frecency_key(now - rng.uniform(0, 90 * 24 * 60 * 60)), rng.random() < 0.05)
+    learn_ms = (time.perf_counter() - start) * 1000 / (PERSONAL_TERMS + len(TYPED_WORDS))
+    print(f"personal ranking: {len(personal)} lemmas, {learn_ms:.3f}ms per recorded lookup")
+
+    print(f"{'typed word':<16} {'fresh/key':>10} {'session/key':>12} {'personal/key':>13}")
+    for word in TYPED_WORDS:
+        keystrokes = [word[:length] for length in range(1, len(word) + 1)]
+        fresh = _median_ms(
+            lambda keystrokes=keystrokes: [engine.complete(text, LIMIT) for text in keystrokes], args.repeat
+        )
+
+        def type_word(keystrokes=keystrokes):
+            session = CompletionSession(engine)
+            for text in keystrokes:
+                session.complete(text, LIMIT)
+
+        def type_word_personalized(keystrokes=keystrokes):
+            session = CompletionSession(engine, personal)
+            for text in keystrokes:
+                session.complete(text, LIMIT)
+
+        narrowed = _median_ms(type_word, args.repeat)
+        personalized = _median_ms(type_word_personalized, args.repeat)
+        print(
+            f"{word:<16} {fresh / len(keystrokes):>8.3f}ms {narrowed / len(keystrokes):>10.3f}ms "
+            f"{personalized / len(keystrokes):>11.3f}ms"
+        )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Representative inputs for the Wordbook benchmarks."""
+
+# Highly polysemous words with dozens of synsets and many relations.
+HUB_WORDS = [
+    "set",
+    "run",
+    "go",
+    "take",
+    "break",
+    "line",
+    "head",
+    "point",
+    "make",
+    "cut",
+    "play",
+    "light",
+]
+
+# Words with one or two synsets that are rarely looked up.
+RARE_WORDS = [
+    "sesquipedalian",
+    "defenestration",
+    "syzygy",
+    "quixotic",
+    "obsequious",
+    "perspicacious",
+    "lugubrious",
+    "antidisestablishmentarianism",
+]
+
+# Misspellings and non-words. These exercise the empty result and the suggestion path.
+MISSES = [
+    "definately",  # codespell:ignore
+    "recieve",  # codespell:ignore
+    "wordbokk",
+    "seperate",  # codespell:ignore
+    "asdfghjkl",
+    "pronounciation",  # codespell:ignore
+]
+
+# Multi-word expressions stored with spaces in the lexicon.
+MULTI_WORD = [
+    "ad hoc",
+    "give up",
+    "hot dog",
+    "in spite of",
+    "a priori",
+    "New York",
+    "take care",
+    "by and large",
+]
+
+DEFINITION_CORPUS = {
+    "hub": HUB_WORDS,
+    "rare": RARE_WORDS,
+    "miss": MISSES,
+    "mwe": MULTI_WORD,
+}
+
+# Descriptions typed into the reverse lookup.
+REVERSE_QUERIES = [
+    "fear of heights",
+    "a person who makes bread",
+    "the study of insects",
+    "unable to sleep",
+    "small round green vegetable",
+    "feeling of sadness about the past",
+]
+
+# Crossword-style patterns, from selective to very broad.
+PATTERNS = ["c?t", "*ology", "un*able", "?????", "s*", "*in*"]
+
+# Letters for the anagram and "formable from letters" searches.
+ANAGRAM_LETTERS = ["listen", "stare", "angered", "reconstitution"]
+
+# Words to find rhymes and homophones for.
+RHYME_WORDS = ["cat", "nation", "light", "orange", "right", "bear"]
+
+# Prefixes typed into the search entry, grouped by length.
+COMPLETION_PREFIXES = {
+    1: ["a", "c", "s", "t", "x"],
+    2: ["ab", "co", "in", "re", "un"],
+    3: ["con", "pre", "sta", "tra", "qui"],
+    4: ["inte", "comp", "over", "hous", "zool"],
+}
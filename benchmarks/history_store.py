@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Checks that the history store stays fast as the history grows.
+
+Fills a temporary history database with a number of distinct terms, then
+times looking up a term that is already there, checking a favorite, and
+reading a page of the sidebar near the start and near the end of the history,
+in both recency and frecency order. None of these should grow with the size
+of the history:
+
+    python benchmarks/history_store.py [--terms N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from wordbook.history import HistoryOrder, HistoryStore
+
+PAGE_SIZE = 100
+
+
+def _time(operation: Callable[[], object], repeats: int) -> float:
+    """Returns the median time of operation in milliseconds."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _last_page_key(store: HistoryStore, order: HistoryOrder, terms: int) -> tuple[float, str]:
+    """Returns the key after which the last page of the history starts."""
+    last = store.page(terms - PAGE_SIZE, order=order)[-1]
+    return (getattr(last, order.value), last.term)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time history store operations on a large history")
+    parser.add_argument("--terms", type=int, default=100_000, help="Distinct terms in the history (default: 100000)")
+    parser.add_argument("--repeats", type=int, default=200, help="Repeats of each operation (default: 200)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    terms = [f"term {index}" for index in range(args.terms)]
+    now = time.time()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = HistoryStore(str(Path(data_dir) / "history.db"))
+        start = time.perf_counter()
+        store.import_terms(terms, rng.sample(terms, min(len(terms), 500)))
+        print(f"filled {args.terms} terms in {time.perf_counter() - start:.2f}s")
+
+        results = {
+            "repeat lookup": _time(lambda: store.record_lookup(rng.choice(terms), now), args.repeats),
+            "is_favorite": _time(lambda: store.is_favorite(rng.choice(terms)), args.repeats),
+        }
+        for order in HistoryOrder:
+            name = order.name.lower()
+            last_page = _last_page_key(store, order, args.terms)
+            results[f"first page, {name}"] = _time(lambda order=order: store.page(PAGE_SIZE, order=order), args.repeats)
+            results[f"last page, {name}"] = _time(
+                lambda order=order, last_page=last_page: store.page(PAGE_SIZE, last_page, order=order), args.repeats
+            )
+        results["favorites page"] = _time(lambda: store.page(PAGE_SIZE, favorites_only=True), args.repeats)
+
+    for name, median in results.items():
+        print(f"{name:<24} {median:>8.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
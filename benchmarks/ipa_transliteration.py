@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Checks that the compiled IPA transliterator produces the same espeak-ng input
+as the original chain of str.replace() calls, and compares their speed.
+
+Every pronunciation in the database is transliterated with both
+implementations:
+
+    python benchmarks/ipa_transliteration.py [--data-dir DIR]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "subprojects" / "wn"))
+
+from wordbook import base
+
+
+def legacy_ipa_to_espeak(ipa_string: str) -> str:
+    """The transliterator used before the compiled pattern, kept as a reference."""
+    s = ipa_string.strip().strip("/[]")
+
+    mapping = {
+        "ˈ": "'",
+        "ˌ": ",",
+        "ː": ":",
+        ".": "",
+        "‿": "",
+        "|": "",
+        "‖": "",
+        "tʃ": "tS",
+        "dʒ": "dZ",
+        "eɪ": "eI",
+        "aɪ": "aI",
+        "ɔɪ": "OI",
+        "aʊ": "aU",
+        "oʊ": "oU",
+        "əʊ": "@U",
+        "ɪə": "I@",
+        "eə": "e@",
+        "ɛə": "e@",
+        "ʊə": "U@",
+        "iː": "i:",
+        "ɑː": "A:",
+        "ɔː": "O:",
+        "uː": "u:",
+        "ɜː": "3:",
+        "ɚ": "@r",
+        "ɝ": "3r",
+        "ɪ": "I",
+        "ɛ": "E",
+        "e": "e",
+        "æ": "a",
+        "ɑ": "A",
+        "ɒ": "0",
+        "ɔ": "O",
+        "ʊ": "U",
+        "ʌ": "V",
+        "ɜ": "3",
+        "ə": "@",
+        "ɐ": "@",
+        "a": "a",
+        "θ": "T",
+        "ð": "D",
+        "ʃ": "S",
+        "ʒ": "Z",
+        "ŋ": "N",
+        "ɹ": "r",
+        "ɾ": "4",
+        "ɫ": "l",
+        "ʔ": "?",
+        "ʍ": "W",
+        "x": "x",
+        "ç": "C",
+    }
+
+    for ipa_sym, esp_sym in sorted(mapping.items(), key=lambda x: len(x[0]), reverse=True):
+        s = s.replace(ipa_sym, esp_sym)
+
+    s = "".join(c for c in s if ord(c) < 128)
+    return f"[[{s}]]"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare the IPA transliterator with the original implementation")
+    parser.add_argument("--data-dir", default=base.WN_DIR, help="Directory containing the extracted wn.db")
+    args = parser.parse_args()
+
+    base.wn.config.data_directory = args.data_dir
+    wn_instance = base.get_wn_instance()
+    if wn_instance is None:
+        return 1
+
+    ipa_strings = sorted(
+        {
+            pronunciation.value
+            for word in wn_instance.words()
+            for pronunciation in word.lemma(data=True).pronunciations()
+        }
+    )
+    if not ipa_strings:
+        print("✗ No pronunciations found in the database")
+        return 1
+
+    start = time.perf_counter()
+    expected = [legacy_ipa_to_espeak(ipa) for ipa in ipa_strings]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [base.ipa_to_espeak.__wrapped__(ipa) for ipa in ipa_strings]
+    new_time = time.perf_counter() - start
+
+    mismatches = 0
+    for ipa, old, new in zip(ipa_strings, expected, actual, strict=True):
+        if old != new:
+            mismatches += 1
+            print(f"✗ '{ipa}': expected '{old}', got '{new}'")
+
+    print(f"Transliterated {len(ipa_strings)} distinct pronunciations")
+    print(f"  str.replace chain: {legacy_time * 1000:.1f} ms")
+    print(f"  compiled pattern:  {new_time * 1000:.1f} ms (uncached)")
+    print("✓ Identical output" if not mismatches else f"✗ {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
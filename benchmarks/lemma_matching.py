@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Checks that the indexed lemma matcher picks the same lemmas as the original
+difflib-based matcher, and compares their speed.
+
+Every synset reached from a sample of the lemma list (plus the benchmark
+corpus and some misspellings that still resolve to synsets) is matched with
+both implementations:
+
+    python benchmarks/lemma_matching.py [--data-dir DIR] [--sample N]
+"""
+
+import argparse
+import difflib
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "subprojects" / "wn"))
+
+from corpus import DEFINITION_CORPUS
+
+from wordbook import base
+
+
+def legacy_find_best_lemma_match(term: str, lemmas: list[str]) -> str:
+    """The matcher used before the synset lemma index, kept as a reference."""
+    normalized_term = term.lower().strip()
+
+    for lemma in lemmas:
+        if base._normalize_lemma(lemma).lower() == normalized_term:
+            return base._normalize_lemma(lemma)
+
+    diff_match = difflib.get_close_matches(term, lemmas, n=1, cutoff=0.8)
+    if diff_match:
+        return base._normalize_lemma(diff_match[0])
+
+    return base._normalize_lemma(lemmas[0]) if lemmas else ""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare the lemma matcher with the original difflib matcher")
+    parser.add_argument("--data-dir", default=base.WN_DIR, help="Directory containing the extracted wn.db")
+    parser.add_argument("--sample", type=int, default=5000, help="Number of lemmas to sample, 0 for all")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the sample")
+    args = parser.parse_args()
+
+    base.wn.config.data_directory = args.data_dir
+    wn_instance = base.get_wn_instance()
+    if wn_instance is None:
+        return 1
+
+    terms = wn_instance.lemmas()
+    if args.sample:
+        terms = random.Random(args.seed).sample(terms, min(args.sample, len(terms)))
+    terms += [term for category in DEFINITION_CORPUS.values() for term in category]
+    # Inflected and differently cased forms reach synsets without an exact lemma match.
+    terms += [f"{term}s" for term in terms[:500]] + [term.upper() for term in terms[:500]]
+
+    cases = []
+    for term in terms:
+        normalized_term = term.lower().strip()
+        for synset in wn_instance.synsets(term.lower()):
+            data = base.get_synset_data(synset)
+            if data.lemmas:
+                cases.append((term, normalized_term, data))
+
+    legacy_time = new_time = 0.0
+    mismatches = 0
+    for term, normalized_term, data in cases:
+        start = time.perf_counter()
+        expected = legacy_find_best_lemma_match(term, list(data.lemmas))
+        legacy_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = base._find_best_lemma_match(term, normalized_term, data)
+        new_time += time.perf_counter() - start
+
+        if actual != expected:
+            mismatches += 1
+            print(f"✗ '{term}' in {data.lemmas}: expected '{expected}', got '{actual}'")
+
+    print(f"Matched {len(cases)} (term, synset) pairs from {len(terms)} terms")
+    print(f"  difflib matcher: {legacy_time * 1000:.1f} ms")
+    print(f"  indexed matcher: {new_time * 1000:.1f} ms")
+    print("✓ Identical lemmas selected" if not mismatches else f"✗ {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
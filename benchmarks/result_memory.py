@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Reports how much memory a cache of lookup results takes.
+
+Looks up a random sample of lemmas against an extracted wn.db and measures
+everything the results keep alive, counting objects shared between results
+once, as they would be in a cache. The same results are then rebuilt in the
+form lookups used to return, as nested dictionaries and lists with lemmas
+that aren't interned and pronunciations picked anew for every lookup, and
+measured the same way:
+
+    python benchmarks/result_memory.py [--data-dir DIR] [--terms N]
+"""
+
+import argparse
+import dataclasses
+import random
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "subprojects" / "wn"))
+
+from wordbook import base
+
+# The memory a result cache would be given, in bytes.
+BUDGET = 64 * 1024 * 1024
+
+ACCENT = "us"
+
+
+@dataclasses.dataclass
+class LegacyPronunciationInfo:
+    ipa: str
+    is_fallback: bool = False
+
+
+def deep_size(roots: Iterable[Any]) -> int:
+    """Returns the size in bytes of roots and every object reachable from them, counting each object once."""
+    seen: set[int] = set()
+    size = 0
+    stack = list(roots)
+    while stack:
+        value = stack.pop()
+        if id(value) in seen or isinstance(value, type):
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple | set | frozenset):
+            stack.extend(value)
+        elif dataclasses.is_dataclass(value):
+            if hasattr(value, "__dict__"):
+                stack.append(value.__dict__)
+            else:
+                stack.extend(getattr(value, field.name) for field in dataclasses.fields(value))
+    return size
+
+
+def legacy_result(result: dict[str, Any], accent: str, lemma_copies: dict[tuple[str, str], str]) -> dict[str, Any]:
+    """
+    Rebuilds a result in the form lookups used to return.
+
+    Args:
+        result: A result returned by base.get_definition().
+        accent: The accent the result was looked up for.
+        lemma_copies: Lemmas were separate strings for every synset, shared only between lookups of the
+            same synset through the synset cache. Keyed by synset ID and lemma, shared between results.
+    """
+
+    def lemma(synset_id: str, text: str) -> str:
+        return lemma_copies.setdefault((synset_id, text), (" " + text)[1:])
+
+    def pronunciation(info: base.PronunciationInfo | None) -> LegacyPronunciationInfo | None:
+        return LegacyPronunciationInfo(info.ipa, info.is_fallback) if info else None
+
+    legacy: dict[str, list[dict[str, Any]]] = {}
+    for pos, synsets in result["result"].items():
+        legacy[pos] = []
+        for synset in synsets:
+            synset_data = synset.as_dict()
+            for key in ("syn", "ant", "sim", "also_sees"):
+                synset_data[key] = [lemma(synset.id, text) for text in synset_data[key]]
+            synset_data["name"] = lemma(synset.id, synset.name)
+            synset_data["pronunciations"] = {
+                code: pronunciation(info) for code, info in synset_data["pronunciations"].items()
+            }
+            synset_data["pronunciation"] = synset_data["pronunciations"][accent]
+            legacy[pos].append(synset_data)
+    return {"term": result["term"], "result": legacy}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure the memory taken by cached lookup results")
+    parser.add_argument("--data-dir", default=base.WN_DIR, help="Directory containing the extracted wn.db")
+    parser.add_argument("--terms", type=int, default=2000, help="Lemmas to look up (default: 2000)")
+    args = parser.parse_args()
+
+    if not (Path(args.data_dir) / "wn.db").is_file():
+        print(f"✗ No wn.db found in {args.data_dir}. Run Wordbook once or pass --data-dir.")
+        return 1
+
+    base.wn.config.data_directory = args.data_dir
+    wn_instance = base.get_wn_instance()
+    if wn_instance is None:
+        return 1
+
+    lemmas = wn_instance.lemmas()
+    terms = random.Random(0).sample(lemmas, min(args.terms, len(lemmas)))
+
+    results = []
+    for term in terms:
+        result = base.get_definition(term, wn_instance, accent=ACCENT)
+        if result["result"]:
+            base._add_gloss_links(result["result"])
+            results.append(result)
+
+    lemma_copies: dict[tuple[str, str], str] = {}
+    legacy_results = [legacy_result(result, ACCENT, lemma_copies) for result in results]
+    synsets = sum(len(pos_synsets) for result in results for pos_synsets in result["result"].values())
+
+    print(f"results: {len(results)}, synsets: {synsets}")
+    print(f"{'representation':<16} {'bytes/result':>14} {'bytes/synset':>14} {'results in 64 MiB':>18}")
+    sizes = {"dicts": deep_size(legacy_results), "slots": deep_size(results)}
+    for name, size in sizes.items():
+        per_result = size / len(results)
+        print(f"{name:<16} {per_result:>14.0f} {size / synsets:>14.0f} {int(BUDGET / per_result):>18}")
+    print(f"saved: {1 - sizes['slots'] / sizes['dicts']:.0%}")
+    return 0 if sizes["slots"] < sizes["dicts"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Benchmarks for the lookup, completion and suggestion hot paths of Wordbook.
+
+Runs against an extracted wn.db, prints a summary and optionally writes the
+results as JSON or compares them against a stored baseline:
+
+    python benchmarks/run.py --output baseline.json
+    python benchmarks/run.py --compare baseline.json
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "subprojects" / "wn"))
+
+from corpus import (
+    ANAGRAM_LETTERS,
+    COMPLETION_PREFIXES,
+    DEFINITION_CORPUS,
+    HUB_WORDS,
+    MISSES,
+    PATTERNS,
+    RARE_WORDS,
+    REVERSE_QUERIES,
+    RHYME_WORDS,
+)
+
+from wordbook import base
+from wordbook.anagrams import AnagramIndex
+from wordbook.completion import CompletionEngine
+from wordbook.pattern_search import PatternIndex
+
+COMPLETION_LIMIT = 10
+PATTERN_PAGE_SIZE = 200
+DEFAULT_THRESHOLD = 1.25
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    index = min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Reduces timing samples (in milliseconds) to a latency distribution."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "p90": _percentile(ordered, 0.9),
+        "p99": _percentile(ordered, 0.99),
+        "max": ordered[-1],
+    }
+
+
+def time_call(fn: Callable[[], Any]) -> float:
+    """Returns the duration of a single call in milliseconds."""
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _cold_definition(term: str, wn_instance: base.wn.Wordnet) -> float:
+    base.SYNSET_CACHE.clear()
+    return time_call(lambda: base.get_definition(term, wn_instance))
+
+
+def bench_definitions(wn_instance: base.wn.Wordnet, repeat: int) -> dict[str, list[float]]:
+    samples: dict[str, list[float]] = {
+        "get_definition.cold": [_cold_definition(term, wn_instance) for _ in range(repeat) for term in HUB_WORDS]
+    }
+    for category, terms in DEFINITION_CORPUS.items():
+        name = f"get_definition.{category}"
+        samples[name] = [
+            time_call(lambda term=term: base.get_definition(term, wn_instance)) for _ in range(repeat) for term in terms
+        ]
+    return samples
+
+
+def bench_completion(wordlist: list[str], repeat: int) -> dict[str, list[float]]:
+    samples: dict[str, list[float]] = {"completion.build": [time_call(lambda: CompletionEngine(wordlist))]}
+    engine = CompletionEngine(wordlist)
+    for length, prefixes in COMPLETION_PREFIXES.items():
+        samples[f"completion.prefix{length}"] = [
+            time_call(lambda prefix=prefix: engine.complete(prefix, COMPLETION_LIMIT))
+            for _ in range(repeat)
+            for prefix in prefixes
+        ]
+    return samples
+
+
+def bench_suggestions(wordlist: list[str], repeat: int) -> dict[str, list[float]]:
+    return {
+        "suggestions": [
+            time_call(lambda term=term: base.get_suggestions(term, wordlist)) for _ in range(repeat) for term in MISSES
+        ]
+    }
+
+
+def bench_patterns(wordlist: list[str], repeat: int) -> dict[str, list[float]]:
+    sorted_wordlist = sorted(wordlist, key=str.casefold)
+    index = PatternIndex(sorted_wordlist)
+    samples: dict[str, list[float]] = {"pattern_search.build": [time_call(lambda: next(index.search("x"), None))]}
+    samples["pattern_search.first_page"] = [
+        time_call(lambda pattern=pattern: list(itertools.islice(index.search(pattern), PATTERN_PAGE_SIZE)))
+        for _ in range(repeat)
+        for pattern in PATTERNS
+    ]
+    return samples
+
+
+def bench_anagrams(wordlist: list[str], repeat: int) -> dict[str, list[float]]:
+    index = AnagramIndex(wordlist)
+    samples: dict[str, list[float]] = {"anagrams.build": [time_call(lambda: index.anagrams("x"))]}
+    samples["anagrams.exact"] = [
+        time_call(lambda letters=letters: index.anagrams(letters)) for _ in range(repeat) for letters in ANAGRAM_LETTERS
+    ]
+    samples["anagrams.formable"] = [
+        time_call(lambda letters=letters: index.formable(letters)) for _ in range(repeat) for letters in ANAGRAM_LETTERS
+    ]
+    return samples
+
+
+def bench_reverse_lookup(repeat: int) -> dict[str, list[float]]:
+    return {
+        "reverse_lookup": [
+            time_call(lambda query=query: base.reverse_lookup(query))
+            for _ in range(repeat)
+            for query in REVERSE_QUERIES
+        ]
+    }
+
+
+def bench_rhymes(repeat: int) -> dict[str, list[float]]:
+    return {
+        "rhymes": [time_call(lambda word=word: base.find_rhymes(word)) for _ in range(repeat) for word in RHYME_WORDS],
+        "sound_alikes": [
+            time_call(lambda word=word: base.find_sound_alikes(word)) for _ in range(repeat) for word in RHYME_WORDS
+        ],
+    }
+
+
+def bench_grouping(wn_instance: base.wn.Wordnet, repeat: int) -> dict[str, list[float]]:
+    pos_synsets = [
+        synsets
+        for term in HUB_WORDS
+        for synsets in (base.get_definition(term, wn_instance)["result"] or {}).values()
+        if synsets
+    ]
+    return {
+        "group_synsets_by_lemma": [
+            time_call(lambda synsets=synsets: base.group_synsets_by_lemma(synsets))
+            for _ in range(repeat)
+            for synsets in pos_synsets
+        ]
+    }
+
+
+def bench_ipa(wn_instance: base.wn.Wordnet, repeat: int) -> dict[str, list[float]]:
+    ipa_strings = [
+        pronunciation.value
+        for term in HUB_WORDS + RARE_WORDS
+        for word in wn_instance.words(term)
+        for pronunciation in word.lemma(data=True).pronunciations()
+    ]
+    if not ipa_strings:
+        return {}
+    return {
+        "ipa_to_espeak": [
+            time_call(lambda ipa=ipa: base.ipa_to_espeak(ipa)) for _ in range(repeat) for ipa in ipa_strings
+        ]
+    }
+
+
+def bench_startup(data_dir: str, repeat: int) -> dict[str, list[float]]:
+    samples: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, str(Path(__file__).parent / "startup.py"), data_dir],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            print(f"Startup benchmark failed: {completed.stderr.strip()}")
+            return {}
+        for phase, duration in json.loads(completed.stdout).items():
+            samples.setdefault(f"startup.{phase}", []).append(duration)
+    return samples
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> int:
+    """
+    Prints median changes against a baseline.
+
+    Returns:
+        The number of benchmarks whose median regressed by more than the threshold.
+    """
+    regressions = 0
+    print()
+    print(f"{'benchmark':<32} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, summary in results["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            print(f"{name:<32} {'-':>12} {summary['median']:>10.3f}ms {'new':>8}")
+            continue
+        ratio = summary["median"] / previous["median"] if previous["median"] else float("inf")
+        marker = ""
+        if ratio > threshold:
+            regressions += 1
+            marker = "  << regression"
+        print(f"{name:<32} {previous['median']:>10.3f}ms {summary['median']:>10.3f}ms {ratio:>7.2f}x{marker}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Wordbook's lookup, completion and suggestion paths")
+    parser.add_argument("--data-dir", default=base.WN_DIR, help="Directory containing the extracted wn.db")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of passes over each corpus (default: 5)")
+    parser.add_argument("--startup-runs", type=int, default=3, help="Number of cold startups to time (default: 3)")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE", help="Compare against a stored JSON result")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Median ratio above which a benchmark counts as regressed (default: {DEFAULT_THRESHOLD})",
+    )
+    args = parser.parse_args()
+
+    if not (Path(args.data_dir) / "wn.db").is_file():
+        print(f"✗ No wn.db found in {args.data_dir}. Run Wordbook once or pass --data-dir.")
+        return 1
+
+    base.wn.config.data_directory = args.data_dir
+    wn_instance = base.get_wn_instance()
+    if wn_instance is None:
+        return 1
+
+    wordlist = wn_instance.lemmas()
+
+    samples: dict[str, list[float]] = {}
+    samples |= bench_definitions(wn_instance, args.repeat)
+    samples |= bench_completion(wordlist, args.repeat)
+    samples |= bench_suggestions(wordlist, args.repeat)
+    samples |= bench_patterns(wordlist, args.repeat)
+    samples |= bench_anagrams(wordlist, args.repeat)
+    samples |= bench_reverse_lookup(args.repeat)
+    samples |= bench_rhymes(args.repeat)
+    samples |= bench_grouping(wn_instance, args.repeat)
+    samples |= bench_ipa(wn_instance, args.repeat)
+    samples |= bench_startup(args.data_dir, args.startup_runs)
+
+    results = {
+        "meta": {
+            "date": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "wordlist_size": len(wordlist),
+            "repeat": args.repeat,
+        },
+        "benchmarks": {name: summarize(values) for name, values in samples.items() if values},
+    }
+
+    print(f"{'benchmark':<32} {'median':>10} {'p90':>10} {'max':>10} {'n':>6}")
+    for name, summary in results["benchmarks"].items():
+        print(
+            f"{name:<32} {summary['median']:>8.3f}ms {summary['p90']:>8.3f}ms "
+            f"{summary['max']:>8.3f}ms {summary['count']:>6}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=4))
+        print(f"✓ Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
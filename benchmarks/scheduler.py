@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Checks that user lookups aren't stuck behind background work in the backend's worker pool.
+
+Foreground lookups arrive at a steady rate while a burst of normal and idle
+jobs is queued, every job holding a shared lock the way WordNet queries hold
+WN_DATABASE_LOCK. Lookup latency is compared with a first-in, first-out
+ThreadPoolExecutor of the same size, and the pool's own queue statistics are
+printed afterwards:
+
+    python benchmarks/scheduler.py [--workers N] [--lookups N]
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from wordbook.scheduler import Priority, WorkerPool
+
+# Seconds each kind of job holds the shared lock.
+LOOKUP_TIME = 0.005
+NORMAL_TIME = 0.01
+IDLE_TIME = 0.02
+LOOKUP_INTERVAL = 0.03
+
+
+def _run(submit: Callable[[Priority, Callable[[], None]], None], lookups: int, background: int) -> list[float]:
+    """Returns the latency of every lookup, from submission to completion, in milliseconds."""
+    lock = threading.Lock()
+    latencies: list[float] = []
+    done = threading.Semaphore(0)
+
+    def hold(seconds: float) -> None:
+        with lock:
+            time.sleep(seconds)
+
+    for index in range(background):
+        if index % 4:
+            submit(Priority.IDLE, lambda: hold(IDLE_TIME))
+        else:
+            submit(Priority.NORMAL, lambda: hold(NORMAL_TIME))
+
+    for _ in range(lookups):
+        submitted = time.perf_counter()
+
+        def lookup(submitted=submitted):
+            hold(LOOKUP_TIME)
+            latencies.append((time.perf_counter() - submitted) * 1000)
+            done.release()
+
+        submit(Priority.FOREGROUND, lookup)
+        time.sleep(LOOKUP_INTERVAL)
+
+    for _ in range(lookups):
+        done.acquire()
+    return latencies
+
+
+def _describe(name: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    print(f"{name:<12} {statistics.median(ordered):>9.1f}ms {p95:>9.1f}ms {ordered[-1]:>9.1f}ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure lookup latency under background load")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads (default: 4)")
+    parser.add_argument("--lookups", type=int, default=30, help="Foreground lookups (default: 30)")
+    parser.add_argument("--background", type=int, default=200, help="Queued background jobs (default: 200)")
+    args = parser.parse_args()
+
+    print(f"{'scheduler':<12} {'median':>11} {'p95':>11} {'max':>11}")
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        fifo = _run(lambda _priority, job: executor.submit(job), args.lookups, args.background)
+        executor.shutdown(cancel_futures=True)
+    _describe("fifo", fifo)
+
+    pool = WorkerPool(args.workers, "benchmark")
+    prioritized = _run(pool.submit, args.lookups, args.background)
+    _describe("priority", prioritized)
+
+    print()
+    print(f"{'priority':<12} {'started':>8} {'queued':>8} {'mean wait':>11} {'max wait':>11}")
+    for priority, stats in pool.stats().items():
+        print(
+            f"{priority.name.lower():<12} {stats.started:>8} {stats.queued:>8} "
+            f"{stats.mean_wait * 1000:>9.1f}ms {stats.max_wait * 1000:>9.1f}ms"
+        )
+    pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
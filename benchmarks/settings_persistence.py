@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Checks that settings changes are coalesced into a single atomic write.
+
+Toggles a setting rapidly, the way flicking a switch in the preferences
+dialog does, in a temporary configuration directory. Reports the cost of each
+change on the calling thread and fails unless exactly one write reached the
+disk, the file holds the final value, and no temporary files are left behind:
+
+    python benchmarks/settings_persistence.py [--toggles N]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from wordbook import utils
+from wordbook.settings import Settings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that rapid settings changes produce one write")
+    parser.add_argument("--toggles", type=int, default=101, help="Number of changes (default: 101)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        utils.CONFIG_DIR = config_dir
+        utils.CONFIG_FILE = str(Path(config_dir) / "wordbook.json")
+        settings = Settings.get()
+        settings.flush()
+        initial_writes = settings._writer.writes
+
+        samples = []
+        for index in range(args.toggles):
+            start = time.perf_counter()
+            settings.double_click = index % 2 == 0
+            samples.append((time.perf_counter() - start) * 1000)
+
+        time.sleep(Settings.SAVE_DELAY * 3)
+        writes = settings._writer.writes - initial_writes
+        with open(utils.CONFIG_FILE) as f:
+            saved = json.load(f)["behavior"]["double_click"]
+        leftovers = [path.name for path in Path(config_dir).iterdir() if path.name != "wordbook.json"]
+
+    print(f"changes: {args.toggles}, median cost {statistics.median(samples):.3f}ms, max {max(samples):.3f}ms")
+    print(f"writes: {writes}, saved value: {saved}, leftover files: {leftovers or 'none'}")
+
+    expected = (args.toggles - 1) % 2 == 0
+    return 0 if writes == 1 and saved == expected and not leftovers else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Times the non-UI startup phases of Wordbook in a fresh interpreter.
+
+Run by benchmarks/run.py in a subprocess so that imports are measured cold.
+Prints a JSON object mapping each phase to its duration in milliseconds.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "subprojects" / "wn"))
+
+
+def main() -> int:
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    phases: dict[str, float] = {}
+
+    start = time.perf_counter()
+    import wn  # noqa: F401
+
+    phases["import_wn"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from wordbook import base
+
+    phases["import_base"] = time.perf_counter() - start
+
+    if data_dir:
+        base.wn.config.data_directory = data_dir
+
+    start = time.perf_counter()
+    wn_instance = base.get_wn_instance()
+    phases["wn_instance"] = time.perf_counter() - start
+    if wn_instance is None:
+        return 1
+
+    start = time.perf_counter()
+    wordlist = wn_instance.lemmas()
+    phases["wordlist_fetch"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    wordlist.sort(key=str.casefold)
+    phases["wordlist_sort"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    base.get_definition("word", wn_instance)
+    phases["first_lookup"] = time.perf_counter() - start
+
+    print(json.dumps({name: seconds * 1000 for name, seconds in phases.items()}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,7 +38,7 @@ def find_pypi_url(filename):
                 for file_info in version:
                     if file_info["filename"] == filename:
                         return file_info["url"]
-        except Exception:
+        except (OSError, ValueError):
             continue
 
     return None
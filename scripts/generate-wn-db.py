@@ -5,27 +5,40 @@
 """Generate compressed WordNet database for Wordbook."""
 
 import argparse
+import math
+import sqlite3
 import sys
 import tempfile
 import urllib.request
+from contextlib import closing
 from pathlib import Path
 
 project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "subprojects" / "wn"))
 
-import wn  # noqa: E402
-import wn.util  # noqa: E402
+import wn
+import wn.morphy
+import wn.util
+
+from wordbook.constants import WN_INDEX_FILENAME, WN_INDEX_VERSION
+from wordbook.linkify import MAX_PHRASE_WORDS, TOKEN_PATTERN, phrase_key
+from wordbook.phonetics import normalize_variety, phonetic_keys
+from wordbook.taxonomy import RELATIONS, pack_nodes
 
 if sys.version_info >= (3, 14):
     from compression import zstd
 else:
     try:
-        import backports.zstd as zstd
+        from backports import zstd
     except ImportError:
         sys.exit("Error: 'backports.zstd' is required for Python < 3.14\nInstall with: pip install backports.zstd")
 
 CHUNK_SIZE = 1024 * 1024
 
+# Lemma priors are PRIOR_SCALE * log2(1 + synsets + tagged occurrences), capped to fit in a byte.
+PRIOR_SCALE = 20
+
 WORDNET_URLS = [
     "https://github.com/globalwordnet/english-wordnet/releases/download/2025-edition/english-wordnet-2025-plus.xml.gz",
     "https://en-word.net/static/english-wordnet-2025-plus.xml.gz",
@@ -79,7 +92,7 @@ def download_wordnet_xml(output_path: Path) -> bool:
 
             print(f"✓ Downloaded to {output_path}")
             return True
-        except Exception as e:
+        except OSError as e:
             print(f"✗ Download failed: {e}")
 
     return False
@@ -93,11 +106,203 @@ def add_from_file(source_file: Path, data_dir: Path) -> bool:
         wn.add(source_file, progress_handler=ProgressHandler)
         print(f"✓ Added {source_file}")
         return True
-    except Exception as e:
+    except Exception as e:  # noqa: BLE001 - wn.add() passes on the errors of whichever loader reads the file
         print(f"✗ Failed to add source file: {e}")
         return False
 
 
+def build_gloss_index(connection: sqlite3.Connection, wordnet: wn.Wordnet) -> None:
+    """Index synset definitions and examples for reverse lookups."""
+    connection.execute("""
+        CREATE VIRTUAL TABLE wordbook_glosses USING fts5(
+            synset_id UNINDEXED,
+            lemmas UNINDEXED,
+            definition,
+            examples,
+            tokenize = 'porter unicode61 remove_diacritics 2'
+        )
+        """)
+    connection.executemany(
+        "INSERT INTO wordbook_glosses (synset_id, lemmas, definition, examples) VALUES (?, ?, ?, ?)",
+        (
+            (
+                synset.id,
+                "\t".join(lemma.replace("_", " ").strip() for lemma in synset.lemmas()),
+                synset.definition() or "",
+                "\n".join(synset.examples()),
+            )
+            for synset in wordnet.synsets()
+        ),
+    )
+    connection.execute("INSERT INTO wordbook_glosses (wordbook_glosses) VALUES ('optimize')")
+
+
+def build_phonetic_index(connection: sqlite3.Connection, wordnet: wn.Wordnet) -> None:
+    """
+    Index pronunciations by rhyme and by sound, once for every accent in the data.
+
+    Each accent gets the pronunciation Wordbook would show for it: the one of that
+    variety if there is one, otherwise the first.
+    """
+    forms = []
+    accents = set()
+    for word in wordnet.words():
+        pronunciations = word.lemma(data=True).pronunciations()
+        if pronunciations:
+            forms.append((word.lemma().replace("_", " ").strip(), pronunciations))
+            accents.update(normalize_variety(p.variety) for p in pronunciations if p.variety)
+
+    # Without any varieties, a single set of rows under "" serves every accent.
+    rows = set()
+    for accent in accents or {""}:
+        for lemma, pronunciations in forms:
+            ipa = next(
+                (p.value for p in pronunciations if normalize_variety(p.variety) == accent),
+                pronunciations[0].value,
+            )
+            rows.add((accent, lemma, ipa, *phonetic_keys(ipa)))
+
+    connection.execute("""
+        CREATE TABLE wordbook_phonetics (
+            accent TEXT NOT NULL,
+            lemma TEXT NOT NULL,
+            ipa TEXT NOT NULL,
+            rhyme_key TEXT NOT NULL,
+            sound_key TEXT NOT NULL
+        )
+        """)
+    connection.executemany("INSERT INTO wordbook_phonetics VALUES (?, ?, ?, ?, ?)", sorted(rows))
+    connection.execute("CREATE INDEX wordbook_phonetics_lemma ON wordbook_phonetics (lemma COLLATE NOCASE, accent)")
+    connection.execute("CREATE INDEX wordbook_phonetics_rhyme ON wordbook_phonetics (accent, rhyme_key)")
+    connection.execute("CREATE INDEX wordbook_phonetics_sound ON wordbook_phonetics (accent, sound_key)")
+
+
+def build_taxonomy_index(connection: sqlite3.Connection, wordnet: wn.Wordnet) -> None:
+    """Store the hypernym, hyponym, meronym and holonym graph as packed arrays of integer node IDs."""
+    synsets = wordnet.synsets()
+    nodes = {synset.id: node for node, synset in enumerate(synsets)}
+
+    columns = ", ".join(f"{column} BLOB NOT NULL" for column in RELATIONS)
+    connection.execute(f"""
+        CREATE TABLE wordbook_taxonomy (
+            node INTEGER PRIMARY KEY,
+            synset_id TEXT NOT NULL UNIQUE,
+            lemmas TEXT NOT NULL,
+            definition TEXT NOT NULL,
+            {columns}
+        )
+        """)
+
+    rows = []
+    for synset in synsets:
+        relations = synset.relations()
+        adjacency = [
+            pack_nodes(sorted({nodes[target.id] for name in names for target in relations.get(name, [])}))
+            for names in RELATIONS.values()
+        ]
+        lemmas = "\t".join(lemma.replace("_", " ").strip() for lemma in synset.lemmas())
+        rows.append((nodes[synset.id], synset.id, lemmas, synset.definition() or "", *adjacency))
+
+    placeholders = ", ".join("?" * (4 + len(RELATIONS)))
+    connection.executemany(f"INSERT INTO wordbook_taxonomy VALUES ({placeholders})", rows)
+
+
+def build_token_index(connection: sqlite3.Connection, wordnet: wn.Wordnet) -> None:
+    """
+    Map words and multi-word expressions to the lemmas they look up, for linking glosses.
+
+    Every lemma and lemma variant maps to its lemma. Words used in definitions
+    and examples that aren't lemmas themselves, such as "running", map to the
+    lemma Morphy reduces them to, so the app never has to lemmatize.
+    """
+    token_lemmas: dict[str, str] = {}
+    words = sorted(wordnet.words(), key=lambda word: (word.lemma() != word.lemma().casefold(), word.lemma()))
+    # Lemmas first, so that a variant spelled like another lemma doesn't take its key.
+    for word in words:
+        lemma = word.lemma().replace("_", " ").strip()
+        if key := phrase_key(lemma):
+            token_lemmas.setdefault(key, lemma)
+    for word in words:
+        lemma = word.lemma().replace("_", " ").strip()
+        for form in word.forms():
+            if key := phrase_key(form.replace("_", " ")):
+                token_lemmas.setdefault(key, lemma)
+
+    morphy = wn.morphy.Morphy(wordnet)
+    gloss_tokens = set()
+    for synset in wordnet.synsets():
+        for text in (synset.definition() or "", *synset.examples()):
+            gloss_tokens.update(token.casefold() for token in TOKEN_PATTERN.findall(text))
+    for token in sorted(gloss_tokens - token_lemmas.keys()):
+        candidates = [
+            phrase_key(form) for pos in ("n", "v", "a", "r") for form in sorted(morphy(token, pos).get(pos, ()))
+        ]
+        if lemma := next((token_lemmas[key] for key in candidates if key in token_lemmas), None):
+            token_lemmas[token] = lemma
+
+    connection.execute("CREATE TABLE wordbook_tokens (token TEXT PRIMARY KEY, lemma TEXT NOT NULL) WITHOUT ROWID")
+    connection.executemany(
+        "INSERT INTO wordbook_tokens VALUES (?, ?)",
+        sorted((key, lemma) for key, lemma in token_lemmas.items() if key.count(" ") < MAX_PHRASE_WORDS),
+    )
+
+
+def build_lemma_priors(connection: sqlite3.Connection, wordnet: wn.Wordnet) -> None:
+    """
+    Store the lemma list with a prior for every lemma, a guess at how commonly it is used.
+
+    The prior grows with the number of synsets of the lemma and with how often
+    its senses were tagged in a corpus, for lexicons that include sense counts.
+    Both are stored as a single row, the lemmas sorted case-insensitively and
+    joined by newlines, and the priors as one byte per lemma in the same order,
+    so that the app can load them without a query per lemma.
+    """
+    weights: dict[str, int] = {}
+    for word in wordnet.words():
+        lemma = word.lemma()
+        weight = 0
+        for sense in word.senses():
+            weight += 1 + sum(int(getattr(count, "value", count)) for count in sense.counts())
+        weights[lemma] = weights.get(lemma, 0) + weight
+
+    lemmas = sorted(weights, key=lambda lemma: (lemma.casefold(), lemma))
+    priors = bytes(min(255, round(PRIOR_SCALE * math.log2(1 + weights[lemma]))) for lemma in lemmas)
+
+    connection.execute("CREATE TABLE wordbook_lemmas (lemmas TEXT NOT NULL, priors BLOB NOT NULL)")
+    connection.execute("INSERT INTO wordbook_lemmas VALUES (?, ?)", ("\n".join(lemmas), priors))
+
+
+def build_search_indexes(index_path: Path) -> bool:
+    """
+    Build Wordbook's own search indexes into a database of their own.
+
+    They are kept out of the WordNet database because wn refuses to open one
+    whose schema has tables it doesn't know.
+    """
+    try:
+        print("Building search indexes...")
+        wordnet = wn.Wordnet()
+        index_path.unlink(missing_ok=True)
+        with closing(sqlite3.connect(index_path)) as connection:
+            with connection:
+                build_gloss_index(connection, wordnet)
+                build_phonetic_index(connection, wordnet)
+                build_taxonomy_index(connection, wordnet)
+                build_token_index(connection, wordnet)
+                build_lemma_priors(connection, wordnet)
+                connection.execute("CREATE TABLE wordbook_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+                connection.execute(
+                    "INSERT INTO wordbook_meta (key, value) VALUES ('index_version', ?)", (str(WN_INDEX_VERSION),)
+                )
+            connection.execute("VACUUM")
+
+        print(f"✓ Built search indexes (version {WN_INDEX_VERSION})")
+        return True
+    except (OSError, sqlite3.Error, wn.Error) as e:
+        print(f"✗ Building search indexes failed: {e}")
+        return False
+
+
 def compress_database(db_path: Path, output_path: Path, level: int = 15) -> bool:
     """Compress database with zstd."""
     try:
@@ -114,7 +319,7 @@ def compress_database(db_path: Path, output_path: Path, level: int = 15) -> bool
         print(f"✓ Compressed to {compressed_mb:.1f} MB ({ratio:.0f}% saved)")
         return True
 
-    except Exception as e:
+    except (OSError, zstd.ZstdError) as e:
         print(f"✗ Compression failed: {e}")
         return False
 
@@ -133,14 +338,23 @@ def main():
         "--source-file", type=Path, help="Path to local lexicon file (XML/GZ). If not provided, downloads from GitHub."
     )
     parser.add_argument("--output", type=Path, help="Output path for the compressed database")
+    parser.add_argument(
+        "--index-output",
+        type=Path,
+        help="Output path for the compressed search indexes (default: next to the database, named after it)",
+    )
 
     args = parser.parse_args()
     output_path = args.output or project_root / "data" / "wn.db.zst"
+    index_output_path = args.index_output or output_path.with_name(
+        output_path.name.replace("wn", Path(WN_INDEX_FILENAME).stem, 1)
+    )
     source_label = args.source_file or f"{WORDNET_URLS[0]} (+ {len(WORDNET_URLS) - 1} fallback)"
 
     print("─" * 20 + " Wordbook Database Generator " + "─" * 20)
     print(f"Source:      {source_label}")
     print(f"Output:      {output_path}")
+    print(f"Indexes:     {index_output_path}")
     print(f"Compression: Level {args.compression_level}")
     print()
 
@@ -160,12 +374,20 @@ def main():
             print(f"✗ wn.db not found in {temp_dir}")
             return 1
 
+        index_path = db_path.with_name(WN_INDEX_FILENAME)
+        if not build_search_indexes(index_path):
+            return 1
+
         if not compress_database(db_path, output_path, args.compression_level):
             return 1
 
+        if not compress_database(index_path, index_output_path, args.compression_level):
+            return 1
+
         print()
         print("─" * 25 + " Success " + "─" * 25)
         print(f"Generated: {output_path}")
+        print(f"           {index_output_path}")
 
     return 0
 
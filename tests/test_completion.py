@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Checks that the completion engine ranks lemmas the way the window used to."""
+
+import bisect
+import random
+import sys
+
+import pytest
+
+from wordbook.completion import CompletionEngine, CompletionSession, np
+
+BACKENDS = ["python"] + (["numpy"] if np is not None else [])
+
+WORDLIST = [
+    "set",
+    "Set",
+    "SET",
+    "set up",
+    "set-up",
+    "setup",
+    "settle",
+    "settle down",
+    "settlement",
+    "set off",
+    "set on",
+    "setter",
+    "Seth",
+    "S.E.T.",
+    "a priori",
+    "A",
+    "a",
+    "a.m.",
+    "ad hoc",
+    "ad-hoc",
+    "Ad Hoc",
+    "hot dog",
+    "hotdog",
+    "hot",
+    "New York",
+    "new",
+    "newt",
+    "Ångström",
+    "ångström unit",
+    "straße",
+    "Strasse",
+    "café",
+    "Café au lait",
+    "zoology",
+    "zoo",
+]
+
+
+def legacy_completion_items(wordlist: list[str], text: str, limit: int) -> list[str]:
+    """The ranking that used to live in WordbookWindow._get_completion_items."""
+    if limit <= 0 or not text.strip() or not wordlist:
+        return []
+
+    typed_prefix = text.lstrip()
+    search_term = typed_prefix.casefold()
+    prefix_len = len(typed_prefix)
+    start_idx = bisect.bisect_left(wordlist, search_term, key=str.casefold)
+    end_idx = bisect.bisect_right(wordlist, f"{search_term}{chr(sys.maxunicode)}", key=str.casefold)
+    ranked_matches: list[tuple] = []
+    seen_lower: dict[str, tuple] = {}
+
+    for original_word in wordlist[start_idx:end_idx]:
+        display_lower = original_word.casefold()
+        prev = seen_lower.get(display_lower)
+        if prev is not None:
+            prev_rank, prev_word = prev
+            if prev_word[:prefix_len] != typed_prefix and original_word[:prefix_len] == typed_prefix:
+                old_idx = bisect.bisect_left(ranked_matches, (prev_rank, prev_word))
+                if old_idx < len(ranked_matches) and ranked_matches[old_idx] == (prev_rank, prev_word):
+                    ranked_matches[old_idx] = (prev_rank, original_word)
+                seen_lower[display_lower] = (prev_rank, original_word)
+            continue
+        suffix = display_lower[len(search_term) :]
+        rank = (
+            sum(char == " " for char in suffix),
+            sum(not char.isalnum() for char in suffix),
+            len(suffix),
+            display_lower,
+        )
+        seen_lower[display_lower] = (rank, original_word)
+        bisect.insort(ranked_matches, (rank, original_word))
+        if len(ranked_matches) > limit:
+            evicted = ranked_matches.pop()
+            seen_lower.pop(evicted[1].casefold(), None)
+
+    return [word for _rank, word in ranked_matches]
+
+
+def _random_wordlist(size: int) -> list[str]:
+    rng = random.Random(0)
+    alphabet = "aAbBeE -.'é"
+    words = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))).strip() for _ in range(size)}
+    return sorted((word for word in words if word), key=str.casefold)
+
+
+def _prefixes(wordlist: list[str]) -> list[str]:
+    prefixes = {word[:length] for word in wordlist for length in range(1, len(word) + 1)}
+    return sorted(prefixes | {" set", "SE", "sEt", "x", "Ångs", "ANG", "hot d", "ad-"})
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("limit", [1, 3, 10])
+def test_engine_matches_legacy(backend: str, limit: int) -> None:
+    wordlist = sorted(WORDLIST, key=str.casefold)
+    engine = CompletionEngine(wordlist, backend=backend)
+    for prefix in _prefixes(wordlist):
+        assert engine.complete(prefix, limit) == legacy_completion_items(wordlist, prefix, limit), prefix
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_engine_matches_legacy_on_random_lemmas(backend: str) -> None:
+    wordlist = _random_wordlist(2000)
+    engine = CompletionEngine(wordlist, backend=backend)
+    for prefix in _prefixes(wordlist):
+        assert engine.complete(prefix, 10) == legacy_completion_items(wordlist, prefix, 10), prefix
+
+
+def test_engine_sorts_the_wordlist() -> None:
+    wordlist = sorted(WORDLIST, key=str.casefold)
+    shuffled = list(wordlist)
+    random.Random(0).shuffle(shuffled)
+    engine = CompletionEngine(shuffled, backend="python")
+    assert engine.complete("se", 10) == legacy_completion_items(wordlist, "se", 10)
+
+
+@pytest.mark.parametrize("text", ["", "   ", "zzz"])
+def test_engine_without_completions(text: str) -> None:
+    assert CompletionEngine(WORDLIST, backend="python").complete(text, 10) == []
+    assert CompletionEngine(WORDLIST, backend="python").complete("se", 0) == []
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_session_matches_legacy_while_typing(backend: str) -> None:
+    wordlist = _random_wordlist(2000)
+    engine = CompletionEngine(wordlist, backend=backend)
+    session = CompletionSession(engine)
+    rng = random.Random(1)
+    text = ""
+    for _ in range(2000):
+        # Mostly typing, with some deleting, pasting and clearing, the way a search entry is edited.
+        action = rng.random()
+        if action < 0.6:
+            text += rng.choice("aAbBeE -.'é")
+        elif action < 0.8:
+            text = text[:-1]
+        elif action < 0.95:
+            text = rng.choice(wordlist)[: rng.randint(1, 4)]
+        else:
+            text = ""
+        assert session.complete(text, 10) == legacy_completion_items(wordlist, text, 10), text
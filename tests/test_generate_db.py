@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Checks that the database generator leaves a WordNet database that wn can still open."""
+
+import importlib.util
+import math
+import sqlite3
+import subprocess
+import sys
+from collections.abc import Iterator
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+import wn
+
+from wordbook.constants import WN_INDEX_FILENAME, WN_INDEX_VERSION
+from wordbook.phonetics import phonetic_keys
+from wordbook.taxonomy import unpack_nodes
+
+LEXICON = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE LexicalResource SYSTEM "http://globalwordnet.github.io/schemas/WN-LMF-1.1.dtd">
+<LexicalResource xmlns:dc="https://globalwordnet.github.io/schemas/dc/">
+  <Lexicon id="test" label="Test" language="en" email="test@example.com"
+           license="https://creativecommons.org/licenses/by/4.0/" version="1">
+    <LexicalEntry id="test-cat-n">
+      <Lemma writtenForm="cat" partOfSpeech="n">
+        <Pronunciation variety="GB">ˈkæt</Pronunciation>
+      </Lemma>
+      <Sense id="test-cat-n-1" synset="test-1-n"/>
+    </LexicalEntry>
+    <LexicalEntry id="test-animal-n">
+      <Lemma writtenForm="animal" partOfSpeech="n"/>
+      <Sense id="test-animal-n-1" synset="test-2-n"/>
+    </LexicalEntry>
+    <Synset id="test-1-n" ili="" partOfSpeech="n">
+      <Definition>a small domesticated animal</Definition>
+      <SynsetRelation relType="hypernym" target="test-2-n"/>
+      <Example>the cat sat on the mat</Example>
+    </Synset>
+    <Synset id="test-2-n" ili="" partOfSpeech="n">
+      <Definition>a living organism</Definition>
+      <SynsetRelation relType="hyponym" target="test-1-n"/>
+    </Synset>
+  </Lexicon>
+</LexicalResource>
+"""
+
+
+@pytest.fixture(scope="module")
+def generate_wn_db():
+    path = Path(__file__).resolve().parent.parent / "scripts" / "generate-wn-db.py"
+    spec = importlib.util.spec_from_file_location("generate_wn_db", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def data_dir(generate_wn_db, tmp_path: Path) -> Iterator[Path]:
+    # Read through database_path, as reading data_directory creates the directory.
+    previous_data_dir = wn.config.database_path.parent
+    source = tmp_path / "lexicon.xml"
+    source.write_text(LEXICON, encoding="utf-8")
+    data_dir = tmp_path / "data"
+    try:
+        assert generate_wn_db.add_from_file(source, data_dir)
+        assert generate_wn_db.build_search_indexes(data_dir / WN_INDEX_FILENAME)
+        yield data_dir
+    finally:
+        wn.config.data_directory = previous_data_dir
+
+
+def _tables(db_path: Path) -> set[str]:
+    with closing(sqlite3.connect(db_path)) as connection:
+        return {name for (name,) in connection.execute("SELECT name FROM sqlite_schema WHERE type = 'table'")}
+
+
+def test_wordnet_opens_generated_database(data_dir: Path) -> None:
+    # In a new process, as wn only checks the schema of a database when it first connects to it.
+    code = "import sys, wn; wn.config.data_directory = sys.argv[1]; print(wn.Wordnet(lexicon='test:1').synsets('cat'))"
+    result = subprocess.run(
+        [sys.executable, "-c", code, str(data_dir)], capture_output=True, text=True, check=False, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert "test-1-n" in result.stdout
+
+
+def test_search_indexes_are_kept_out_of_wordnet_database(data_dir: Path) -> None:
+    assert not {table for table in _tables(data_dir / "wn.db") if table.startswith("wordbook_")}
+    assert {"wordbook_glosses", "wordbook_meta"} <= _tables(data_dir / WN_INDEX_FILENAME)
+
+
+def test_search_indexes_are_versioned(data_dir: Path) -> None:
+    with closing(sqlite3.connect(data_dir / WN_INDEX_FILENAME)) as connection:
+        (version,) = connection.execute("SELECT value FROM wordbook_meta WHERE key = 'index_version'").fetchone()
+    assert int(version) == WN_INDEX_VERSION
+
+
+def _rows(data_dir: Path, sql: str) -> list[tuple]:
+    with closing(sqlite3.connect(data_dir / WN_INDEX_FILENAME)) as connection:
+        return connection.execute(sql).fetchall()
+
+
+def test_phonetic_index(data_dir: Path) -> None:
+    assert _rows(data_dir, "SELECT accent, lemma, ipa, rhyme_key, sound_key FROM wordbook_phonetics") == [
+        ("gb", "cat", "ˈkæt", *phonetic_keys("ˈkæt"))
+    ]
+
+
+def test_taxonomy_index(data_dir: Path) -> None:
+    rows = _rows(data_dir, "SELECT node, synset_id, lemmas, hypernyms, hyponyms FROM wordbook_taxonomy ORDER BY node")
+    nodes = {synset_id: node for node, synset_id, *_rest in rows}
+    assert [(synset_id, lemmas) for _node, synset_id, lemmas, *_rest in rows] == [
+        ("test-1-n", "cat"),
+        ("test-2-n", "animal"),
+    ]
+    assert list(unpack_nodes(rows[0][3])) == [nodes["test-2-n"]]
+    assert list(unpack_nodes(rows[1][4])) == [nodes["test-1-n"]]
+
+
+def test_token_index(data_dir: Path) -> None:
+    tokens = dict(_rows(data_dir, "SELECT token, lemma FROM wordbook_tokens"))
+    assert tokens["cat"] == "cat"
+    assert tokens["animal"] == "animal"
+
+
+def test_lemma_priors(data_dir: Path, generate_wn_db) -> None:
+    [(lemmas, priors)] = _rows(data_dir, "SELECT lemmas, priors FROM wordbook_lemmas")
+    assert lemmas.split("\n") == ["animal", "cat"]
+    # Both lemmas have a single synset and no sense counts.
+    assert list(priors) == [round(generate_wn_db.PRIOR_SCALE * math.log2(2))] * 2
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Checks that IPA is transliterated for espeak-ng the way the chain of str.replace() calls did."""
+
+import random
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from wordbook import base
+
+LEGACY_MAPPING = {
+    "ˈ": "'",
+    "ˌ": ",",
+    "ː": ":",
+    ".": "",
+    "‿": "",
+    "|": "",
+    "‖": "",
+    "tʃ": "tS",
+    "dʒ": "dZ",
+    "eɪ": "eI",
+    "aɪ": "aI",
+    "ɔɪ": "OI",
+    "aʊ": "aU",
+    "oʊ": "oU",
+    "əʊ": "@U",
+    "ɪə": "I@",
+    "eə": "e@",
+    "ɛə": "e@",
+    "ʊə": "U@",
+    "iː": "i:",
+    "ɑː": "A:",
+    "ɔː": "O:",
+    "uː": "u:",
+    "ɜː": "3:",
+    "ɚ": "@r",
+    "ɝ": "3r",
+    "ɪ": "I",
+    "ɛ": "E",
+    "e": "e",
+    "æ": "a",
+    "ɑ": "A",
+    "ɒ": "0",
+    "ɔ": "O",
+    "ʊ": "U",
+    "ʌ": "V",
+    "ɜ": "3",
+    "ə": "@",
+    "ɐ": "@",
+    "a": "a",
+    "θ": "T",
+    "ð": "D",
+    "ʃ": "S",
+    "ʒ": "Z",
+    "ŋ": "N",
+    "ɹ": "r",
+    "ɾ": "4",
+    "ɫ": "l",
+    "ʔ": "?",
+    "ʍ": "W",
+    "x": "x",
+    "ç": "C",
+}
+
+PRONUNCIATIONS = [
+    "/ˈkæt/",
+    "[ˈdɒɡ]",
+    "ˌɪntəˈnæʃənəl",
+    "ˈtʃɜːtʃ",
+    "ˈdʒʌdʒ",
+    "fəˈnɛtɪks",
+    "ˈhɛəʊ",
+    "ˈweðɚ",
+    "ˈbɝd",
+    "ˈθɪŋk",
+    "ˈʍɛn",
+    "ˈbʌʔn̩",
+    "ˈlɪtl̩",
+    "ˈbɑːθ",
+    "ɡʊd",
+    "  /ˌkɒmjʊnɪˈkeɪʃən/  ",
+    "ˈmʊə",
+    "ˈaɪ‿æm",
+    "lɔx",
+    "ɪç",
+    "",
+]
+
+
+def legacy_ipa_to_espeak(ipa_string: str) -> str:
+    """The transliterator used before the compiled pattern."""
+    s = ipa_string.strip().strip("/[]")
+    for ipa_sym, esp_sym in sorted(LEGACY_MAPPING.items(), key=lambda x: len(x[0]), reverse=True):
+        s = s.replace(ipa_sym, esp_sym)
+    s = "".join(c for c in s if ord(c) < 128)
+    return f"[[{s}]]"
+
+
+@pytest.mark.parametrize("ipa", PRONUNCIATIONS)
+def test_transliteration_matches_legacy(ipa: str) -> None:
+    assert base.ipa_to_espeak(ipa) == legacy_ipa_to_espeak(ipa)
+
+
+def test_transliteration_matches_legacy_on_random_ipa() -> None:
+    # Symbols of a single character, plus some that espeak-ng doesn't know and ASCII kept as is.
+    symbols = [symbol for symbol in LEGACY_MAPPING if len(symbol) == 1] + ["ɡ", "n̩", "b", "k", "s", "ʰ"]
+    rng = random.Random(0)
+    for _ in range(5000):
+        ipa = "".join(rng.choice(symbols) for _ in range(rng.randint(1, 12)))
+        assert base.ipa_to_espeak(ipa) == legacy_ipa_to_espeak(ipa), ipa
+
+
+def test_transliteration_matches_legacy_on_database() -> None:
+    db_path = Path(base.WN_DIR) / "wn.db"
+    if not db_path.is_file():
+        pytest.skip(f"No extracted database at {db_path}")
+
+    with closing(sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)) as connection:
+        rows = connection.execute("SELECT DISTINCT value FROM pronunciations WHERE value IS NOT NULL")
+        pronunciations = [value for (value,) in rows]
+    assert pronunciations
+    mismatches = [ipa for ipa in pronunciations if base.ipa_to_espeak(ipa) != legacy_ipa_to_espeak(ipa)]
+    assert not mismatches, mismatches[:20]
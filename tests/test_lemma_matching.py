@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Checks that lemmas are matched to a searched term the way the difflib-based matcher did."""
+
+import difflib
+import random
+
+import pytest
+
+from wordbook import base
+
+LEMMAS = [
+    "color",
+    "colour",
+    "Color",
+    "collar",
+    "cooler",
+    "colon",
+    "dolor",
+    "set_up",
+    "setup",
+    "set-up",
+    "New_York",
+    "new_york",
+    "ad_hoc",
+    "a",
+    "an",
+    "ab",
+]
+
+TERMS = ["color", "colur", "Colour", "coler", "set up", "setup ", "new york", "adhoc", "x", "", "aa", "COLLAR"]
+
+
+def legacy_find_best_lemma_match(term: str, lemmas: list[str]) -> str:
+    """The matcher used before the synset lemma index."""
+    normalized_term = term.lower().strip()
+
+    for lemma in lemmas:
+        if base._normalize_lemma(lemma).lower() == normalized_term:
+            return base._normalize_lemma(lemma)
+
+    diff_match = difflib.get_close_matches(term, lemmas, n=1, cutoff=0.8)
+    if diff_match:
+        return base._normalize_lemma(diff_match[0])
+
+    return base._normalize_lemma(lemmas[0]) if lemmas else ""
+
+
+def _synset_data(lemmas: list[str]) -> base.SynsetData:
+    normalized_lemmas = tuple(base._normalize_lemma(lemma) for lemma in lemmas)
+    return base.SynsetData(
+        pos="n",
+        lemmas=tuple(lemmas),
+        normalized_lemmas=normalized_lemmas,
+        lowered_lemmas=tuple(lemma.lower() for lemma in normalized_lemmas),
+        definition="",
+        examples=(),
+        antonyms=(),
+        similar=(),
+        also_sees=(),
+        pronunciations=(),
+    )
+
+
+def _random_words(rng: random.Random, count: int) -> list[str]:
+    # A small alphabet, so that many words are close to each other and scores tie.
+    return ["".join(rng.choice("abco_") for _ in range(rng.randint(1, 7))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("cutoff", [0.6, 0.8, 0.9])
+def test_closest_lemma_matches_difflib(cutoff: float) -> None:
+    rng = random.Random(0)
+    for _ in range(2000):
+        lemmas = tuple(_random_words(rng, rng.randint(0, 8)))
+        term = _random_words(rng, 1)[0]
+        expected = difflib.get_close_matches(term, lemmas, n=1, cutoff=cutoff)
+        assert base._closest_lemma(term, lemmas, cutoff) == (expected[0] if expected else None), (term, lemmas)
+
+
+@pytest.mark.parametrize("term", TERMS)
+def test_closest_lemma_matches_difflib_on_lemmas(term: str) -> None:
+    expected = difflib.get_close_matches(term, LEMMAS, n=1, cutoff=0.8)
+    assert base._closest_lemma(term, tuple(LEMMAS)) == (expected[0] if expected else None)
+
+
+def test_best_lemma_match_matches_legacy() -> None:
+    rng = random.Random(1)
+    for _ in range(2000):
+        lemmas = rng.sample(LEMMAS, rng.randint(1, 5))
+        term = rng.choice(TERMS + _random_words(rng, 3))
+        data = _synset_data(lemmas)
+        actual = base._find_best_lemma_match(term, term.lower().strip(), data)
+        assert actual == legacy_find_best_lemma_match(term, lemmas), (term, lemmas)
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Checks that pronunciations from the WordNet data and from espeak-ng get the same phonetic keys."""
+
+import pytest
+
+from wordbook.phonetics import phonetic_keys
+
+# The same pronunciation, as stored in the WordNet data and as printed by espeak-ng --ipa=3.
+PRONUNCIATIONS = [
+    ("/ˈkæt/", "k_ˈæ_t"),
+    ("ˈkæt", "k_ˈæ_t\n"),
+    ("/ˈrɛd/", "ɹ_ˈɛ_d"),
+    ("[ɡʊd]", "g_ˈʊ_d"),
+    ("ˈbɑːθ", "b_ˈɑː_θ"),
+    ("ˈbɑ:θ", "b_ˈɑː_θ"),
+    ("'wɔːtə", "w_ˈɔː_t_ɐ"),
+    ("ˈbʌtn̩", "b_ˈʌ_t_n"),
+    ("ˈaɪs ˌkɹiːm", "ˈaɪ_s k_ɹ_ˌiː_m"),
+    ("ˈɹoʊzᵻz", "ɹ_ˈoʊ_z_ɪ_z"),
+]
+
+
+@pytest.mark.parametrize(("stored", "espeak"), PRONUNCIATIONS)
+def test_stored_and_espeak_keys_agree(stored: str, espeak: str) -> None:
+    assert phonetic_keys(stored) == phonetic_keys(espeak)
+
+
+def test_keys() -> None:
+    assert phonetic_keys("/ˈkæt/") == ("æt", "kæt")
+    assert phonetic_keys("ˌɪntəˈnæʃənəl") == ("æʃənəl", "ɪntənæʃənəl")
+    assert phonetic_keys("ˈaɪs ˌkɹiːm") == ("aɪskɹiːm", "aɪskɹiːm")
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Checks that settings changes are written to disk once, atomically, and flushed on shutdown.
+
+Changes go through the Settings setters the preferences window calls. The save
+delay is long enough that only flush() writes them, so no test waits on a timer.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from wordbook import utils
+from wordbook.settings import Settings
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(utils, "CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(utils, "CONFIG_FILE", str(tmp_path / "wordbook.json"))
+    monkeypatch.setattr(Settings, "_instance", None)
+    monkeypatch.setattr(Settings, "SAVE_DELAY", 3600)
+    return tmp_path
+
+
+def _saved(config_dir: Path) -> dict:
+    with open(config_dir / "wordbook.json") as f:
+        return json.load(f)
+
+
+def _leftovers(config_dir: Path) -> list[str]:
+    return [path.name for path in config_dir.iterdir() if path.name != "wordbook.json"]
+
+
+def test_changes_are_coalesced(config_dir: Path) -> None:
+    settings = Settings.get()
+    settings.flush()
+    writes = settings._writer.writes
+
+    for index in range(51):
+        settings.double_click = index % 2 == 0
+    assert settings._writer.writes == writes
+    settings.flush()
+
+    assert settings._writer.writes - writes == 1
+    assert _saved(config_dir)["behavior"]["double_click"] is True
+    assert _leftovers(config_dir) == []
+
+
+def test_flush_writes_pending_changes(config_dir: Path) -> None:
+    settings = Settings.get()
+    settings.flush()
+    writes = settings._writer.writes
+
+    settings.live_search = False
+    settings.gtk_dark_ui = True
+    settings.flush()
+
+    assert settings._writer.writes - writes == 1
+    saved = _saved(config_dir)
+    assert saved["behavior"]["live_search"] is False
+    assert saved["appearance"]["force_dark_mode"] is True
+    assert _leftovers(config_dir) == []
+
+
+def test_flush_without_changes_does_not_write(config_dir: Path) -> None:
+    settings = Settings.get()
+    settings.flush()
+    writes = settings._writer.writes
+
+    settings.flush()
+
+    assert settings._writer.writes == writes
+
+
+def test_settings_are_loaded_back(config_dir: Path) -> None:
+    settings = Settings.get()
+    settings.double_click = True
+    settings.flush()
+
+    Settings._instance = None
+    assert Settings.get().double_click is True
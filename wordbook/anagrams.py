@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Anagram search over the WordNet lemma list, independent of GTK.
+
+Every lemma is keyed by its signature: its letters, casefolded and sorted,
+ignoring spaces, hyphens and other non-letters. Lemmas that are anagrams of
+each other share a signature, so exact anagrams are a single lookup.
+
+Words that can be formed from a set of letters are the lemmas whose
+signature is a sub-multiset of the letters. For up to a few thousand
+sub-multisets those are enumerated and looked up directly; for longer
+inputs the signatures are scanned instead.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import Counter
+
+from wordbook import utils
+
+# Above this many sub-multisets, scanning every signature is cheaper than enumerating them.
+_MAX_ENUMERATED_SUBSETS = 1 << 14
+
+
+def letter_signature(text: str) -> str:
+    """Returns the sorted, casefolded letters of text."""
+    return "".join(sorted(char for char in text.casefold() if char.isalpha()))
+
+
+class AnagramIndex:
+    """Index of lemmas by letter signature. Built on the first search."""
+
+    def __init__(self, wordlist: list[str]):
+        """
+        Args:
+            wordlist: The lemma list, sorted case-insensitively like CompletionEngine.wordlist.
+        """
+        self._wordlist = wordlist
+        self._signatures: dict[str, list[str]] = {}
+        self._built = False
+        self._build_lock = threading.Lock()
+
+    def _ensure_built(self) -> None:
+        with self._build_lock:
+            if self._built:
+                return
+
+            signatures: dict[str, list[str]] = {}
+            seen: set[str] = set()
+            for word in self._wordlist:
+                folded = word.casefold()
+                # Lemmas that only differ in case are listed once.
+                if folded in seen:
+                    continue
+                seen.add(folded)
+                if signature := letter_signature(word):
+                    signatures.setdefault(signature, []).append(word)
+
+            self._signatures = signatures
+            self._built = True
+            utils.log_info(f"Anagram index built ({len(signatures)} signatures).")
+
+    def anagrams(self, letters: str) -> list[str]:
+        """
+        Finds the lemmas made of exactly the given letters, in alphabetical order.
+
+        The input itself is not included.
+        """
+        self._ensure_built()
+        signature = letter_signature(letters)
+        if not signature:
+            return []
+
+        folded = letters.casefold()
+        return [word for word in self._signatures.get(signature, []) if word.casefold() != folded]
+
+    def formable(self, letters: str, min_length: int = 2) -> list[str]:
+        """
+        Finds the lemmas that can be spelled with some of the given letters, each used at most once.
+
+        Args:
+            letters: The available letters. Non-letters are ignored.
+            min_length: Minimum number of letters in a result.
+
+        Returns:
+            The lemmas, longest first, then alphabetically.
+        """
+        self._ensure_built()
+        counts = Counter(letter_signature(letters))
+        if not counts:
+            return []
+
+        subset_count = 1
+        for count in counts.values():
+            subset_count *= count + 1
+
+        if subset_count <= _MAX_ENUMERATED_SUBSETS:
+            found_signatures = self._enumerate_subsets(counts, min_length)
+        else:
+            found_signatures = self._scan_subsets(counts, min_length)
+
+        results = [(len(signature), word) for signature in found_signatures for word in self._signatures[signature]]
+        results.sort(key=lambda result: (-result[0], result[1].casefold()))
+        return [word for _length, word in results]
+
+    def _enumerate_subsets(self, counts: Counter[str], min_length: int) -> list[str]:
+        letters = sorted(counts)
+        found = []
+        for repeats in itertools.product(*(range(counts[letter] + 1) for letter in letters)):
+            if sum(repeats) < min_length:
+                continue
+            signature = "".join(letter * repeat for letter, repeat in zip(letters, repeats, strict=True))
+            if signature in self._signatures:
+                found.append(signature)
+        return found
+
+    def _scan_subsets(self, counts: Counter[str], min_length: int) -> list[str]:
+        total = counts.total()
+        found = []
+        for signature in self._signatures:
+            if not min_length <= len(signature) <= total:
+                continue
+            if not set(signature) <= counts.keys():
+                continue
+            if Counter(signature) <= counts:
+                found.append(signature)
+        return found
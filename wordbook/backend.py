@@ -0,0 +1,430 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Asynchronous access to wordbook.base for the user interface.
+
+Every operation follows GIO's convention: foo_async() takes a Gio.Cancellable
+and a callback, the callback is called on the main context the operation was
+started from, and passes its Gio.AsyncResult to foo_finish() for the value.
+The finish method of a cancelled operation raises the G_IO_ERROR_CANCELLED
+GLib.Error, and that of a failed one G_IO_ERROR_FAILED, which is_cancelled()
+tells apart.
+
+The work itself runs on a bounded, priority-aware WorkerPool rather than through
+Gio.Task.run_in_thread(), so that the search the user is waiting for starts
+before queued prefetching does.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from gi.repository import Gio, GLib, GObject
+
+from wordbook import base, utils
+from wordbook.anagrams import AnagramIndex
+from wordbook.completion import CompletionEngine, CompletionSession, PersonalRanking
+from wordbook.database import DatabaseManager
+from wordbook.history import HistoryEntry, HistoryOrder, HistoryStore
+from wordbook.pattern_search import PatternIndex
+from wordbook.scheduler import Priority, QueueStats, WorkerPool
+
+MAX_WORKERS = 4
+
+# Number of matches returned at once for searches that list lemmas.
+MATCHES_PAGE_SIZE = 200
+
+# Seconds between the batches of glossary entries handed to the main context.
+GLOSSARY_BATCH_INTERVAL = 0.05
+
+# Most frecent history terms, and most frecent favorites, that completions are personalized with.
+PERSONAL_HISTORY_SIZE = 5000
+
+_GLIB_PRIORITIES = {
+    Priority.FOREGROUND: GLib.PRIORITY_DEFAULT,
+    Priority.NORMAL: GLib.PRIORITY_DEFAULT,
+    Priority.IDLE: GLib.PRIORITY_LOW,
+}
+
+AsyncReadyCallback = Callable[["Backend", Gio.AsyncResult], None]
+MatchList = list[tuple[tuple[str, ...], str | None]]
+
+
+def is_cancelled(error: GLib.Error) -> bool:
+    """Returns whether an error raised by a finish method means the operation was cancelled, rather than failed."""
+    return error.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED)
+
+
+class Backend(GObject.Object):
+    """The WordNet data and lookups used by a window, available without blocking the main thread."""
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        super().__init__()
+        self._pool = WorkerPool(max_workers, "backend")
+        # The task of every job in the pool, so that the tasks of jobs dropped at shutdown can be completed.
+        self._tasks: weakref.WeakKeyDictionary[Callable[[], None], Gio.Task] = weakref.WeakKeyDictionary()
+        self.wn_instance: base.wn.Wordnet | None = None
+        self.wordlist: list[str] = []
+        # How common each lemma of the wordlist is, if the search indexes have lemma priors.
+        self.lemma_priors: bytes | None = None
+        self.completion_engine: CompletionEngine | None = None
+        self.pattern_index: PatternIndex | None = None
+        self.anagram_index: AnagramIndex | None = None
+        # A session and its personal ranking may only be used by one thread at a time.
+        self._completion_session: CompletionSession | None = None
+        self._personal_ranking: PersonalRanking | None = None
+        self._completion_lock = threading.Lock()
+
+    def shutdown(self) -> None:
+        """
+        Drops queued work. Operations that are already running still finish.
+
+        Dropped operations complete with G_IO_ERROR_CANCELLED, so that their callbacks are still called.
+        """
+        for priority, stats in self.scheduler_stats().items():
+            utils.log_debug(
+                f"{priority.name.lower()} jobs: {stats.started} started, {stats.queued} dropped, "
+                f"{stats.mean_wait * 1000:.1f} ms mean wait, {stats.max_wait * 1000:.1f} ms max wait"
+            )
+        for job in self._pool.shutdown():
+            if (task := self._tasks.pop(job, None)) is not None:
+                self._return_cancelled(task)
+
+    def scheduler_stats(self) -> dict[Priority, QueueStats]:
+        """Returns the queue depth and wait times of the worker pool, by priority."""
+        return self._pool.stats()
+
+    def _run_async(
+        self,
+        priority: Priority,
+        cancellable: Gio.Cancellable | None,
+        callback: AsyncReadyCallback | None,
+        func: Callable[..., Any],
+        *args: Any,
+    ) -> Gio.Task:
+        task = Gio.Task.new(self, cancellable, callback)
+        task.set_priority(_GLIB_PRIORITIES[priority])
+
+        def run():
+            if task.return_error_if_cancelled():
+                return
+            try:
+                task.wordbook_value = func(*args)
+            except Exception as e:  # noqa: BLE001 - the error is passed on to the finish method
+                utils.log_error(f"{func.__name__} failed: {e}")
+                task.return_error(GLib.Error.new_literal(Gio.io_error_quark(), str(e), Gio.IOErrorEnum.FAILED))
+                return
+            task.return_boolean(True)
+
+        self._tasks[run] = task
+        if not self._pool.submit(priority, run):
+            del self._tasks[run]
+            self._return_cancelled(task)
+        return task
+
+    @staticmethod
+    def _return_cancelled(task: Gio.Task) -> None:
+        """Completes the task of a job that will never run."""
+        task.return_error(
+            GLib.Error.new_literal(Gio.io_error_quark(), "Operation was cancelled", Gio.IOErrorEnum.CANCELLED)
+        )
+
+    @staticmethod
+    def _finish(result: Gio.AsyncResult) -> Any:
+        # Raises G_IO_ERROR_CANCELLED if the operation was cancelled, even after it ran,
+        # and G_IO_ERROR_FAILED if it raised an exception.
+        result.propagate_boolean()
+        return result.wordbook_value
+
+    def setup_async(self, cancellable: Gio.Cancellable | None, callback: AsyncReadyCallback) -> None:
+        """Extracts the database if needed and opens WordNet."""
+        self._run_async(Priority.FOREGROUND, cancellable, callback, self._setup)
+
+    def setup_finish(self, result: Gio.AsyncResult) -> bool:
+        """Returns whether WordNet is ready."""
+        return self._finish(result)
+
+    def _setup(self) -> bool:
+        if not DatabaseManager.setup():
+            return False
+        self.wn_instance = base.get_wn_instance()
+        return self.wn_instance is not None
+
+    def load_wordlist_async(self, cancellable: Gio.Cancellable | None, callback: AsyncReadyCallback) -> None:
+        """
+        Loads the lemma list and builds the completion, pattern and anagram indexes. Requires setup.
+
+        This holds the WordNet lock for a while, so it runs at idle priority and waits for searches in flight.
+        """
+        self._run_async(Priority.IDLE, cancellable, callback, self._load_wordlist)
+
+    def load_wordlist_finish(self, result: Gio.AsyncResult) -> list[str]:
+        """Returns the lemma list, sorted case-insensitively."""
+        return self._finish(result)
+
+    def _load_wordlist(self) -> list[str]:
+        wordlist, priors = base.get_wn_wordlist(self.wn_instance)
+        engine = CompletionEngine(wordlist, priors=priors)
+        self.pattern_index = PatternIndex(engine.wordlist)
+        self.anagram_index = AnagramIndex(engine.wordlist)
+        with self._completion_lock:
+            # Built with the lock held, so that lookups recorded meanwhile aren't missed.
+            self._personal_ranking = self._load_personal_ranking(engine)
+            self._completion_session = CompletionSession(engine, self._personal_ranking)
+        self.completion_engine = engine
+        self.wordlist = engine.wordlist
+        self.lemma_priors = engine.priors
+        return engine.wordlist
+
+    @staticmethod
+    def _load_personal_ranking(engine: CompletionEngine) -> PersonalRanking:
+        personal = PersonalRanking(engine)
+        store = HistoryStore.get()
+        entries = store.page(PERSONAL_HISTORY_SIZE, order=HistoryOrder.FRECENT)
+        entries += store.page(PERSONAL_HISTORY_SIZE, order=HistoryOrder.FRECENT, favorites_only=True)
+        for entry in entries:
+            personal.update(entry.term, entry.frecency, entry.favorite)
+        utils.log_info(f"Personal completion ranking built ({len(personal)} entries).")
+        return personal
+
+    def learn_history(self, entries: Iterable[HistoryEntry]) -> None:
+        """Updates the completion ranking with the current history of some terms, such as one just looked up."""
+        with self._completion_lock:
+            if self._personal_ranking is not None:
+                for entry in entries:
+                    self._personal_ranking.update(entry.term, entry.frecency, entry.favorite)
+
+    def forget_history(self, terms: Iterable[str]) -> None:
+        """Removes terms that were removed from the history from the completion ranking."""
+        with self._completion_lock:
+            if self._personal_ranking is not None:
+                for term in terms:
+                    self._personal_ranking.remove(term)
+
+    def define_async(
+        self,
+        text: str,
+        accent: str,
+        cancellable: Gio.Cancellable | None,
+        callback: AsyncReadyCallback,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> None:
+        """
+        Runs a search as typed in the search entry, in whichever search mode it selects.
+
+        Args:
+            text: The search entry text, including any search mode prefix.
+            accent: The espeak-ng accent code for pronunciations and rhymes.
+        """
+        self._run_async(priority, cancellable, callback, self._define, text, accent)
+
+    def define_finish(self, result: Gio.AsyncResult) -> dict[str, Any] | None:
+        """
+        Returns the search output, or None if there was nothing to search for or WordNet isn't ready.
+
+        Definitions have 'term' and 'result', as from base.format_output(). Searches
+        that list lemmas have 'term', 'mode', 'matches' and 'more_matches', where
+        'more_matches' is an iterator for take_matches_async(). Glossaries have
+        'term', 'mode' and 'glossary' terms for glossary_async().
+        """
+        return self._finish(result)
+
+    def _define(self, text: str, accent: str) -> dict[str, Any] | None:
+        mode, query = base.parse_search_mode(text)
+        if mode is base.SearchMode.GLOSSARY:
+            if not query:
+                return None
+            return {"term": text.strip(), "mode": mode, "glossary": base.glossary_terms(query)}
+        if mode is not base.SearchMode.DEFINE:
+            return self._search_matches(mode, query, text.strip(), accent)
+
+        term = base.clean_search_terms(text)
+        if not term.strip() or self.wn_instance is None:
+            return None
+        return base.format_output(term, self.wn_instance, accent=accent)
+
+    def _search_matches(
+        self, mode: base.SearchMode, query: str, search_text: str, accent: str
+    ) -> dict[str, Any] | None:
+        """Runs a search that lists matching lemmas instead of defining a term."""
+        if not query:
+            return None
+
+        all_matches: Iterator[tuple[tuple[str, ...], str | None]] = iter(())
+        if mode is base.SearchMode.REVERSE:
+            all_matches = ((match.lemmas, match.definition) for match in base.reverse_lookup(query))
+        elif mode is base.SearchMode.PATTERN and self.pattern_index is not None:
+            all_matches = (((lemma,), None) for lemma in self.pattern_index.search(query))
+        elif mode is base.SearchMode.ANAGRAM and self.anagram_index is not None:
+            all_matches = (((lemma,), None) for lemma in self.anagram_index.anagrams(query))
+        elif mode is base.SearchMode.LETTERS and self.anagram_index is not None:
+            all_matches = (((lemma,), None) for lemma in self.anagram_index.formable(query))
+        elif mode is base.SearchMode.RHYMES:
+            all_matches = (((lemma,), None) for lemma in base.find_rhymes(query, accent, limit=1000))
+        elif mode is base.SearchMode.SOUNDS:
+            all_matches = (((lemma,), None) for lemma in base.find_sound_alikes(query, accent))
+
+        # Only the first page is taken here; the rest is streamed in on request.
+        matches = list(itertools.islice(all_matches, MATCHES_PAGE_SIZE + 1))
+        more_matches = None
+        if len(matches) > MATCHES_PAGE_SIZE:
+            more_matches = itertools.chain([matches.pop()], all_matches)
+
+        return {"term": search_text, "mode": mode, "matches": matches, "more_matches": more_matches}
+
+    def take_matches_async(
+        self,
+        more_matches: Iterator[tuple[tuple[str, ...], str | None]],
+        cancellable: Gio.Cancellable | None,
+        callback: AsyncReadyCallback,
+    ) -> None:
+        """Takes the next page of a search that lists lemmas, plus one match to tell whether there are more."""
+        self._run_async(
+            Priority.FOREGROUND,
+            cancellable,
+            callback,
+            lambda: list(itertools.islice(more_matches, MATCHES_PAGE_SIZE + 1)),
+        )
+
+    def take_matches_finish(self, result: Gio.AsyncResult) -> MatchList:
+        return self._finish(result)
+
+    def taxonomy_async(self, synset_id: str, cancellable: Gio.Cancellable | None, callback: AsyncReadyCallback) -> None:
+        """Reads the node of a synset in the taxonomy, for the hierarchy browser."""
+        self._run_async(Priority.FOREGROUND, cancellable, callback, base.get_taxonomy_node, synset_id)
+
+    def taxonomy_finish(self, result: Gio.AsyncResult) -> base.TaxonomyNode | None:
+        """Returns the node, or None if the synset isn't in the taxonomy."""
+        return self._finish(result)
+
+    def related_nodes_async(
+        self,
+        node: base.TaxonomyNode,
+        relation: str,
+        cancellable: Gio.Cancellable | None,
+        callback: AsyncReadyCallback,
+    ) -> None:
+        """Reads the nodes related to a taxonomy node by one of the relations in wordbook.taxonomy.RELATIONS."""
+        self._run_async(Priority.FOREGROUND, cancellable, callback, base.get_related_nodes, node, relation)
+
+    def related_nodes_finish(self, result: Gio.AsyncResult) -> list[base.TaxonomyNode]:
+        return self._finish(result)
+
+    def glossary_async(
+        self,
+        terms: list[tuple[str, str]],
+        on_entries: Callable[[list[base.GlossaryEntry]], None],
+        cancellable: Gio.Cancellable | None,
+        callback: AsyncReadyCallback,
+    ) -> None:
+        """
+        Defines the terms of a glossary, calling on_entries on the main context with the entries resolved so far.
+
+        Entries are batched every GLOSSARY_BATCH_INTERVAL seconds. They arrive in the order of the terms, all
+        before the callback.
+        """
+        self._run_async(
+            Priority.FOREGROUND,
+            cancellable,
+            callback,
+            self._glossary,
+            terms,
+            on_entries,
+            cancellable,
+            _GLIB_PRIORITIES[Priority.FOREGROUND],
+        )
+
+    def _glossary(
+        self,
+        terms: list[tuple[str, str]],
+        on_entries: Callable[[list[base.GlossaryEntry]], None],
+        cancellable: Gio.Cancellable | None,
+        priority: int,
+    ) -> None:
+        batch: list[base.GlossaryEntry] = []
+        sent = time.monotonic()
+        for entry in base.define_glossary(terms, self.wn_instance):
+            if cancellable is not None and cancellable.is_cancelled():
+                return
+            batch.append(entry)
+            if time.monotonic() - sent >= GLOSSARY_BATCH_INTERVAL:
+                # The same priority as the task, so that every batch is handled before the callback.
+                GLib.idle_add(on_entries, batch, priority=priority)
+                batch = []
+                sent = time.monotonic()
+        if batch:
+            GLib.idle_add(on_entries, batch, priority=priority)
+
+    def glossary_finish(self, result: Gio.AsyncResult) -> None:
+        self._finish(result)
+
+    def suggest_async(
+        self, term: str, cancellable: Gio.Cancellable | None, callback: AsyncReadyCallback, limit: int = 5
+    ) -> None:
+        """Finds lemmas resembling a term that could not be defined. Requires the wordlist."""
+        self._run_async(
+            Priority.NORMAL, cancellable, callback, base.get_suggestions, term, self.wordlist, limit, self.lemma_priors
+        )
+
+    def suggest_finish(self, result: Gio.AsyncResult) -> list[tuple[str, float, int]]:
+        """Returns (lemma, score, index) tuples, best match first."""
+        return self._finish(result)
+
+    def complete_async(
+        self, text: str, limit: int, cancellable: Gio.Cancellable | None, callback: AsyncReadyCallback
+    ) -> None:
+        """Ranks the completions of the search entry text. Requires the wordlist."""
+        self._run_async(Priority.NORMAL, cancellable, callback, self._complete, text, limit)
+
+    def complete_finish(self, result: Gio.AsyncResult) -> list[str]:
+        return self._finish(result)
+
+    def _complete(self, text: str, limit: int) -> list[str]:
+        with self._completion_lock:
+            if self._completion_session is None:
+                return []
+            return self._completion_session.complete(text, limit)
+
+    def pronunciation_async(
+        self, term: str, accent: str, cancellable: Gio.Cancellable | None, callback: AsyncReadyCallback
+    ) -> None:
+        """Asks espeak-ng for the IPA of a term, for an accent WordNet has no pronunciation of it for."""
+        self._run_async(Priority.FOREGROUND, cancellable, callback, base.get_pronunciation, term, accent)
+
+    def pronunciation_finish(self, result: Gio.AsyncResult) -> str | None:
+        """Returns the IPA, or None if espeak-ng failed."""
+        return self._finish(result)
+
+    def speak_async(
+        self,
+        lemma: str,
+        accent: str,
+        ipa: str | None,
+        cancellable: Gio.Cancellable | None,
+        callback: AsyncReadyCallback | None,
+        priority: Priority = Priority.NORMAL,
+    ) -> None:
+        """Makes sure the audio of a pronunciation is rendered, rendering it if it isn't cached yet."""
+        self._run_async(priority, cancellable, callback, self._speak, lemma, accent, ipa)
+
+    def speak_finish(self, result: Gio.AsyncResult) -> str | None:
+        """Returns the path to the audio file, or None if it could not be rendered."""
+        return self._finish(result)
+
+    @staticmethod
+    def _speak(lemma: str, accent: str, ipa: str | None) -> str | None:
+        return base.get_cached_term_audio(lemma, accent=accent, ipa=ipa) or base.render_term_audio(
+            lemma, accent=accent, ipa=ipa
+        )
+
+    def read_aloud_async(
+        self, lemma: str, accent: str, ipa: str | None, cancellable: Gio.Cancellable | None = None
+    ) -> None:
+        """Lets espeak-ng speak a pronunciation directly, for when its audio file can't be played."""
+        self._run_async(Priority.NORMAL, cancellable, None, base.read_term, lemma, 120, accent, ipa)
@@ -6,15 +6,26 @@ Base module for Wordbook, containing UI-independent logic.
 """
 
 import difflib
+import hashlib
+import itertools
 import os
+import re
+import sqlite3
 import subprocess
+import sys
+import tempfile
 import threading
-from collections.abc import Callable
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from enum import Enum
 from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import wn
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Indel
 
 from wordbook import utils
 from wordbook.constants import (
@@ -23,15 +34,37 @@ from wordbook.constants import (
     SEARCH_TERM_REPLACE_CHARS,
     WN_DB_VERSION,
     WN_FILE_VERSION,
+    WN_INDEX_FILENAME,
+    PronunciationAccent,
 )
+from wordbook.linkify import MAX_PHRASE_WORDS, STOPWORDS, TOKEN_PATTERN, Link, candidate_phrases, find_links
+from wordbook.pattern_search import is_pattern
+from wordbook.phonetics import normalize_variety, phonetic_keys
+from wordbook.taxonomy import RELATIONS, unpack_nodes
 
 WN_DATABASE_LOCK = threading.Lock()
+# Guards the connection used to query the search indexes built by scripts/generate-wn-db.py.
+INDEX_DATABASE_LOCK = threading.Lock()
+_index_connection: sqlite3.Connection | None = None
 
 WN_DIR: str = os.path.join(utils.DATA_DIR, f"wn-{WN_FILE_VERSION}")
 
+# Synthesized pronunciations, so that replaying one doesn't run espeak-ng again.
+AUDIO_CACHE_DIR: str = os.path.join(utils.DATA_DIR, "audio")
+AUDIO_CACHE_MAX_FILES = 1000
+
+# Points a suggestion gains for being as common as a lemma can be, and how many times
+# more suggestions than needed are scored so that common ones can overtake rarer ones.
+SUGGESTION_PRIOR_BOOST = 8.0
+SUGGESTION_CANDIDATES = 4
+
 wn.config.data_directory = WN_DIR
 wn.config.allow_multithreading = True
 
+# Pronunciations are resolved for every accent during a lookup, so that
+# switching accents only has to pick a different one from the result.
+ACCENTS: tuple[str, ...] = tuple(accent.code for accent in PronunciationAccent)
+
 
 def clean_search_terms(search_term: str) -> str:
     """
@@ -44,42 +77,129 @@ def clean_search_terms(search_term: str) -> str:
     return text
 
 
-@dataclass
+class SearchMode(Enum):
+    """Kinds of search, selected by typing a prefix before the query."""
+
+    DEFINE = ""
+    REVERSE = "reverse:"
+    PATTERN = "pattern:"
+    ANAGRAM = "anagram:"
+    LETTERS = "letters:"
+    RHYMES = "rhymes:"
+    SOUNDS = "sounds:"
+    GLOSSARY = "glossary:"
+
+
+@dataclass(frozen=True)
+class GlossMatch:
+    synset_id: str
+    lemmas: tuple[str, ...]
+    definition: str
+    score: float
+
+
+@dataclass(frozen=True)
+class TaxonomyNode:
+    node: int
+    synset_id: str
+    lemmas: tuple[str, ...]
+    definition: str
+    # Related node IDs, keyed by the relations in wordbook.taxonomy.RELATIONS.
+    relations: dict[str, array]
+
+
+@dataclass(frozen=True)
+class GlossaryEntry:
+    # The term as it was written in the text.
+    text: str
+    lemma: str
+    pos: str
+    definition: str
+
+
+@dataclass(frozen=True, slots=True)
 class PronunciationInfo:
     ipa: str
     is_fallback: bool = False
 
 
-@dataclass
+# The pronunciations of a synset without any, one for each accent in ACCENTS.
+_NO_PRONUNCIATIONS: tuple[PronunciationInfo | None, ...] = (None,) * len(ACCENTS)
+
+
+@dataclass(slots=True)
+class SynsetResult:
+    """
+    A synset as shown for a looked up term.
+
+    Lemmas are interned, so the same lemma in many results and cached synsets is
+    stored once. Only the pronunciations and links are filled in after the
+    result is built.
+    """
+
+    id: str
+    # The lemma of the synset that matched the term.
+    name: str
+    definition: str
+    examples: tuple[str, ...]
+    syn: tuple[str, ...]
+    ant: tuple[str, ...]
+    sim: tuple[str, ...]
+    also_sees: tuple[str, ...]
+    # One for each accent in ACCENTS.
+    pronunciations: tuple[PronunciationInfo | None, ...] = _NO_PRONUNCIATIONS
+    # The pronunciation for the accent currently selected.
+    pronunciation: PronunciationInfo | None = None
+    definition_links: tuple[Link, ...] = ()
+    # The links of each example.
+    example_links: tuple[tuple[Link, ...], ...] = ()
+
+    def pronunciation_for(self, accent: str) -> PronunciationInfo | None:
+        """Returns the pronunciation for an espeak-ng accent code, or None if there is none."""
+        return self.pronunciations[ACCENTS.index(accent)] if accent in ACCENTS else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the result as a plain dictionary, the form it takes in JSON output."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "definition": self.definition,
+            "examples": list(self.examples),
+            "pronunciation": self.pronunciation,
+            "pronunciations": dict(zip(ACCENTS, self.pronunciations, strict=True)),
+            "syn": list(self.syn),
+            "ant": list(self.ant),
+            "sim": list(self.sim),
+            "also_sees": list(self.also_sees),
+            "definition_links": list(self.definition_links),
+            "example_links": [list(links) for links in self.example_links],
+        }
+
+
+@dataclass(slots=True)
 class PronunciationGroup:
     pronunciation: PronunciationInfo | None
-    synsets: list[dict[str, Any]]
+    synsets: list[SynsetResult]
 
 
-@dataclass
+@dataclass(slots=True)
 class LemmaGroup:
     lemma: str
     pronunciation_groups: list[PronunciationGroup]
 
 
-def _normalize_pronunciation_variety(variety: str | None) -> str:
-    if not variety:
-        return ""
-    return variety.strip().casefold()
-
-
 def _pronunciation_group_key(pronunciation: PronunciationInfo | None) -> tuple[str, bool]:
     if pronunciation is None:
         return ("", False)
     return (pronunciation.ipa, pronunciation.is_fallback)
 
 
-def group_synsets_by_lemma(synsets: list[dict[str, Any]]) -> list[LemmaGroup]:
-    lemma_groups: dict[str, dict[tuple[str, bool], list[dict[str, Any]]]] = {}
+def group_synsets_by_lemma(synsets: Sequence[SynsetResult]) -> list[LemmaGroup]:
+    lemma_groups: dict[str, dict[tuple[str, bool], list[SynsetResult]]] = {}
 
     for synset in synsets:
-        lemma = synset["name"]
-        pronunciation = synset.get("pronunciation")
+        lemma = synset.name
+        pronunciation = synset.pronunciation
         pronunciation_groups = lemma_groups.setdefault(lemma, {})
         pronunciation_groups.setdefault(_pronunciation_group_key(pronunciation), []).append(synset)
 
@@ -88,7 +208,7 @@ def group_synsets_by_lemma(synsets: list[dict[str, Any]]) -> list[LemmaGroup]:
             lemma=lemma,
             pronunciation_groups=[
                 PronunciationGroup(
-                    pronunciation=group_synsets[0].get("pronunciation"),
+                    pronunciation=group_synsets[0].pronunciation,
                     synsets=group_synsets,
                 )
                 for group_synsets in pronunciation_groups.values()
@@ -98,78 +218,89 @@ def group_synsets_by_lemma(synsets: list[dict[str, Any]]) -> list[LemmaGroup]:
     ]
 
 
-def ipa_to_espeak(ipa_string: str) -> str:
-    s = ipa_string.strip().strip("/[]")
+# IPA symbols and their espeak-ng phoneme mnemonics.
+_IPA_TO_ESPEAK: dict[str, str] = {
+    "ˈ": "'",
+    "ˌ": ",",
+    "ː": ":",
+    ".": "",
+    "‿": "",
+    "|": "",
+    "‖": "",
+    # "əʊ" used to be replaced before "ɛə", so keep the result that produced.
+    "ɛəʊ": "E@U",
+    "tʃ": "tS",
+    "dʒ": "dZ",
+    "eɪ": "eI",
+    "aɪ": "aI",
+    "ɔɪ": "OI",
+    "aʊ": "aU",
+    "oʊ": "oU",
+    "əʊ": "@U",
+    "ɪə": "I@",
+    "eə": "e@",
+    "ɛə": "e@",
+    "ʊə": "U@",
+    "iː": "i:",
+    "ɑː": "A:",
+    "ɔː": "O:",
+    "uː": "u:",
+    "ɜː": "3:",
+    "ɚ": "@r",
+    "ɝ": "3r",
+    "ɪ": "I",
+    "ɛ": "E",
+    "e": "e",
+    "æ": "a",
+    "ɑ": "A",
+    "ɒ": "0",
+    "ɔ": "O",
+    "ʊ": "U",
+    "ʌ": "V",
+    "ɜ": "3",
+    "ə": "@",
+    "ɐ": "@",
+    "a": "a",
+    "θ": "T",
+    "ð": "D",
+    "ʃ": "S",
+    "ʒ": "Z",
+    "ŋ": "N",
+    "ɹ": "r",
+    "ɾ": "4",
+    "ɫ": "l",
+    "ʔ": "?",
+    "ʍ": "W",
+    "x": "x",
+    "ç": "C",
+}
+
+# Matches the longest IPA symbol at each position, or any other non-ASCII
+# character, which espeak-ng wouldn't understand and is dropped.
+_IPA_PATTERN = re.compile(
+    "|".join(re.escape(symbol) for symbol in sorted(_IPA_TO_ESPEAK, key=len, reverse=True)) + r"|[^\x00-\x7f]"
+)
 
-    mapping = {
-        "ˈ": "'",
-        "ˌ": ",",
-        "ː": ":",
-        ".": "",
-        "‿": "",
-        "|": "",
-        "‖": "",
-        "tʃ": "tS",
-        "dʒ": "dZ",
-        "eɪ": "eI",
-        "aɪ": "aI",
-        "ɔɪ": "OI",
-        "aʊ": "aU",
-        "oʊ": "oU",
-        "əʊ": "@U",
-        "ɪə": "I@",
-        "eə": "e@",
-        "ɛə": "e@",
-        "ʊə": "U@",
-        "iː": "i:",
-        "ɑː": "A:",
-        "ɔː": "O:",
-        "uː": "u:",
-        "ɜː": "3:",
-        "ɚ": "@r",
-        "ɝ": "3r",
-        "ɪ": "I",
-        "ɛ": "E",
-        "e": "e",
-        "æ": "a",
-        "ɑ": "A",
-        "ɒ": "0",
-        "ɔ": "O",
-        "ʊ": "U",
-        "ʌ": "V",
-        "ɜ": "3",
-        "ə": "@",
-        "ɐ": "@",
-        "a": "a",
-        "θ": "T",
-        "ð": "D",
-        "ʃ": "S",
-        "ʒ": "Z",
-        "ŋ": "N",
-        "ɹ": "r",
-        "ɾ": "4",
-        "ɫ": "l",
-        "ʔ": "?",
-        "ʍ": "W",
-        "x": "x",
-        "ç": "C",
-    }
 
-    for ipa_sym, esp_sym in sorted(mapping.items(), key=lambda x: len(x[0]), reverse=True):
-        s = s.replace(ipa_sym, esp_sym)
+def _replace_ipa_symbol(match: re.Match[str]) -> str:
+    return _IPA_TO_ESPEAK.get(match.group(), "")
 
-    s = "".join(c for c in s if ord(c) < 128)
-    return f"[[{s}]]"
+
+@lru_cache(maxsize=4096)
+def ipa_to_espeak(ipa_string: str) -> str:
+    """Transliterates an IPA string into espeak-ng's phoneme input format."""
+    s = ipa_string.strip().strip("/[]")
+    return f"[[{_IPA_PATTERN.sub(_replace_ipa_symbol, s)}]]"
 
 
 def _pick_pronunciation(prons: list[wn.Pronunciation], accent: str) -> PronunciationInfo | None:
     if not prons:
         return None
 
-    requested_variety = _normalize_pronunciation_variety(accent)
+    requested_variety = normalize_variety(accent)
 
     for p in prons:
-        pronunciation_variety = _normalize_pronunciation_variety(p.variety)
+        pronunciation_variety = normalize_variety(p.variety)
         if pronunciation_variety and pronunciation_variety == requested_variety:
             return PronunciationInfo(ipa=p.value)
 
@@ -205,78 +336,209 @@ def fetch_definition(term: str, wn_instance: wn.Wordnet, accent: str = "us") ->
     if not result or not resolved_term:
         return definition_data
 
-    normalized_resolved_term = resolved_term.casefold()
-    needs_fallback = any(
-        synset_data.get("pronunciation") is None and synset_data["name"].casefold() == normalized_resolved_term
+    _add_gloss_links(result)
+
+    # Only the selected accent, so that a lookup runs espeak-ng once at most.
+    if needs_fallback_pronunciation(result, resolved_term, accent):
+        ipa = get_pronunciation(resolved_term, accent)
+        if ipa:
+            set_fallback_pronunciation(result, resolved_term, accent, ipa)
+
+    return definition_data
+
+
+def _add_gloss_links(result: dict[str, tuple[SynsetResult, ...]]) -> None:
+    """Adds the definition and example links of every synset in a result, leaving out its own lemma."""
+    synsets = [synset_data for pos_synsets in result.values() for synset_data in pos_synsets]
+    texts = [text for synset_data in synsets for text in (synset_data.definition, *synset_data.examples)]
+    links = iter(find_gloss_links(texts))
+    for synset_data in synsets:
+        name = synset_data.name.casefold()
+        own_links = [
+            tuple(link for link in text_links if link.lemma.casefold() != name)
+            for text_links in itertools.islice(links, 1 + len(synset_data.examples))
+        ]
+        synset_data.definition_links = own_links[0]
+        synset_data.example_links = tuple(own_links[1:])
+
+
+def _synsets_without_pronunciation(
+    result: dict[str, tuple[SynsetResult, ...]], term: str, accent: str
+) -> list[SynsetResult]:
+    """Returns the synsets of a term in a result that have no pronunciation for an accent."""
+    if accent not in ACCENTS:
+        return []
+    index = ACCENTS.index(accent)
+    normalized_term = term.casefold()
+    return [
+        synset_data
         for pos_synsets in result.values()
         for synset_data in pos_synsets
-    )
+        if synset_data.name.casefold() == normalized_term and synset_data.pronunciations[index] is None
+    ]
 
-    if not needs_fallback:
-        return definition_data
 
-    fallback_ipa = get_pronunciation(resolved_term, accent)
-    if not fallback_ipa:
-        return definition_data
+def needs_fallback_pronunciation(result: dict[str, tuple[SynsetResult, ...]], term: str, accent: str) -> bool:
+    """Returns whether WordNet has no pronunciation of a term in a result for an accent, so espeak-ng's is used."""
+    return bool(_synsets_without_pronunciation(result, term, accent))
+
+
+def set_fallback_pronunciation(result: dict[str, tuple[SynsetResult, ...]], term: str, accent: str, ipa: str) -> None:
+    """
+    Fills in the pronunciation espeak-ng gave for a term where WordNet has none for an accent.
+
+    A lookup only fills in the selected accent. The others are filled in when
+    the accent is switched, so that a lookup starts one espeak-ng process at most.
+    """
+    fallback = PronunciationInfo(ipa=ipa, is_fallback=True)
+    index = ACCENTS.index(accent)
+    for synset_data in _synsets_without_pronunciation(result, term, accent):
+        synset_data.pronunciations = (
+            *synset_data.pronunciations[:index],
+            fallback,
+            *synset_data.pronunciations[index + 1 :],
+        )
+        synset_data.pronunciation = synset_data.pronunciation_for(accent)
+
+
+def select_pronunciation_accent(result: dict[str, tuple[SynsetResult, ...]], accent: str) -> None:
+    """
+    Points the pronunciation of every synset in a result at the one resolved for an accent.
 
-    fallback_pronunciation = PronunciationInfo(ipa=fallback_ipa, is_fallback=True)
+    Used when the accent setting changes, so that no WordNet query or espeak-ng call is needed.
+    """
     for pos_synsets in result.values():
         for synset_data in pos_synsets:
-            if synset_data.get("pronunciation") is None and synset_data["name"].casefold() == normalized_resolved_term:
-                synset_data["pronunciation"] = fallback_pronunciation
-
-    return definition_data
+            synset_data.pronunciation = synset_data.pronunciation_for(accent)
 
 
 def _normalize_lemma(lemma: str) -> str:
-    """Normalize a lemma by replacing underscores with spaces and stripping whitespace."""
-    return lemma.replace("_", " ").strip()
+    """Normalize a lemma by replacing underscores with spaces and stripping whitespace. The result is interned."""
+    return sys.intern(lemma.replace("_", " ").strip())
 
 
-def _find_best_lemma_match(term: str, lemmas: list[str]) -> str:
-    """Finds the best matching lemma for the search term, prioritizing exact matches."""
-    normalized_term = term.lower().strip()
+@dataclass(frozen=True, slots=True)
+class SynsetData:
+    """The parts of a synset's presentation that are the same whichever term led to it."""
 
-    for lemma in lemmas:
-        if _normalize_lemma(lemma).lower() == normalized_term:
-            return _normalize_lemma(lemma)
+    pos: str
+    lemmas: tuple[str, ...]
+    normalized_lemmas: tuple[str, ...]
+    # The normalized lemmas lowercased, in the same order.
+    lowered_lemmas: tuple[str, ...]
+    definition: str
+    examples: tuple[str, ...]
+    antonyms: tuple[str, ...]
+    similar: tuple[str, ...]
+    also_sees: tuple[str, ...]
+    # (lowercased lemma, pronunciation for each accent in ACCENTS) for each word, in synset order.
+    pronunciations: tuple[tuple[str, tuple[PronunciationInfo | None, ...]], ...]
 
-    diff_match = difflib.get_close_matches(term, lemmas, n=1, cutoff=0.8)
-    if diff_match:
-        return _normalize_lemma(diff_match[0])
 
-    return _normalize_lemma(lemmas[0]) if lemmas else ""
+SYNSET_CACHE = utils.LRUCache(maxsize=4096)
 
 
-def _get_lemmas_from_related(matched_lemma: str, synset: wn.Synset, relation: str) -> list[str]:
+def _get_lemmas_from_related(synset: wn.Synset, relation: str) -> tuple[str, ...]:
     """Get normalized lemmas from a relation group."""
     target_list: list[str] = []
     for related_synset in synset.get_related(relation):
         for lemma in related_synset.lemmas():
             normalized_lemma = _normalize_lemma(lemma)
-            if normalized_lemma.lower() != matched_lemma.lower() and normalized_lemma not in target_list:
+            if normalized_lemma not in target_list:
                 target_list.append(normalized_lemma)
-    return target_list
-
+    return tuple(target_list)
 
-def _extract_related_lemmas(synset: wn.Synset, matched_lemma: str) -> dict[str, list[str]]:
-    """Extracts synonyms, antonyms, similar terms, and 'also sees'."""
-    related: dict[str, list[str]] = {"syn": [], "ant": [], "sim": [], "also_sees": []}
-
-    related["syn"] = [
-        _normalize_lemma(lemma) for lemma in synset.lemmas() if _normalize_lemma(lemma).lower() != matched_lemma.lower()
-    ]
 
+def _load_synset_data(synset: wn.Synset) -> SynsetData:
+    """Collects the term-independent data of a synset from WordNet."""
+    antonyms: list[str] = []
     for sense in synset.senses():
         for ant_sense in sense.get_related("antonym"):
             ant_name = _normalize_lemma(ant_sense.word().lemma())
-            if ant_name not in related["ant"]:
-                related["ant"].append(ant_name)
+            if ant_name not in antonyms:
+                antonyms.append(ant_name)
+
+    lemmas = tuple(sys.intern(lemma) for lemma in synset.lemmas())
+    normalized_lemmas = tuple(_normalize_lemma(lemma) for lemma in lemmas)
+
+    return SynsetData(
+        pos=synset.pos,
+        lemmas=lemmas,
+        normalized_lemmas=normalized_lemmas,
+        lowered_lemmas=tuple(sys.intern(lemma.lower()) for lemma in normalized_lemmas),
+        definition=synset.definition() or "No definition available.",
+        examples=tuple(synset.examples()),
+        antonyms=tuple(antonyms),
+        similar=_get_lemmas_from_related(synset, "similar"),
+        also_sees=_get_lemmas_from_related(synset, "also"),
+        pronunciations=tuple(
+            (
+                sys.intern(_normalize_lemma(word.lemma(data=False)).lower()),
+                _pick_pronunciations(word.lemma(data=True).pronunciations()),
+            )
+            for word in synset.words()
+        ),
+    )
 
-    related["sim"] = _get_lemmas_from_related(matched_lemma, synset, "similar")
-    related["also_sees"] = _get_lemmas_from_related(matched_lemma, synset, "also")
 
-    return related
+def _pick_pronunciations(prons: list[wn.Pronunciation]) -> tuple[PronunciationInfo | None, ...]:
+    """Picks the pronunciation of a word for each accent in ACCENTS."""
+    if not prons:
+        return _NO_PRONUNCIATIONS
+    return tuple(_pick_pronunciation(prons, code) for code in ACCENTS)
+
+
+def get_synset_data(synset: wn.Synset) -> SynsetData:
+    """Returns the term-independent data of a synset, shared between lookups through SYNSET_CACHE."""
+    data = SYNSET_CACHE.get(synset.id)
+    if data is None:
+        data = _load_synset_data(synset)
+        SYNSET_CACHE.put(synset.id, data)
+    return data
+
+
+def _closest_lemma(term: str, lemmas: tuple[str, ...], cutoff: float = 0.8) -> str | None:
+    """
+    Returns the lemma difflib.get_close_matches(term, lemmas, n=1, cutoff) would pick.
+
+    The Indel similarity computed by rapidfuzz is an upper bound of
+    SequenceMatcher.ratio(), so lemmas below the cutoff are rejected without
+    running the much slower pure-Python matcher on them.
+    """
+    best: tuple[float, str] | None = None
+    for lemma in lemmas:
+        if Indel.normalized_similarity(lemma, term) < cutoff - 1e-6:
+            continue
+        score = difflib.SequenceMatcher(None, lemma, term).ratio()
+        # Ties go to the greater lemma, like the heap in get_close_matches.
+        if score >= cutoff and (best is None or (score, lemma) > best):
+            best = (score, lemma)
+    return best[1] if best else None
+
+
+def _find_best_lemma_match(term: str, normalized_term: str, data: SynsetData) -> str:
+    """
+    Finds the best matching lemma for the search term, prioritizing exact matches.
+
+    Args:
+        term: The search term as given.
+        normalized_term: The term lowercased and stripped, computed once per lookup.
+        data: The synset to pick a lemma from.
+    """
+    if normalized_term in data.lowered_lemmas:
+        return data.normalized_lemmas[data.lowered_lemmas.index(normalized_term)]
+
+    close_match = _closest_lemma(term, data.lemmas)
+    if close_match is not None:
+        return _normalize_lemma(close_match)
+
+    return data.normalized_lemmas[0] if data.lemmas else ""
+
+
+def _without_lemma(lemmas: tuple[str, ...], matched_lower: str) -> tuple[str, ...]:
+    """Leaves the matched lemma out of related lemmas, sharing the tuple when it isn't there."""
+    kept = tuple(lemma for lemma in lemmas if lemma.lower() != matched_lower)
+    return lemmas if len(kept) == len(lemmas) else kept
 
 
 def get_definition(term: str, wn_instance: wn.Wordnet, accent: str = "us") -> dict[str, Any]:
@@ -292,51 +554,56 @@ def get_definition(term: str, wn_instance: wn.Wordnet, accent: str = "us") -> di
         A dictionary with the processed definition data ('term', 'result').
     """
     first_match: str | None = None
-    result_dict: dict[str, Any] = {pos: [] for pos in POS_MAP.values()}
+    result_dict: dict[str, list[SynsetResult]] = {pos: [] for pos in POS_MAP.values()}
 
     synsets = wn_instance.synsets(term.lower())
+    normalized_term = term.lower().strip()
 
     if not synsets:
         clean_def = {"term": term, "result": None}
         return clean_def
 
     for synset in synsets:
-        pos_tag = synset.pos
-        pos_name = POS_MAP.get(pos_tag)
+        data = get_synset_data(synset)
+
+        pos_name = POS_MAP.get(data.pos)
         if not pos_name:
-            utils.log_warning(f"Unknown POS tag encountered: {pos_tag} for term '{term}'")
+            utils.log_warning(f"Unknown POS tag encountered: {data.pos} for term '{term}'")
             pos_name = POS_MAP["u"]  # Default to 'unknown'
 
-        lemmas = synset.lemmas()
-        if not lemmas:
+        if not data.lemmas:
             continue  # Skip synsets with no lemmas
 
-        matched_lemma = _find_best_lemma_match(term, lemmas)
+        matched_lemma = _find_best_lemma_match(term, normalized_term, data)
         if first_match is None:
             first_match = matched_lemma
 
-        wn_pron = None
-        for word in synset.words():
-            if _normalize_lemma(word.lemma(data=False)).lower() == matched_lemma.lower():
-                form = word.lemma(data=True)
-                wn_pron = _pick_pronunciation(form.pronunciations(), accent)
+        wn_prons = _NO_PRONUNCIATIONS
+        matched_lower = matched_lemma.lower()
+        for lemma_lower, pronunciations in data.pronunciations:
+            if lemma_lower == matched_lower:
+                wn_prons = pronunciations
                 break
 
-        related_lemmas = _extract_related_lemmas(synset, matched_lemma)
-
-        synset_data: dict[str, Any] = {
-            "name": matched_lemma,
-            "definition": synset.definition() or "No definition available.",
-            "examples": synset.examples() or [],
-            "pronunciation": wn_pron,
-            **related_lemmas,
-        }
+        synset_data = SynsetResult(
+            id=synset.id,
+            name=matched_lemma,
+            definition=data.definition,
+            examples=data.examples,
+            syn=_without_lemma(data.normalized_lemmas, matched_lower),
+            ant=data.antonyms,
+            sim=_without_lemma(data.similar, matched_lower),
+            also_sees=_without_lemma(data.also_sees, matched_lower),
+            pronunciations=wn_prons,
+        )
+        synset_data.pronunciation = synset_data.pronunciation_for(accent)
 
         result_dict[pos_name].append(synset_data)
 
     clean_def = {
         "term": first_match or term,
-        "result": result_dict,
+        # Synsets of a part of speech as a tuple, so that the empty ones all share ().
+        "result": {pos: tuple(pos_synsets) for pos, pos_synsets in result_dict.items()},
     }
     return clean_def
 
@@ -423,24 +690,389 @@ def get_wn_instance() -> wn.Wordnet | None:
     except (wn.Error, wn.DatabaseError) as e:
         utils.log_error(f"WordNet initialization failed: {e}")
         return None
-    except Exception as e:
+    except Exception as e:  # noqa: BLE001 - WordNet failing to open must not take the application down
         utils.log_error(f"Unexpected error during WordNet initialization: {e}")
         return None
 
 
-def get_wn_wordlist(wn_instance: wn.Wordnet, on_complete: Callable[[list[str]], None]):
-    def fetch():
-        try:
-            with WN_DATABASE_LOCK:
-                lemmas = wn_instance.lemmas()
-            utils.log_info(f"WordNet wordlist fetched ({len(lemmas)} lemmas).")
-            on_complete(lemmas)
-        except Exception as e:
-            utils.log_error(f"Error fetching WordNet wordlist: {e}")
-            on_complete([])
+def get_wn_wordlist(wn_instance: wn.Wordnet) -> tuple[list[str], bytes | None]:
+    """
+    Returns every lemma in WordNet with its prior, how commonly it is used on a scale of 0 to 255.
 
+    The lemmas and priors come from the lemma index if the search indexes have one, with the lemmas
+    sorted case-insensitively. Otherwise the lemmas are fetched from WordNet, without priors.
+    The list is empty if the lemmas could not be fetched.
+    """
     utils.log_info("Fetching WordNet wordlist...")
-    threading.Thread(target=fetch, daemon=True).start()
+    rows = _query_index("SELECT lemmas, priors FROM wordbook_lemmas")
+    if rows:
+        lemmas, priors = rows[0][0].split("\n"), bytes(rows[0][1])
+        if len(lemmas) == len(priors):
+            utils.log_info(f"WordNet wordlist loaded from the lemma index ({len(lemmas)} lemmas).")
+            return lemmas, priors
+        utils.log_error("The lemma index is inconsistent, the database may need to be regenerated.")
+
+    try:
+        with WN_DATABASE_LOCK:
+            lemmas = wn_instance.lemmas()
+    except (wn.Error, wn.DatabaseError, sqlite3.Error) as e:
+        utils.log_error(f"Error fetching WordNet wordlist: {e}")
+        return [], None
+    utils.log_info(f"WordNet wordlist fetched ({len(lemmas)} lemmas).")
+    return lemmas, None
+
+
+def get_suggestions(
+    term: str, wordlist: list[str], limit: int = 5, priors: bytes | None = None
+) -> list[tuple[str, float, int]]:
+    """
+    Finds lemmas that closely resemble a term, for "Did you mean" suggestions.
+
+    Args:
+        term: The term that could not be defined.
+        wordlist: The WordNet lemma list.
+        limit: Maximum number of suggestions.
+        priors: The prior of each lemma in wordlist, see get_wn_wordlist(). Common lemmas
+            get up to SUGGESTION_PRIOR_BOOST points more than equally similar rare ones.
+
+    Returns:
+        A list of (lemma, score, index) tuples, best match first.
+    """
+    if len(term) <= 2 or not wordlist:
+        return []
+    if priors is None:
+        return process.extract(term, wordlist, limit=limit, scorer=fuzz.QRatio, score_cutoff=70)
+
+    candidates = process.extract(
+        term, wordlist, limit=limit * SUGGESTION_CANDIDATES, scorer=fuzz.QRatio, score_cutoff=70
+    )
+    boosted = [
+        (lemma, score + SUGGESTION_PRIOR_BOOST * priors[index] / 255, index) for lemma, score, index in candidates
+    ]
+    boosted.sort(key=lambda suggestion: suggestion[1], reverse=True)
+    return boosted[:limit]
+
+
+def _is_implicit_pattern(query: str) -> bool:
+    """
+    Checks whether a query is a pattern without the prefix.
+
+    It must be a single word with a wildcard before its end, or with more than one wildcard, so that a
+    single "?" or "*" ending a word, as in "what?", is taken as punctuation.
+    """
+    if any(char.isspace() for char in query):
+        return False
+    return is_pattern(query.rstrip("?*")) or sum(query.count(wildcard) for wildcard in "?*") > 1
+
+
+def parse_search_mode(text: str) -> tuple[SearchMode, str]:
+    """
+    Splits the search mode prefix, if any, from the search entry text.
+
+    A single word with a wildcard inside it, or with several wildcards, is a
+    pattern even without the prefix, and text too long to be a lemma, such as a
+    pasted paragraph, is a glossary.
+
+    Returns:
+        The search mode and the query without its prefix.
+    """
+    query = text.strip()
+    folded = query.casefold()
+    for mode in SearchMode:
+        if mode.value and folded.startswith(mode.value):
+            return mode, query[len(mode.value) :].strip()
+    if _is_implicit_pattern(query):
+        return SearchMode.PATTERN, query
+    if len(TOKEN_PATTERN.findall(query)) > MAX_PHRASE_WORDS:
+        return SearchMode.GLOSSARY, query
+    return SearchMode.DEFINE, query
+
+
+def _get_index_connection() -> sqlite3.Connection | None:
+    """Opens the search index database read-only. Must be called with INDEX_DATABASE_LOCK held."""
+    global _index_connection
+    if _index_connection is None:
+        db_path = Path(wn.config.data_directory) / WN_INDEX_FILENAME
+        try:
+            _index_connection = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        except sqlite3.Error as e:
+            utils.log_error(f"Could not open {db_path} for searching: {e}")
+            return None
+    return _index_connection
+
+
+def _query_index(sql: str, parameters: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+    """Runs a query against the search indexes, returning no rows if they are missing."""
+    with INDEX_DATABASE_LOCK:
+        connection = _get_index_connection()
+        if connection is None:
+            return []
+        try:
+            return connection.execute(sql, parameters).fetchall()
+        except sqlite3.OperationalError as e:
+            utils.log_error(f"Search index query failed, the database may need to be regenerated: {e}")
+            return []
+
+
+def reverse_lookup(description: str, limit: int = 20) -> list[GlossMatch]:
+    """
+    Finds synsets whose definition or examples match a description, such as "fear of heights".
+
+    Args:
+        description: Free text describing the meaning being looked for.
+        limit: Maximum number of synsets.
+
+    Returns:
+        Matching synsets ranked by BM25, definitions weighted above examples, best first.
+    """
+    words = [word for word in re.findall(r"\w+", description.casefold()) if word not in STOPWORDS]
+    if not words or limit <= 0:
+        return []
+
+    # Quoting every word keeps FTS5 from reading any of them as query syntax.
+    match_expression = " OR ".join(f'"{word}"' for word in dict.fromkeys(words))
+    rows = _query_index(
+        """
+        SELECT synset_id, lemmas, definition, bm25(wordbook_glosses, 0.0, 0.0, 1.0, 0.25) AS score
+        FROM wordbook_glosses
+        WHERE wordbook_glosses MATCH ?
+        ORDER BY score
+        LIMIT ?
+        """,
+        (match_expression, limit),
+    )
+    return [
+        GlossMatch(synset_id=synset_id, lemmas=tuple(lemmas.split("\t")), definition=definition, score=-score)
+        for synset_id, lemmas, definition, score in rows
+    ]
+
+
+def _term_phonetic_keys(term: str, accent: str) -> list[tuple[str, str]]:
+    """Returns the (rhyme key, sound key) of a term's pronunciations for an accent, asking espeak-ng if needed."""
+    rows = _query_index(
+        """
+        SELECT DISTINCT rhyme_key, sound_key FROM wordbook_phonetics
+        WHERE lemma = ? COLLATE NOCASE AND accent IN (?, '')
+        """,
+        (term, accent),
+    )
+    if rows:
+        return rows
+
+    ipa = get_pronunciation(term, accent)
+    return [phonetic_keys(ipa)] if ipa else []
+
+
+def _common_suffix_length(first: str, second: str) -> int:
+    length = 0
+    for first_char, second_char in zip(reversed(first), reversed(second)):
+        if first_char != second_char:
+            break
+        length += 1
+    return length
+
+
+def find_rhymes(term: str, accent: str = "us", limit: int = 100) -> list[str]:
+    """
+    Finds lemmas that rhyme with a term in an accent.
+
+    A rhyme shares everything from the vowel of the last stressed syllable
+    onwards. Rhymes that share more of the ending rank first, then those
+    closest in length, then alphabetically. Homophones are left out.
+
+    Args:
+        term: The word to rhyme with.
+        accent: The accent code, such as "us" or "gb".
+        limit: Maximum number of rhymes.
+    """
+    phonetic_keys = _term_phonetic_keys(term.strip(), accent)
+    if not phonetic_keys or limit <= 0:
+        return []
+
+    rhyme_keys = {key for key, _sound_key in phonetic_keys}
+    term_keys = {key for _rhyme_key, key in phonetic_keys}
+
+    placeholders = ", ".join("?" * len(rhyme_keys))
+    candidates = _query_index(
+        f"""
+        SELECT lemma, sound_key FROM wordbook_phonetics
+        WHERE accent IN (?, '') AND rhyme_key IN ({placeholders})
+        """,
+        (accent, *rhyme_keys),
+    )
+
+    folded_term = term.strip().casefold()
+    ranked: dict[str, tuple[int, int, str]] = {}
+    for lemma, candidate_key in candidates:
+        if lemma.casefold() == folded_term or candidate_key in term_keys:
+            continue
+        rank = min(
+            (-_common_suffix_length(candidate_key, key), abs(len(candidate_key) - len(key)), lemma.casefold())
+            for key in term_keys
+        )
+        if lemma not in ranked or rank < ranked[lemma]:
+            ranked[lemma] = rank
+
+    return sorted(ranked, key=ranked.__getitem__)[:limit]
+
+
+def find_sound_alikes(term: str, accent: str = "us", limit: int = 100) -> list[str]:
+    """
+    Finds lemmas pronounced exactly like a term in an accent, ignoring stress and syllable breaks.
+
+    Args:
+        term: The word to match.
+        accent: The accent code, such as "us" or "gb".
+        limit: Maximum number of lemmas.
+
+    Returns:
+        The lemmas in alphabetical order.
+    """
+    term_keys = {key for _rhyme_key, key in _term_phonetic_keys(term.strip(), accent)}
+    if not term_keys or limit <= 0:
+        return []
+
+    placeholders = ", ".join("?" * len(term_keys))
+    rows = _query_index(
+        f"""
+        SELECT DISTINCT lemma FROM wordbook_phonetics
+        WHERE accent IN (?, '') AND sound_key IN ({placeholders})
+        """,
+        (accent, *term_keys),
+    )
+    folded_term = term.strip().casefold()
+    lemmas = sorted({lemma for (lemma,) in rows if lemma.casefold() != folded_term}, key=str.casefold)
+    return lemmas[:limit]
+
+
+# Keeps "WHERE node IN (...)" queries well below SQLite's limit on parameters.
+_TAXONOMY_QUERY_CHUNK = 500
+
+
+def _taxonomy_node_from_row(row: tuple[Any, ...]) -> TaxonomyNode:
+    node, synset_id, lemmas, definition, *adjacency = row
+    return TaxonomyNode(
+        node=node,
+        synset_id=synset_id,
+        lemmas=tuple(lemmas.split("\t")),
+        definition=definition,
+        relations={relation: unpack_nodes(blob) for relation, blob in zip(RELATIONS, adjacency, strict=True)},
+    )
+
+
+def get_taxonomy_node(synset_id: str) -> TaxonomyNode | None:
+    """Returns the taxonomy node of a synset, or None if it isn't in the taxonomy table."""
+    rows = _query_index(
+        f"""
+        SELECT node, synset_id, lemmas, definition, {", ".join(RELATIONS)} FROM wordbook_taxonomy
+        WHERE synset_id = ?
+        """,
+        (synset_id,),
+    )
+    return _taxonomy_node_from_row(rows[0]) if rows else None
+
+
+def get_related_nodes(node: TaxonomyNode, relation: str) -> list[TaxonomyNode]:
+    """
+    Returns the nodes a taxonomy node is related to, sorted by their first lemma.
+
+    The related node IDs are already part of the node, so this only loads
+    their rows by primary key; nothing is asked of WordNet.
+
+    Args:
+        node: The node to expand.
+        relation: One of the keys of wordbook.taxonomy.RELATIONS.
+    """
+    related_ids = node.relations[relation]
+    related: list[TaxonomyNode] = []
+    for start in range(0, len(related_ids), _TAXONOMY_QUERY_CHUNK):
+        chunk = related_ids[start : start + _TAXONOMY_QUERY_CHUNK]
+        rows = _query_index(
+            f"""
+            SELECT node, synset_id, lemmas, definition, {", ".join(RELATIONS)} FROM wordbook_taxonomy
+            WHERE node IN ({", ".join("?" * len(chunk))})
+            """,
+            tuple(chunk),
+        )
+        related.extend(_taxonomy_node_from_row(row) for row in rows)
+    related.sort(key=lambda related_node: related_node.lemmas[0].casefold())
+    return related
+
+
+_TOKEN_QUERY_CHUNK = 500
+
+
+def find_gloss_links(texts: list[str]) -> list[list[Link]]:
+    """
+    Finds the words and expressions in some texts that can be looked up, and the lemmas they lead to.
+
+    The token table maps inflected words and expressions straight to their
+    lemmas, so this only looks up the candidate phrases of all the texts at
+    once; nothing is asked of WordNet.
+
+    Args:
+        texts: The texts to link, such as a definition and its examples.
+
+    Returns:
+        The links of each text, in the same order as the texts.
+    """
+    phrases = sorted(set().union(*map(candidate_phrases, texts)))
+    token_lemmas: dict[str, str] = {}
+    for start in range(0, len(phrases), _TOKEN_QUERY_CHUNK):
+        chunk = phrases[start : start + _TOKEN_QUERY_CHUNK]
+        rows = _query_index(
+            f"SELECT token, lemma FROM wordbook_tokens WHERE token IN ({', '.join('?' * len(chunk))})",
+            tuple(chunk),
+        )
+        token_lemmas.update(rows)
+    return [find_links(text, token_lemmas) for text in texts]
+
+
+def glossary_terms(text: str) -> list[tuple[str, str]]:
+    """
+    Finds the distinct terms of a text worth defining, such as a pasted paragraph.
+
+    Multi-word expressions are found by longest match and inflected words are
+    reduced to their lemmas, both through the token table.
+
+    Returns:
+        (term as written, lemma) pairs in order of first appearance, one per lemma.
+    """
+    terms: dict[str, tuple[str, str]] = {}
+    for link in find_gloss_links([text])[0]:
+        terms.setdefault(link.lemma.casefold(), (text[link.start : link.end], link.lemma))
+    return list(terms.values())
+
+
+def _get_glossary_entry(text: str, lemma: str, wn_instance: wn.Wordnet) -> GlossaryEntry | None:
+    """Returns the first sense of a lemma, preferring synsets the lemma itself belongs to."""
+    with WN_DATABASE_LOCK:
+        result = get_definition(lemma, wn_instance).get("result") or {}
+
+    synsets = [(pos, synset_data) for pos, pos_synsets in result.items() for synset_data in pos_synsets]
+    if not synsets:
+        return None
+    folded = lemma.casefold()
+    pos, synset_data = next(
+        ((pos, synset_data) for pos, synset_data in synsets if synset_data.name.casefold() == folded), synsets[0]
+    )
+    return GlossaryEntry(text=text, lemma=synset_data.name, pos=pos, definition=synset_data.definition)
+
+
+def define_glossary(terms: list[tuple[str, str]], wn_instance: wn.Wordnet) -> Iterator[GlossaryEntry]:
+    """
+    Resolves glossary terms in order, yielding each entry as soon as it is ready.
+
+    The terms are resolved one after another, since every lookup holds WN_DATABASE_LOCK anyway. Closing the
+    iterator early skips the terms that haven't been resolved.
+
+    Args:
+        terms: Terms as returned by glossary_terms().
+        wn_instance: The initialized Wordnet instance.
+    """
+    for text, lemma in terms:
+        if entry := _get_glossary_entry(text, lemma, wn_instance):
+            yield entry
 
 
 def format_output(text: str, wn_instance: wn.Wordnet, accent: str = "us") -> dict[str, Any] | None:
@@ -469,6 +1101,91 @@ def format_output(text: str, wn_instance: wn.Wordnet, accent: str = "us") -> dic
         return None
 
 
+def _audio_cache_path(phoneme_input: str, speed: int, accent: str) -> str:
+    key = hashlib.sha256(f"{accent}\0{speed}\0{phoneme_input}".encode()).hexdigest()
+    return os.path.join(AUDIO_CACHE_DIR, f"{key}.wav")
+
+
+def get_cached_term_audio(text: str, speed: int = 120, accent: str = "us", ipa: str | None = None) -> str | None:
+    """Returns the path of the cached audio for a pronunciation if it has already been rendered."""
+    path = _audio_cache_path(ipa_to_espeak(ipa) if ipa else text, speed, accent)
+    try:
+        # Bump the modification time so that pruning drops the least recently played files.
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def render_term_audio(text: str, speed: int = 120, accent: str = "us", ipa: str | None = None) -> str | None:
+    """
+    Synthesizes a pronunciation to a WAV file in the audio cache, unless it is already there.
+
+    Args:
+        text: The text to speak.
+        speed: Speaking speed (words per minute).
+        accent: The espeak-ng accent code.
+        ipa: The IPA string to use for pronunciation (if available).
+
+    Returns:
+        The path of the WAV file, or None if espeak-ng failed.
+    """
+    if cached_path := get_cached_term_audio(text, speed, accent, ipa):
+        return cached_path
+
+    phoneme_input = ipa_to_espeak(ipa) if ipa else text
+    try:
+        completed = subprocess.run(
+            ["espeak-ng", "--stdout", "-s", str(speed), "-v", f"en-{accent}", phoneme_input],
+            capture_output=True,
+            check=False,
+            timeout=10,
+        )
+    except FileNotFoundError:
+        utils.log_error("'espeak-ng' command not found. Cannot render pronunciation audio.")
+        return None
+    except subprocess.TimeoutExpired:
+        utils.log_error(f"espeak-ng timed out while rendering audio for: '{text}'")
+        return None
+    except OSError as ex:
+        utils.log_error(f"OS error executing espeak-ng to render audio for '{text}': {ex}")
+        return None
+
+    if completed.returncode != 0 or not completed.stdout:
+        utils.log_error(f"espeak-ng failed to render audio for '{text}': {completed.stderr.decode(errors='replace')}")
+        return None
+
+    path = _audio_cache_path(phoneme_input, speed, accent)
+    temp_path = None
+    try:
+        os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=AUDIO_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as audio_file:
+            audio_file.write(completed.stdout)
+        os.replace(temp_path, path)
+    except OSError as ex:
+        utils.log_error(f"Could not write pronunciation audio to {path}: {ex}")
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+
+    _prune_audio_cache()
+    return path
+
+
+def _prune_audio_cache() -> None:
+    """Removes the least recently played files once the audio cache holds too many."""
+    try:
+        entries = [entry for entry in os.scandir(AUDIO_CACHE_DIR) if entry.name.endswith(".wav")]
+        if len(entries) <= AUDIO_CACHE_MAX_FILES:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - AUDIO_CACHE_MAX_FILES]:
+            os.remove(entry.path)
+    except OSError as ex:
+        utils.log_warning(f"Could not prune the pronunciation audio cache: {ex}")
+
+
 def read_term(text: str, speed: int = 120, accent: str = "us", ipa: str | None = None) -> None:
     """
     Uses espeak-ng to speak the given text aloud.
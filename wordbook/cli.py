@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Headless command-line interface for Wordbook.
+
+Looks up terms without creating any GTK widgets and streams one JSON record per
+term to stdout, which makes it usable for scripting and as a harness for
+performance regression tests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from wordbook import base, utils
+from wordbook.constants import PronunciationAccent
+from wordbook.database import DatabaseManager
+
+# Number of in-flight lookups allowed per worker before results are drained.
+# Keeps memory bounded when reading very large word lists from stdin.
+_QUEUE_FACTOR = 4
+
+_wn_instance: base.wn.Wordnet | None = None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, base.SynsetResult):
+        return value.as_dict()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _init_worker() -> None:
+    """
+    Creates the WordNet instance used by the lookups of this process.
+
+    Raises:
+        RuntimeError: If WordNet could not be initialized.
+    """
+    global _wn_instance
+    _wn_instance = base.get_wn_instance()
+    if not _wn_instance:
+        raise RuntimeError("WordNet could not be initialized")
+
+
+def define_term(text: str, accent: str = "us") -> str:
+    """
+    Looks up a single term and serializes the outcome as one line of JSON.
+
+    Args:
+        text: The raw term, as given on the command line or read from stdin.
+        accent: The espeak-ng accent code.
+
+    Returns:
+        A JSON object with the query, the resolved term, the result and the lookup time.
+    """
+    start = time.perf_counter()
+    output = base.format_output(text, _wn_instance, accent=accent) if _wn_instance else None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    record = {
+        "query": text,
+        "term": output.get("term") if output else None,
+        "result": output.get("result") if output else None,
+        "elapsed_ms": round(elapsed_ms, 3),
+    }
+    return json.dumps(record, default=_json_default, ensure_ascii=False)
+
+
+def _ordered_map(executor: Executor, fn: Callable[..., str], items: Iterable[str], window: int, *args) -> Iterator[str]:
+    """Like Executor.map, but keeps at most `window` items in flight and yields results in input order."""
+    pending: deque[Future[str]] = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _read_terms(terms: list[str]) -> Iterator[str]:
+    """Yields terms from the command line, or from stdin (one per line) if none or '-' were given."""
+    if terms and terms != ["-"]:
+        yield from terms
+        return
+
+    for line in sys.stdin:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="wordbook",
+        description="Look up terms without opening a window, printing one JSON record per term.",
+    )
+    parser.add_argument(
+        "--define",
+        nargs="*",
+        metavar="TERM",
+        required=True,
+        help="Terms to look up. Reads one term per line from stdin if none are given or TERM is '-'.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes used for lookups (default: 1)",
+    )
+    parser.add_argument(
+        "--accent",
+        choices=[accent.code for accent in PronunciationAccent],
+        default=PronunciationAccent.US.code,
+        help="Pronunciation accent (default: us)",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Make it scream louder")
+    return parser
+
+
+def main(argv: list[str]) -> int:
+    """
+    Entry point for headless lookups.
+
+    Args:
+        argv: Command-line arguments, excluding the program name.
+
+    Returns:
+        The process exit status.
+    """
+    args = _build_parser().parse_args(argv)
+    utils.log_init(args.verbose)
+
+    if args.jobs < 1:
+        utils.log_error("--jobs must be at least 1")
+        return 2
+
+    base.create_required_dirs()
+    if not DatabaseManager.setup():
+        utils.log_error("WordNet database is not available")
+        return 1
+
+    terms = _read_terms(args.define)
+
+    if args.jobs == 1:
+        try:
+            _init_worker()
+        except RuntimeError:
+            return 1
+        for term in terms:
+            print(define_term(term, args.accent), flush=True)
+        return 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker) as executor:
+            for record in _ordered_map(executor, define_term, terms, args.jobs * _QUEUE_FACTOR, args.accent):
+                print(record, flush=True)
+    except BrokenProcessPool:
+        # Raised for every lookup once a worker's initializer has failed.
+        utils.log_error("A lookup worker could not initialize WordNet")
+        return 1
+
+    return 0
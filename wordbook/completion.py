@@ -0,0 +1,361 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Prefix completion over the WordNet lemma list, independent of GTK.
+
+Completions are ranked by the shape of the untyped suffix: fewer spaces first,
+then fewer punctuation characters, then shorter, then more common when lemma
+priors are available, then alphabetically. Variants that differ only in case
+are shown once, preferring the one that matches the case the user typed.
+
+Every lemma starting with a prefix shares that prefix, so the suffix shape only
+differs by a constant from the shape of the whole lemma. The ranking order is
+therefore the same for every prefix and is computed once when the engine is
+built; a query only has to find the best ranked lemmas inside its prefix range.
+
+Lemmas the user looks up often or recently, or has favorited, can be put
+first by a PersonalRanking, which keeps the best of them for every prefix.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import sys
+import time
+
+from wordbook import utils
+from wordbook.history import frecency_key
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Ranges smaller than this are ranked in Python even when NumPy is available,
+# since converting the result back to Python ints costs more than it saves.
+_NUMPY_MIN_RANGE = 4096
+
+# A session keeps the whole rank-ordered range once it is at most this large,
+# so that later keystrokes only filter it instead of selecting from scratch.
+_SESSION_RANKED_MAX = 4096
+
+BACKENDS = ("auto", "python", "numpy")
+
+# Personal lemmas kept for every prefix, which is as many as can be put first.
+PERSONAL_PER_PREFIX = 8
+
+# A favorite counts as this many lookups made at the time it was last looked up.
+FAVORITE_WEIGHT = 4
+
+# Personal lemmas that aren't favorites are put first while their frecency score,
+# their lookups each weighed by how recent they were, is at least this.
+PERSONAL_MIN_SCORE = 0.25
+
+
+def _rank_key(folded: str, prior: int) -> tuple[int, int, int, int, str]:
+    return (folded.count(" "), sum(not char.isalnum() for char in folded), len(folded), -prior, folded)
+
+
+class CompletionEngine:
+    """Ranks the lemmas that start with a typed prefix."""
+
+    def __init__(self, wordlist: list[str], backend: str = "auto", priors: bytes | None = None):
+        """
+        Builds the completion index.
+
+        Args:
+            wordlist: The lemma list, in any order.
+            backend: "python", "numpy", or "auto" to use NumPy for large ranges when it is installed.
+            priors: How common each lemma of wordlist is, see base.get_wn_wordlist(). Used to break ties.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown completion backend: {backend}")
+        if backend == "numpy" and np is None:
+            raise ValueError("The numpy completion backend requires NumPy to be installed")
+
+        self.backend = backend
+        order = sorted(range(len(wordlist)), key=lambda index: wordlist[index].casefold())
+        self.wordlist: list[str] = [wordlist[index] for index in order]
+        self.priors: bytes | None = bytes(priors[index] for index in order) if priors is not None else None
+
+        # Lemmas that casefold to the same string are adjacent after sorting
+        # and form one group, which is ranked and displayed as a single item.
+        # A group is as common as its most common variant.
+        self._groups: list[str] = []
+        self._group_starts: list[int] = []
+        group_priors: list[int] = []
+        previous = None
+        for index, word in enumerate(self.wordlist):
+            folded = word.casefold()
+            prior = self.priors[index] if self.priors is not None else 0
+            if folded != previous:
+                self._groups.append(folded)
+                self._group_starts.append(index)
+                group_priors.append(prior)
+                previous = folded
+            else:
+                group_priors[-1] = max(group_priors[-1], prior)
+        self._group_starts.append(len(self.wordlist))
+
+        order = sorted(range(len(self._groups)), key=lambda group: _rank_key(self._groups[group], group_priors[group]))
+        self._group_ranks: list[int] = [0] * len(self._groups)
+        for rank, group in enumerate(order):
+            self._group_ranks[group] = rank
+
+        self._np_group_ranks = np.asarray(self._group_ranks, dtype=np.int32) if np is not None else None
+
+        utils.log_info(f"Completion index built ({len(self._groups)} entries, backend: {backend}).")
+
+    def prefix_range(self, search_term: str, lo: int = 0, hi: int | None = None) -> tuple[int, int]:
+        """
+        Returns the range of groups whose casefolded lemma starts with a casefolded search term.
+
+        Args:
+            search_term: The casefolded prefix.
+            lo: Start of a range known to contain the result, such as the range of a shorter prefix.
+            hi: End of that range.
+        """
+        if hi is None:
+            hi = len(self._groups)
+        start = bisect.bisect_left(self._groups, search_term, lo, hi)
+        end = bisect.bisect_right(self._groups, f"{search_term}{chr(sys.maxunicode)}", start, hi)
+        return start, end
+
+    def complete(self, text: str, limit: int) -> list[str]:
+        """
+        Finds the best completions for the typed text.
+
+        Args:
+            text: The search entry text. Leading whitespace is ignored.
+            limit: Maximum number of completions.
+
+        Returns:
+            Up to `limit` lemmas, best first.
+        """
+        if limit <= 0 or not text.strip() or not self._groups:
+            return []
+
+        typed_prefix = text.lstrip()
+        start, end = self.prefix_range(typed_prefix.casefold())
+        groups = self._top_groups(start, end, limit)
+        return [self._group_display(group, typed_prefix) for group in groups]
+
+    def find_group(self, lemma: str) -> int | None:
+        """Returns the group of lemma, or None if it isn't in the lemma list."""
+        folded = lemma.casefold()
+        group = bisect.bisect_left(self._groups, folded)
+        return group if group < len(self._groups) and self._groups[group] == folded else None
+
+    def group_name(self, group: int) -> str:
+        """Returns the casefolded lemma of a group."""
+        return self._groups[group]
+
+    def _rank_range(self, start: int, end: int) -> list[int]:
+        return sorted(range(start, end), key=self._group_ranks.__getitem__)
+
+    def _top_groups(self, start: int, end: int, limit: int) -> list[int]:
+        if end - start <= limit:
+            return self._rank_range(start, end)
+
+        use_numpy = self.backend == "numpy" or (
+            self.backend == "auto" and self._np_group_ranks is not None and end - start >= _NUMPY_MIN_RANGE
+        )
+        if use_numpy:
+            ranks = self._np_group_ranks[start:end]
+            best = np.argpartition(ranks, limit - 1)[:limit]
+            best = best[np.argsort(ranks[best])]
+            return (best + start).tolist()
+
+        return heapq.nsmallest(limit, range(start, end), key=self._group_ranks.__getitem__)
+
+    def _group_display(self, group: int, typed_prefix: str) -> str:
+        """Picks the first variant that matches the typed case, or the first variant otherwise."""
+        variants = self.wordlist[self._group_starts[group] : self._group_starts[group + 1]]
+        prefix_len = len(typed_prefix)
+        for variant in variants:
+            if variant[:prefix_len] == typed_prefix:
+                return variant
+        return variants[0]
+
+
+class PersonalRanking:
+    """
+    The lemmas the user looks up, ranked by frecency for every prefix they start with.
+
+    Every prefix keeps its best PERSONAL_PER_PREFIX lemmas, so ranking a
+    keystroke only reads one short list. Frecency keys don't change as time
+    passes, so the lists only change when a lemma is looked up, favorited or
+    forgotten, and then only the lists of that lemma's prefixes are updated.
+
+    Like CompletionSession, this is not thread-safe.
+    """
+
+    def __init__(self, engine: CompletionEngine):
+        self._engine = engine
+        # The frecency key and favorite status of every looked up variant of a group.
+        self._variants: dict[int, dict[str, tuple[float, bool]]] = {}
+        # The key each group is ranked by, and the groups that have one, in order.
+        self._keys: dict[int, float] = {}
+        self._ranked_groups: list[int] = []
+        self._favorites: set[int] = set()
+        self._prefixes: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(self, term: str, frecency: float, favorite: bool) -> None:
+        """
+        Records the current history of a term. Terms that aren't lemmas are ignored.
+
+        Args:
+            term: The term, as it was looked up.
+            frecency: Its frecency key, see wordbook.history.
+            favorite: Whether it is a favorite.
+        """
+        group = self._engine.find_group(term)
+        if group is not None:
+            self._variants.setdefault(group, {})[term] = (frecency, favorite)
+            self._rerank(group)
+
+    def remove(self, term: str) -> None:
+        """Forgets a term, such as when the history is cleared."""
+        group = self._engine.find_group(term)
+        variants = self._variants.get(group)
+        if variants is not None and variants.pop(term, None) is not None:
+            if not variants:
+                del self._variants[group]
+            self._rerank(group)
+
+    def top(self, search_term: str, now: float | None = None) -> list[int]:
+        """
+        Returns the groups to put first for a prefix, best first.
+
+        Args:
+            search_term: The casefolded prefix.
+            now: The current time in seconds since the epoch.
+        """
+        best = self._prefixes.get(search_term)
+        if not best:
+            return []
+        min_key = frecency_key(time.time() if now is None else now) + math.log(PERSONAL_MIN_SCORE)
+        return [group for group in best if group in self._favorites or self._keys[group] >= min_key]
+
+    def _rerank(self, group: int) -> None:
+        old_key = self._keys.get(group)
+        variants = self._variants.get(group)
+        if variants:
+            # Lookups of every variant count, and favorites count extra.
+            frecencies = [frecency for frecency, _favorite in variants.values()]
+            highest = max(frecencies)
+            key = highest + math.log(sum(math.exp(frecency - highest) for frecency in frecencies))
+            if any(favorite for _frecency, favorite in variants.values()):
+                key += math.log(FAVORITE_WEIGHT)
+                self._favorites.add(group)
+            else:
+                self._favorites.discard(group)
+            self._keys[group] = key
+            if old_key is None:
+                bisect.insort(self._ranked_groups, group)
+        else:
+            key = None
+            self._keys.pop(group, None)
+            self._favorites.discard(group)
+            if old_key is not None:
+                del self._ranked_groups[bisect.bisect_left(self._ranked_groups, group)]
+
+        folded = self._engine.group_name(group)
+        lowered = old_key is not None and (key is None or key < old_key)
+        for length in range(1, len(folded) + 1):
+            prefix = folded[:length]
+            best = self._prefixes.get(prefix, [])
+            if lowered and group in best:
+                # A group that didn't make the list before may belong in it now.
+                best = self._best_in_range(prefix)
+            else:
+                if group in best:
+                    best.remove(group)
+                if key is not None:
+                    best.append(group)
+                    best.sort(key=self._sort_key)
+                    del best[PERSONAL_PER_PREFIX:]
+            if best:
+                self._prefixes[prefix] = best
+            else:
+                self._prefixes.pop(prefix, None)
+
+    def _best_in_range(self, prefix: str) -> list[int]:
+        """Ranks every personal group starting with prefix from scratch."""
+        start, end = self._engine.prefix_range(prefix)
+        groups = self._ranked_groups[
+            bisect.bisect_left(self._ranked_groups, start) : bisect.bisect_left(self._ranked_groups, end)
+        ]
+        return heapq.nsmallest(PERSONAL_PER_PREFIX, groups, key=self._sort_key)
+
+    def _sort_key(self, group: int) -> tuple[float, int]:
+        return (-self._keys[group], group)
+
+
+class CompletionSession:
+    """
+    Completion state for one search entry.
+
+    Remembers the previous prefix, its range and, once the range is small
+    enough, the rank-ordered range itself. Typing more characters narrows
+    that state instead of searching the whole index again; deleting characters
+    or any other edit starts over. If a PersonalRanking is given, its lemmas
+    for the prefix come first.
+
+    A session is not thread-safe and must only be used from one thread at a time.
+    """
+
+    def __init__(self, engine: CompletionEngine, personal: PersonalRanking | None = None):
+        self._engine = engine
+        self._personal = personal
+        self.last_elapsed_ms: float = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        self._search_term: str | None = None
+        self._start = 0
+        self._end = 0
+        self._ranked: list[int] | None = None
+
+    def complete(self, text: str, limit: int) -> list[str]:
+        """Same as CompletionEngine.complete, narrowing from the previous call where possible."""
+        start_time = time.perf_counter()
+        if limit <= 0 or not text.strip():
+            self.reset()
+            return []
+
+        engine = self._engine
+        typed_prefix = text.lstrip()
+        search_term = typed_prefix.casefold()
+
+        narrowed = self._search_term is not None and search_term.startswith(self._search_term)
+        if narrowed:
+            start, end = engine.prefix_range(search_term, self._start, self._end)
+            if self._ranked is not None and search_term != self._search_term:
+                self._ranked = [group for group in self._ranked if engine._groups[group].startswith(search_term)]
+        else:
+            start, end = engine.prefix_range(search_term)
+            self._ranked = None
+
+        if self._ranked is None and end - start <= _SESSION_RANKED_MAX:
+            self._ranked = engine._rank_range(start, end)
+
+        self._search_term, self._start, self._end = search_term, start, end
+
+        groups = self._ranked[:limit] if self._ranked is not None else engine._top_groups(start, end, limit)
+        if self._personal is not None and (promoted := self._personal.top(search_term)):
+            promoted_set = set(promoted)
+            groups = (promoted + [group for group in groups if group not in promoted_set])[:limit]
+        items = [engine._group_display(group, typed_prefix) for group in groups]
+
+        self.last_elapsed_ms = (time.perf_counter() - start_time) * 1000
+        utils.log_debug(
+            f"Completion for '{text}' took {self.last_elapsed_ms:.3f} ms ({'narrowed' if narrowed else 'full'})"
+        )
+        return items
@@ -3,6 +3,10 @@
 
 """Constants module for Wordbook."""
 
+from __future__ import annotations
+
+from enum import Enum
+
 
 def _define(val: str, default: str) -> str:
     return default if val.startswith("@") else val
@@ -12,6 +16,10 @@ RES_PATH = "/dev/mufeed/Wordbook"
 
 WN_DB_VERSION = "oewn:2025+"
 WN_FILE_VERSION = _define("@WN_FILE_VERSION@", "dev")
+# Version of the search indexes scripts/generate-wn-db.py builds, and the database they
+# are kept in, next to wn.db. wn can't open a wn.db with tables of its own added to it.
+WN_INDEX_VERSION = 6
+WN_INDEX_FILENAME = "wordbook-index.db"
 
 POS_MAP = {
     "s": "adjective",
@@ -31,3 +39,35 @@ LIGHT_MODE_SENTENCE_COLOR = "blue"
 
 SEARCH_TERM_CLEANUP_CHARS = '<>"-?`![](){}/:;,'
 SEARCH_TERM_REPLACE_CHARS = ["(", ")", "<", ">", "[", "]", "&", "\\", "\n"]
+
+
+class PronunciationAccent(Enum):
+    """Enumeration of supported pronunciation accents."""
+
+    US = ("us", "American English")
+    GB = ("gb", "British English")
+
+    def __init__(self, code: str, display_name: str):
+        self.code = code
+        self.display_name = display_name
+
+    @classmethod
+    def from_code(cls, code: str) -> PronunciationAccent:
+        """Get accent enum from code string."""
+        for accent in cls:
+            if accent.code == code:
+                return accent
+        return cls.US  # Default fallback
+
+    @classmethod
+    def from_index(cls, index: int) -> PronunciationAccent:
+        """Get accent enum from index."""
+        accents = list(cls)
+        if 0 <= index < len(accents):
+            return accents[index]
+        return cls.US  # Default fallback
+
+    @property
+    def index(self) -> int:
+        """Get the index of this accent in the enum."""
+        return list(PronunciationAccent).index(self)
@@ -8,49 +8,70 @@ Handles extraction, versioning, and cleanup of compressed database files.
 
 import os
 import shutil
+import sqlite3
 import sys
+from contextlib import closing
 from pathlib import Path
 
 from gi.repository import GLib
 
 from wordbook import utils
-from wordbook.constants import WN_FILE_VERSION
+from wordbook.constants import WN_FILE_VERSION, WN_INDEX_FILENAME, WN_INDEX_VERSION
 
 if sys.version_info >= (3, 14):
     from compression import zstd
 else:
-    import backports.zstd as zstd
+    from backports import zstd
 
 
 class DatabaseManager:
     """Manages pre-built WordNet database extraction and versioning."""
 
     @staticmethod
-    def find_compressed_db() -> Path | None:
+    def _find_compressed(filename: str, description: str) -> Path | None:
         """
-        Search system data directories for versioned compressed database.
+        Search the build directory and system data directories for a compressed file.
 
         Returns:
-            Path to compressed database if found, None otherwise.
+            Path to the compressed file if found, None otherwise.
         """
-        filename = f"wn-{WN_FILE_VERSION}.db.zst"
-
         if "MESON_BUILD_ROOT" in os.environ:
             build_root = Path(os.environ["MESON_BUILD_ROOT"])
-            dev_db_path = build_root / "data" / filename
-            if dev_db_path.is_file():
-                utils.log_info(f"Found compressed database (dev): {dev_db_path}")
-                return dev_db_path
+            dev_path = build_root / "data" / filename
+            if dev_path.is_file():
+                utils.log_info(f"Found compressed {description} (dev): {dev_path}")
+                return dev_path
 
         for data_dir in GLib.get_system_data_dirs():
-            db_path = Path(data_dir) / "wordbook" / filename
-            if db_path.is_file():
-                utils.log_info(f"Found compressed database: {db_path}")
-                return db_path
+            path = Path(data_dir) / "wordbook" / filename
+            if path.is_file():
+                utils.log_info(f"Found compressed {description}: {path}")
+                return path
 
-        utils.log_warning(f"No compressed database found for version {WN_FILE_VERSION}")
+        utils.log_warning(f"No compressed {description} found for version {WN_FILE_VERSION}")
         return None
 
+    @staticmethod
+    def find_compressed_db() -> Path | None:
+        """
+        Search system data directories for versioned compressed database.
+
+        Returns:
+            Path to compressed database if found, None otherwise.
+        """
+        return DatabaseManager._find_compressed(f"wn-{WN_FILE_VERSION}.db.zst", "database")
+
+    @staticmethod
+    def find_compressed_index() -> Path | None:
+        """
+        Search system data directories for the versioned compressed search indexes.
+
+        Returns:
+            Path to the compressed search indexes if found, None otherwise.
+        """
+        stem = Path(WN_INDEX_FILENAME).stem
+        return DatabaseManager._find_compressed(f"{stem}-{WN_FILE_VERSION}.db.zst", "search indexes")
+
     @staticmethod
     def get_extracted_db_path() -> Path:
         """
@@ -62,20 +83,104 @@ class DatabaseManager:
         return Path(utils.DATA_DIR) / f"wn-{WN_FILE_VERSION}" / "wn.db"
 
     @staticmethod
-    def needs_extraction() -> bool:
+    def get_extracted_index_path() -> Path:
         """
-        Check if database needs to be extracted.
+        Get the path where the extracted search indexes should exist.
+
+        Returns:
+            Path to the search index database, next to the extracted database.
+        """
+        return DatabaseManager.get_extracted_db_path().with_name(WN_INDEX_FILENAME)
+
+    @staticmethod
+    def get_source_stamp_path() -> Path:
+        """
+        Get the path of the file recording which compressed search indexes were extracted.
+
+        Returns:
+            Path to the stamp file, next to the extracted search indexes.
+        """
+        index_path = DatabaseManager.get_extracted_index_path()
+        return index_path.with_name(f"{index_path.name}.source")
+
+    @staticmethod
+    def get_index_version(db_path: Path) -> int:
+        """
+        Get the version of the search indexes in a database.
+
+        Returns:
+            The index version, or 0 if the database has no search indexes.
+        """
+        try:
+            with closing(sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)) as connection:
+                row = connection.execute("SELECT value FROM wordbook_meta WHERE key = 'index_version'").fetchone()
+        except sqlite3.Error:
+            return 0
+        return int(row[0]) if row else 0
+
+    @staticmethod
+    def _source_stamp(compressed_path: Path) -> str:
+        """Identifies a compressed file by its path, size and modification time."""
+        stat = compressed_path.stat()
+        return f"{compressed_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def is_extracted_from(compressed_path: Path) -> bool:
+        """
+        Check if the extracted search indexes came from a compressed file.
+
+        Returns:
+            True if the compressed file is unchanged since it was last extracted, False otherwise.
+        """
+        try:
+            return DatabaseManager.get_source_stamp_path().read_text() == DatabaseManager._source_stamp(compressed_path)
+        except OSError:
+            return False
+
+    @staticmethod
+    def needs_db_extraction() -> bool:
+        """
+        Check if the WordNet database needs to be extracted.
 
         Returns:
             True if extraction is needed, False otherwise.
         """
         db_path = DatabaseManager.get_extracted_db_path()
-        exists = db_path.exists()
 
-        if not exists:
+        if not db_path.exists():
             utils.log_info(f"Database extraction needed for version {WN_FILE_VERSION}")
+            return True
 
-        return not exists
+        # Older versions added the search indexes to wn.db itself, which wn then refuses to open.
+        if DatabaseManager.get_index_version(db_path):
+            utils.log_info("Database extraction needed to remove search indexes from the database")
+            return True
+
+        return False
+
+    @staticmethod
+    def needs_index_extraction() -> bool:
+        """
+        Check if the search indexes need to be extracted.
+
+        Returns:
+            True if extraction is needed, False otherwise.
+        """
+        if DatabaseManager.get_index_version(DatabaseManager.get_extracted_index_path()) < WN_INDEX_VERSION:
+            utils.log_info(f"Search index extraction needed for version {WN_INDEX_VERSION}")
+            return True
+
+        return False
+
+    @staticmethod
+    def needs_extraction() -> bool:
+        """
+        Check if the database or its search indexes need to be extracted.
+
+        Returns:
+            True if extraction is needed, False otherwise.
+        """
+        return DatabaseManager.needs_db_extraction() or DatabaseManager.needs_index_extraction()
 
     @staticmethod
     def cleanup_old_versions() -> None:
@@ -98,17 +203,17 @@ class DatabaseManager:
                     utils.log_error(f"Failed to remove old database directory {item}: {e}")
 
     @staticmethod
-    def extract_database(compressed_path: Path) -> bool:
+    def extract_database(compressed_path: Path, db_path: Path) -> bool:
         """
-        Extract compressed database to user data directory.
+        Extract a compressed database to the user data directory.
 
         Args:
             compressed_path: Path to the compressed .zst file
+            db_path: Path to extract it to
 
         Returns:
             True if extraction succeeded, False otherwise.
         """
-        db_path = DatabaseManager.get_extracted_db_path()
         tmp_path = db_path.with_suffix(".tmp")
 
         try:
@@ -123,11 +228,30 @@ class DatabaseManager:
             utils.log_info("Database extraction complete")
             return True
 
-        except Exception as e:
+        except (OSError, zstd.ZstdError) as e:
             utils.log_error(f"Database extraction failed: {e}")
             tmp_path.unlink(missing_ok=True)
             return False
 
+    @staticmethod
+    def _setup_indexes() -> None:
+        """Extracts the search indexes if needed. WordNet lookups work without them, so failures are only logged."""
+        compressed_index = DatabaseManager.find_compressed_index()
+        if not compressed_index:
+            utils.log_warning("Searching without up to date search indexes")
+            return
+        index_path = DatabaseManager.get_extracted_index_path()
+        if index_path.exists() and DatabaseManager.is_extracted_from(compressed_index):
+            # Extracting it again wouldn't bring the search indexes up to date.
+            utils.log_warning("The installed compressed search indexes are outdated, keeping the extracted ones")
+            return
+
+        if DatabaseManager.extract_database(compressed_index, index_path):
+            try:
+                DatabaseManager.get_source_stamp_path().write_text(DatabaseManager._source_stamp(compressed_index))
+            except OSError as e:
+                utils.log_error(f"Failed to record the extracted search indexes: {e}")
+
     @staticmethod
     def setup() -> bool:
         """
@@ -138,18 +262,25 @@ class DatabaseManager:
             True if database is ready for use, False otherwise.
         """
         # Check if extraction needed
-        if not DatabaseManager.needs_extraction():
+        needs_db = DatabaseManager.needs_db_extraction()
+        needs_index = DatabaseManager.needs_index_extraction()
+        if not needs_db and not needs_index:
             utils.log_info("Database already up to date")
             return True
 
-        # Find compressed DB in system directories
-        compressed_db = DatabaseManager.find_compressed_db()
-        if not compressed_db:
-            utils.log_error("No compressed database found - installation may be incomplete")
-            return False
-
-        # Clean up old versions before extracting new one
+        # Clean up old versions before extracting new ones
         DatabaseManager.cleanup_old_versions()
 
-        # Extract new version
-        return DatabaseManager.extract_database(compressed_db)
+        if needs_db:
+            # Find compressed DB in system directories
+            compressed_db = DatabaseManager.find_compressed_db()
+            if not compressed_db:
+                utils.log_error("No compressed database found - installation may be incomplete")
+                return False
+            if not DatabaseManager.extract_database(compressed_db, DatabaseManager.get_extracted_db_path()):
+                return False
+
+        if needs_index:
+            DatabaseManager._setup_indexes()
+
+        return True
@@ -0,0 +1,317 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+The search history and favorites, kept in an SQLite database under DATA_DIR.
+
+Every term is stored once, keyed by the term itself, with how often and when
+it was last looked up. History is unbounded: the sidebar loads it a page at a
+time, and pages are read from an index so that loading the next page costs
+the same however long the history is.
+
+Terms can also be ordered by frecency, which weighs every lookup by how long
+ago it was, halving its weight every FRECENCY_HALF_LIFE seconds. Instead of a
+score that would have to be recomputed as time passes, each term stores
+log(sum of 2^(t / half-life)) over its lookup times t. That key grows by a
+constant for every term as time passes, so the order it gives never changes
+and can be indexed; it is only updated when the term is looked up again.
+
+History can be searched by typing some of the characters of a term in order,
+scored by fuzzy_score().
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+
+from wordbook import utils
+
+# Seconds after which a lookup counts half as much towards frecency.
+FRECENCY_HALF_LIFE = 30 * 24 * 60 * 60
+
+_FRECENCY_RATE = math.log(2) / FRECENCY_HALF_LIFE
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    term TEXT PRIMARY KEY,
+    lookups INTEGER NOT NULL,
+    last_seen REAL NOT NULL,
+    frecency REAL NOT NULL,
+    favorite INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS history_last_seen ON history (last_seen);
+CREATE INDEX IF NOT EXISTS history_frecency ON history (frecency);
+CREATE INDEX IF NOT EXISTS history_favorite_last_seen ON history (favorite, last_seen);
+CREATE INDEX IF NOT EXISTS history_favorite_frecency ON history (favorite, frecency);
+"""
+
+_COLUMNS = "term, lookups, last_seen, frecency, favorite"
+
+
+class HistoryOrder(Enum):
+    """Orders in which history can be paged, most relevant first. The value is the column sorted on."""
+
+    RECENT = "last_seen"
+    FRECENT = "frecency"
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    term: str
+    lookups: int
+    # Seconds since the epoch.
+    last_seen: float
+    frecency: float
+    favorite: bool
+
+    def frecency_score(self, now: float | None = None) -> float:
+        """Returns the number of lookups of the term, each weighed by how recent it was."""
+        return math.exp(self.frecency - frecency_key(time.time() if now is None else now))
+
+
+def frecency_key(when: float) -> float:
+    """Returns the frecency key of a single lookup at `when`, which is also what a key is compared with at that time."""
+    return when * _FRECENCY_RATE
+
+
+def _add_lookup(key: float, lookup_key: float) -> float:
+    """Adds a lookup to a frecency key, computing log(exp(key) + exp(lookup_key)) without overflowing."""
+    high, low = max(key, lookup_key), min(key, lookup_key)
+    return high + math.log1p(math.exp(low - high))
+
+
+def _to_entry(row: tuple) -> HistoryEntry:
+    term, lookups, last_seen, frecency, favorite = row
+    return HistoryEntry(term, lookups, last_seen, frecency, bool(favorite))
+
+
+def fuzzy_score(query: str, term: str) -> int | None:
+    """
+    Scores how well a term matches text typed with characters left out, such as "phtsyn" for "photosynthesis".
+
+    Args:
+        query: The casefolded text typed.
+        term: The term to match.
+
+    Returns:
+        None if the characters of query don't all appear in term in order. Otherwise a score that is higher
+        when they start words, follow each other and come early in the term.
+    """
+    folded = term.casefold()
+    score = 0
+    position = 0
+    for char in query:
+        index = folded.find(char, position)
+        if index < 0:
+            return None
+        if index == position and position > 0:
+            score += 2
+        if index == 0 or not folded[index - 1].isalnum():
+            score += 3
+        score -= index - position
+        position = index + 1
+    if folded.startswith(query):
+        score += 10
+    return score
+
+
+class HistoryStore:
+    """Reads and updates the history database. Safe to use from any thread."""
+
+    _instance: HistoryStore | None = None
+
+    def __init__(self, path: str):
+        """
+        Opens the history database, creating it if needed.
+
+        Args:
+            path: The database file. If it can't be opened, history is kept in memory for this session.
+        """
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._connection = self._connect(path)
+        except (OSError, sqlite3.Error) as e:
+            utils.log_error(f"Could not open the history database at {path}, history won't be saved: {e}")
+            self._connection = self._connect(":memory:")
+
+    @classmethod
+    def get(cls) -> HistoryStore:
+        """Get singleton instance of the store, under DATA_DIR."""
+        if cls._instance is None:
+            cls._instance = cls(os.path.join(utils.DATA_DIR, "history.db"))
+        return cls._instance
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.create_function("add_lookup", 2, _add_lookup, deterministic=True)
+        connection.create_function("casefold", 1, str.casefold, deterministic=True)
+        # With write-ahead logging, a commit appends to the log without waiting for the disk.
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        with connection:
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        return connection
+
+    def record_lookup(self, term: str, when: float | None = None) -> HistoryEntry:
+        """
+        Counts a lookup of term, adding it to the history if it is new.
+
+        Args:
+            term: The term looked up.
+            when: Time of the lookup in seconds since the epoch, now if not given.
+
+        Returns:
+            The updated entry.
+        """
+        when = time.time() if when is None else when
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO history (term, lookups, last_seen, frecency) VALUES (?, 1, ?, ?) "
+                "ON CONFLICT (term) DO UPDATE SET lookups = lookups + 1, "
+                "last_seen = max(last_seen, excluded.last_seen), frecency = add_lookup(frecency, excluded.frecency)",
+                (term, when, frecency_key(when)),
+            )
+            row = self._connection.execute(f"SELECT {_COLUMNS} FROM history WHERE term = ?", (term,)).fetchone()
+        return _to_entry(row)
+
+    def entry(self, term: str) -> HistoryEntry | None:
+        """Returns the entry of term, or None if it isn't in the history."""
+        with self._lock:
+            row = self._connection.execute(f"SELECT {_COLUMNS} FROM history WHERE term = ?", (term,)).fetchone()
+        return _to_entry(row) if row else None
+
+    def is_favorite(self, term: str) -> bool:
+        """Check if a term is favorited."""
+        with self._lock:
+            row = self._connection.execute("SELECT favorite FROM history WHERE term = ?", (term,)).fetchone()
+        return bool(row and row[0])
+
+    def set_favorite(self, term: str, favorite: bool) -> HistoryEntry:
+        """
+        Adds a term to or removes it from the favorites. A term that isn't in the history is added to it.
+
+        Returns:
+            The updated entry.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO history (term, lookups, last_seen, frecency, favorite) VALUES (?, 0, ?, ?, ?) "
+                "ON CONFLICT (term) DO UPDATE SET favorite = excluded.favorite",
+                (term, now, frecency_key(now), int(favorite)),
+            )
+            row = self._connection.execute(f"SELECT {_COLUMNS} FROM history WHERE term = ?", (term,)).fetchone()
+        return _to_entry(row)
+
+    def page(
+        self,
+        limit: int,
+        after: tuple[float, str] | None = None,
+        order: HistoryOrder = HistoryOrder.RECENT,
+        favorites_only: bool = False,
+    ) -> list[HistoryEntry]:
+        """
+        Reads a page of history, most relevant first.
+
+        Args:
+            limit: The most entries to return.
+            after: The sort key of the last entry of the previous page, as (last_seen or frecency, term).
+                The page starts right after it, so entries added since don't shift the pages.
+            order: What to sort on.
+            favorites_only: Whether to leave out terms that aren't favorites.
+
+        Returns:
+            Up to limit entries. Fewer means that there are no more.
+        """
+        column = order.value
+        conditions = []
+        parameters: list[object] = []
+        if favorites_only:
+            conditions.append("favorite = 1")
+        if after is not None:
+            conditions.append(f"({column}, term) < (?, ?)")
+            parameters.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM history {where} ORDER BY {column} DESC, term DESC LIMIT ?",
+                (*parameters, limit),
+            ).fetchall()
+        return [_to_entry(row) for row in rows]
+
+    def search(self, query: str, limit: int) -> list[HistoryEntry]:
+        """
+        Finds the terms that fuzzy_score() matches against query, most recent first.
+
+        Args:
+            query: The casefolded text typed.
+            limit: The most entries to return.
+        """
+        pattern = "%" + "%".join("\\" + char if char in "\\%_" else char for char in query) + "%"
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM history WHERE casefold(term) LIKE ? ESCAPE '\\' "
+                "ORDER BY last_seen DESC, term DESC LIMIT ?",
+                (pattern, limit),
+            ).fetchall()
+        return [_to_entry(row) for row in rows]
+
+    def count(self) -> int:
+        """Returns the number of terms in the history."""
+        with self._lock:
+            return self._connection.execute("SELECT count(*) FROM history").fetchone()[0]
+
+    def clear(self) -> list[HistoryEntry]:
+        """
+        Removes every term that isn't a favorite.
+
+        Returns:
+            The removed entries, which can be passed to restore() to undo.
+        """
+        with self._lock, self._connection:
+            rows = self._connection.execute(f"SELECT {_COLUMNS} FROM history WHERE favorite = 0").fetchall()
+            self._connection.execute("DELETE FROM history WHERE favorite = 0")
+        return [_to_entry(row) for row in rows]
+
+    def restore(self, entries: Iterable[HistoryEntry]) -> None:
+        """Puts back entries removed by clear(), keeping any lookups made since."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO history (term, lookups, last_seen, frecency, favorite) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (term) DO UPDATE SET lookups = lookups + excluded.lookups, "
+                "last_seen = max(last_seen, excluded.last_seen), frecency = add_lookup(frecency, excluded.frecency)",
+                [(e.term, e.lookups, e.last_seen, e.frecency, int(e.favorite)) for e in entries],
+            )
+
+    def import_terms(self, history: list[str], favorites: list[str]) -> None:
+        """
+        Adds history kept in the settings file by earlier versions.
+
+        Args:
+            history: Terms, most recent first. Their times are made up a second apart, keeping the order.
+            favorites: Terms to mark as favorites.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO history (term, lookups, last_seen, frecency) VALUES (?, 1, ?, ?) "
+                "ON CONFLICT (term) DO NOTHING",
+                [(term, now - index, frecency_key(now - index)) for index, term in enumerate(history)],
+            )
+            self._connection.executemany(
+                "INSERT INTO history (term, lookups, last_seen, frecency, favorite) VALUES (?, 0, ?, ?, 1) "
+                "ON CONFLICT (term) DO UPDATE SET favorite = 1",
+                [(term, now - len(history), frecency_key(now - len(history))) for term in favorites],
+            )
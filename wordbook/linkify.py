@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Finding the words and multi-word expressions of a text that can be looked up.
+
+scripts/generate-wn-db.py stores, in the search index database, a mapping
+from every lemma, lemma variant and inflected word used in a gloss to the
+lemma it should look up. Given that mapping, a text is linked by longest
+match: at each word, the longest run of up to MAX_PHRASE_WORDS words that
+the mapping knows wins, so "ad hoc" links as one expression rather than as
+"ad" and "hoc".
+
+This module has no GTK or WordNet dependencies, so that the generator and
+the application tokenize text the same way.
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+# Words, including ones joined by apostrophes or hyphens such as "o'clock" and "well-known".
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:['’-][^\W_]+)*")
+
+# Longest multi-word expression, in words, that is matched.
+MAX_PHRASE_WORDS = 5
+
+# Words too common to link on their own, or to tell glosses apart in a reverse lookup.
+STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "their",
+        "this",
+        "to",
+        "with",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Link:
+    start: int
+    end: int
+    lemma: str
+
+
+def phrase_key(text: str) -> str:
+    """Returns the casefolded words of text joined by single spaces, the form in which expressions are matched."""
+    return " ".join(token.casefold() for token in TOKEN_PATTERN.findall(text))
+
+
+def _token_runs(text: str) -> list[list[re.Match[str]]]:
+    """Splits the tokens of text into runs separated only by whitespace, since expressions don't span punctuation."""
+    runs: list[list[re.Match[str]]] = []
+    previous_end = None
+    for match in TOKEN_PATTERN.finditer(text):
+        if previous_end is None or text[previous_end : match.start()].strip():
+            runs.append([])
+        runs[-1].append(match)
+        previous_end = match.end()
+    return runs
+
+
+def _phrase(run: list[re.Match[str]], start: int, length: int) -> str:
+    return " ".join(match.group().casefold() for match in run[start : start + length])
+
+
+def candidate_phrases(text: str) -> set[str]:
+    """Returns every casefolded word and expression in text that could have a lemma."""
+    phrases = set()
+    for run in _token_runs(text):
+        for start in range(len(run)):
+            for length in range(1, min(MAX_PHRASE_WORDS, len(run) - start) + 1):
+                phrases.add(_phrase(run, start, length))
+    return phrases
+
+
+def find_links(text: str, token_lemmas: Mapping[str, str]) -> list[Link]:
+    """
+    Finds the longest linkable expressions in text, left to right.
+
+    Args:
+        text: The text to link.
+        token_lemmas: Maps casefolded words and expressions to the lemmas they look up.
+            Only the entries for candidate_phrases(text) are needed.
+
+    Returns:
+        The links, in order and without overlaps.
+    """
+    links = []
+    for run in _token_runs(text):
+        start = 0
+        while start < len(run):
+            for length in range(min(MAX_PHRASE_WORDS, len(run) - start), 0, -1):
+                phrase = _phrase(run, start, length)
+                lemma = token_lemmas.get(phrase)
+                if lemma is None or (length == 1 and phrase in STOPWORDS):
+                    continue
+                links.append(Link(run[start].start(), run[start + length - 1].end(), lemma))
+                start += length
+                break
+            else:
+                start += 1
+    return links
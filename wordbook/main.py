@@ -9,12 +9,12 @@ import gi
 gi.require_version("Gdk", "4.0")
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, Gio, GLib, Gtk  # noqa
+from gi.repository import Adw, Gio, GLib, Gtk
 
-from wordbook import base, utils  # noqa
-from wordbook.constants import RES_PATH  # noqa
-from wordbook.window import WordbookWindow  # noqa
-from wordbook.settings import Settings  # noqa
+from wordbook import base, utils
+from wordbook.constants import RES_PATH
+from wordbook.settings import Settings
+from wordbook.window import WordbookWindow
 
 
 class Application(Adw.Application):
@@ -143,6 +143,8 @@ class Application(Adw.Application):
         """GApplication lifecycle method called on every clean shutdown path."""
         if self.win is not None:
             self.win.save_state()
+            self.win.shutdown()
+        Settings.get().flush()
         Adw.Application.do_shutdown(self)
 
     def on_about(self, _action, _param):
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Crossword-style pattern search over the WordNet lemma list, independent of GTK.
+
+A pattern matches whole lemmas, case-insensitively: "?" stands for exactly
+one character and "*" for any number of characters, so "c?t", "*ology" and
+"un*able" all work.
+
+Lemmas are indexed by their trigrams, with "^" and "$" marking the start and
+end of a lemma. The literal runs of a pattern give trigrams every match must
+contain, and the lemmas containing all of them are the candidates that are
+checked against the pattern. Results are produced lazily in alphabetical
+order, so a caller can show the first page of a huge result set without
+materializing the rest.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import sys
+import threading
+from array import array
+from collections.abc import Iterator
+
+from wordbook import utils
+
+WILDCARDS = frozenset("?*")
+
+_NGRAM = 3
+
+
+def is_pattern(text: str) -> bool:
+    """Checks whether text contains any wildcard."""
+    return not WILDCARDS.isdisjoint(text)
+
+
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    parts = []
+    for char in pattern:
+        if char == "?":
+            parts.append(".")
+        elif char == "*":
+            parts.append(".*")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts), re.DOTALL)
+
+
+def _required_ngrams(pattern: str) -> set[str]:
+    """Returns the trigrams that every lemma matching a casefolded pattern contains."""
+    anchored = f"^{pattern}$"
+    ngrams = set()
+    for run in re.split(r"[?*]", anchored):
+        ngrams.update(run[i : i + _NGRAM] for i in range(len(run) - _NGRAM + 1))
+    return ngrams
+
+
+class PatternIndex:
+    """Trigram index over the lemma list for wildcard searches. Built on the first search."""
+
+    def __init__(self, wordlist: list[str]):
+        """
+        Args:
+            wordlist: The lemma list, sorted case-insensitively like CompletionEngine.wordlist.
+        """
+        self._wordlist = wordlist
+        self._folded: list[str] = []
+        self._postings: dict[str, array] = {}
+        self._lengths: dict[int, array] = {}
+        self._built = False
+        self._build_lock = threading.Lock()
+
+    def _ensure_built(self) -> None:
+        with self._build_lock:
+            if self._built:
+                return
+
+            postings: dict[str, array] = {}
+            lengths: dict[int, array] = {}
+            for index, word in enumerate(self._wordlist):
+                folded = word.casefold()
+                self._folded.append(folded)
+                lengths.setdefault(len(folded), array("I")).append(index)
+                anchored = f"^{folded}$"
+                for ngram in {anchored[i : i + _NGRAM] for i in range(len(anchored) - _NGRAM + 1)}:
+                    postings.setdefault(ngram, array("I")).append(index)
+
+            self._postings = postings
+            self._lengths = lengths
+            self._built = True
+            utils.log_info(f"Pattern index built ({len(postings)} trigrams over {len(self._wordlist)} lemmas).")
+
+    def search(self, pattern: str) -> Iterator[str]:
+        """
+        Yields the lemmas matching a pattern, in alphabetical order.
+
+        The iterator does the work as it is consumed, so taking one page at a
+        time only scans as far as that page needs.
+        """
+        self._ensure_built()
+
+        folded_pattern = pattern.casefold()
+        regex = _compile_pattern(folded_pattern)
+
+        required = _required_ngrams(folded_pattern)
+        if any(ngram not in self._postings for ngram in required):
+            return
+
+        if required:
+            postings = sorted((self._postings[ngram] for ngram in required), key=len)
+            candidates: Iterator[int] = self._intersect(postings[0], postings[1:])
+        elif prefix := re.split(r"[?*]", folded_pattern, maxsplit=1)[0]:
+            # Too short to contain a trigram, but the literal prefix is a range of the sorted list.
+            start = bisect.bisect_left(self._folded, prefix)
+            end = bisect.bisect_right(self._folded, f"{prefix}{chr(sys.maxunicode)}", start)
+            candidates = iter(range(start, end))
+        elif "*" not in folded_pattern:
+            # Only "?" and too few literal characters: the length is fixed.
+            candidates = iter(self._lengths.get(len(folded_pattern), ()))
+        else:
+            candidates = iter(range(len(self._folded)))
+
+        for index in candidates:
+            if regex.fullmatch(self._folded[index]):
+                yield self._wordlist[index]
+
+    @staticmethod
+    def _intersect(smallest: array, others: list[array]) -> Iterator[int]:
+        """Yields the ids in the smallest posting list that are in all the others, using binary search."""
+        starts = [0] * len(others)
+        for index in smallest:
+            for position, other in enumerate(others):
+                found = bisect.bisect_left(other, index, starts[position])
+                starts[position] = found
+                if found == len(other) or other[found] != index:
+                    break
+            else:
+                yield index
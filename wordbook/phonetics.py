@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Phonetic keys for IPA pronunciations, used by the rhyme and sound-alike search.
+
+This module has no GTK or WordNet dependencies, so that the keys that
+scripts/generate-wn-db.py stores in the search index database and the ones
+computed at query time always agree.
+Both go through phonetic_keys().
+"""
+
+import unicodedata
+
+# Characters that start a syllable nucleus in the English IPA used by WordNet and espeak-ng.
+IPA_VOWELS = frozenset("aeiouyæɑɒɔəɐɚɛɜɝɪʊʌɘɵɤɯøœɨʉ")
+
+PRIMARY_STRESS = "ˈ"
+
+# Marks that don't change which sounds are spoken, including the phoneme
+# separators and ties in the output of espeak-ng's --ipa option.
+_IGNORED_MARKS = str.maketrans("", "", "ˈˌ.‿|‖ /[]_\u200d\u0361\u035c")
+
+# Symbols that the WordNet data and espeak-ng write differently for the same English sound.
+_EQUIVALENT_SYMBOLS = str.maketrans(
+    {
+        "g": "ɡ",
+        "r": "ɹ",
+        ":": "ː",
+        "'": "ˈ",
+        "ᵻ": "ɪ",
+        "ɐ": "ə",
+        # Syllabic consonants, as in "button", are marked by the data but not always by espeak-ng.
+        "\u0329": None,
+    }
+)
+
+
+def normalize_ipa(ipa: str) -> str:
+    """Writes a pronunciation from the WordNet data or from espeak-ng with the same symbols."""
+    return unicodedata.normalize("NFC", ipa.strip().strip("/[]")).translate(_EQUIVALENT_SYMBOLS)
+
+
+def phonetic_keys(ipa: str) -> tuple[str, str]:
+    """
+    Returns the rhyme key and the sound key of a pronunciation.
+
+    Use this rather than rhyme_key() and sound_key() on their own, so that the
+    keys of stored pronunciations and of espeak-ng output can be compared.
+    """
+    normalized = normalize_ipa(ipa)
+    return rhyme_key(normalized), sound_key(normalized)
+
+
+def sound_key(ipa: str) -> str:
+    """
+    Returns the phoneme sequence of a pronunciation, without stress, syllable or word boundaries.
+
+    Words with the same sound key are homophones.
+    """
+    return ipa.translate(_IGNORED_MARKS)
+
+
+def rhyme_key(ipa: str) -> str:
+    """
+    Returns the part of a pronunciation that must match for a perfect rhyme.
+
+    That is everything from the vowel of the last stressed syllable onwards,
+    or from the last vowel if the pronunciation has no stress marks.
+    """
+    stripped = ipa.strip().strip("/[]")
+    stress = stripped.rfind(PRIMARY_STRESS)
+    if stress >= 0:
+        tail = sound_key(stripped[stress:])
+        for position, char in enumerate(tail):
+            if char in IPA_VOWELS:
+                return tail[position:]
+        return tail
+
+    sounds = sound_key(stripped)
+    position = len(sounds) - 1
+    while position >= 0 and sounds[position] not in IPA_VOWELS:
+        position -= 1
+    # Include the whole vowel, such as both letters of a diphthong.
+    while position > 0 and sounds[position - 1] in IPA_VOWELS:
+        position -= 1
+    return sounds[max(position, 0) :]
+
+
+def normalize_variety(variety: str | None) -> str:
+    """Normalizes a pronunciation variety, such as "GB" or "US", for comparison with an accent code."""
+    if not variety:
+        return ""
+    return variety.strip().casefold()
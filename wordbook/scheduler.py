@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+A bounded pool of worker threads that always starts the most urgent job first.
+
+Jobs are plain callables. Within a priority they start in submission order;
+a job that is already running is never interrupted. To keep the user from
+waiting on background work, one worker is kept free for foreground jobs, and
+idle jobs don't start while any foreground job is queued or running.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import IntEnum
+
+from wordbook import utils
+
+# Foreground jobs that wait longer than this to start are logged, in seconds.
+SLOW_FOREGROUND_WAIT = 0.1
+
+
+class Priority(IntEnum):
+    # Work the user is waiting for, such as the search they just made.
+    FOREGROUND = 0
+    # Work the user will notice soon, such as completions and speech.
+    NORMAL = 1
+    # Work done ahead of time, such as prerendering audio.
+    IDLE = 2
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """Load of one priority level. Wait times are from submission until the job started, in seconds."""
+
+    queued: int
+    running: int
+    started: int
+    mean_wait: float
+    max_wait: float
+
+
+class WorkerPool:
+    """Runs jobs on up to max_workers threads, started as they are needed."""
+
+    def __init__(self, max_workers: int, name: str):
+        if max_workers < 1:
+            raise ValueError("A worker pool needs at least one worker")
+        self._max_workers = max_workers
+        # Background jobs never take the last worker, unless there is only one.
+        self._max_background = max(1, max_workers - 1)
+        self._name = name
+        self._queue: list[tuple[int, int, float, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._idle_workers = 0
+        self._shut_down = False
+
+        # Queued or running foreground jobs, which hold back idle ones.
+        self._foreground_jobs = 0
+        self._running = dict.fromkeys(Priority, 0)
+        self._started = dict.fromkeys(Priority, 0)
+        self._total_wait = dict.fromkeys(Priority, 0.0)
+        self._max_wait = dict.fromkeys(Priority, 0.0)
+
+    def submit(self, priority: Priority, job: Callable[[], None]) -> bool:
+        """
+        Queues a job.
+
+        Returns:
+            False if the job was dropped because the pool has been shut down, True otherwise.
+        """
+        with self._condition:
+            if self._shut_down:
+                return False
+            heapq.heappush(self._queue, (priority, next(self._counter), time.monotonic(), job))
+            if priority is Priority.FOREGROUND:
+                self._foreground_jobs += 1
+            if self._idle_workers == 0 and len(self._workers) < self._max_workers:
+                worker = threading.Thread(target=self._work, name=f"{self._name}-{len(self._workers)}", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            else:
+                self._condition.notify_all()
+        return True
+
+    def stats(self) -> dict[Priority, QueueStats]:
+        """Returns the queue depth, running jobs and wait times of every priority."""
+        with self._condition:
+            queued = dict.fromkeys(Priority, 0)
+            for priority, *_rest in self._queue:
+                queued[Priority(priority)] += 1
+            return {
+                priority: QueueStats(
+                    queued=queued[priority],
+                    running=self._running[priority],
+                    started=self._started[priority],
+                    mean_wait=self._total_wait[priority] / self._started[priority] if self._started[priority] else 0.0,
+                    max_wait=self._max_wait[priority],
+                )
+                for priority in Priority
+            }
+
+    def shutdown(self) -> list[Callable[[], None]]:
+        """
+        Drops the queued jobs and lets the workers exit once their current job is done.
+
+        Returns:
+            The jobs that were dropped without being started, most urgent first.
+        """
+        with self._condition:
+            self._shut_down = True
+            self._foreground_jobs -= sum(priority is Priority.FOREGROUND for priority, *_rest in self._queue)
+            dropped = [job for *_rest, job in sorted(self._queue)]
+            self._queue.clear()
+            self._condition.notify_all()
+        return dropped
+
+    def _can_start(self, priority: Priority) -> bool:
+        """Must be called with the condition held."""
+        if priority is Priority.FOREGROUND:
+            return True
+        if self._running[Priority.NORMAL] + self._running[Priority.IDLE] >= self._max_background:
+            return False
+        return priority is not Priority.IDLE or self._foreground_jobs == 0
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                self._idle_workers += 1
+                # The first queued job is the most urgent, so if it can't start, none can.
+                while not self._shut_down and not (self._queue and self._can_start(Priority(self._queue[0][0]))):
+                    self._condition.wait()
+                self._idle_workers -= 1
+                if self._shut_down:
+                    return
+                priority, _order, submitted, job = heapq.heappop(self._queue)
+                priority = Priority(priority)
+                wait = time.monotonic() - submitted
+                self._running[priority] += 1
+                self._started[priority] += 1
+                self._total_wait[priority] += wait
+                self._max_wait[priority] = max(self._max_wait[priority], wait)
+
+            if priority is Priority.FOREGROUND and wait > SLOW_FOREGROUND_WAIT:
+                utils.log_warning(f"A foreground job waited {wait * 1000:.0f} ms to start.")
+
+            try:
+                job()
+            except Exception as e:  # noqa: BLE001 - a failing job mustn't take its worker down with it
+                utils.log_error(f"Background job failed: {e}")
+            finally:
+                with self._condition:
+                    self._running[priority] -= 1
+                    if priority is Priority.FOREGROUND:
+                        self._foreground_jobs -= 1
+                    self._condition.notify_all()
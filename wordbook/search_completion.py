@@ -1,10 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import Protocol
 
 from gi.repository import Gdk, GLib, Gtk, Pango
 
 
+class CancellableQuery(Protocol):
+    def cancel(self) -> None: ...
+
+
+ItemProvider = Callable[[str, int], list[str]]
+# Called with the text, the item limit and a callback taking (text, items). The
+# callback may be invoked from any thread. Returns a handle to cancel the query.
+AsyncItemProvider = Callable[[str, int, Callable[[str, list[str]], None]], CancellableQuery | None]
+
+
 class SearchCompletion:
     _ENTRY_CLASS = "completion-entry"
     _ENTRY_ACTIVE_CLASS = "completion-active"
@@ -14,13 +25,19 @@ class SearchCompletion:
         self,
         parent: Gtk.Widget,
         entry: Gtk.Entry,
-        item_provider: Callable[[str, int], list[str]],
+        item_provider: ItemProvider | None,
         activate: Callable[[str], None],
+        async_item_provider: AsyncItemProvider | None = None,
     ) -> None:
+        if (item_provider is None) == (async_item_provider is None):
+            raise ValueError("Exactly one of item_provider and async_item_provider must be given")
+
         self._parent = parent
         self._entry = entry
         self._entry.add_css_class(self._ENTRY_CLASS)
         self._item_provider = item_provider
+        self._async_item_provider = async_item_provider
+        self._pending_query: CancellableQuery | None = None
         self._activate = activate
         self._enabled = False
         self._items: list[str] = []
@@ -67,11 +84,40 @@ class SearchCompletion:
             self.clear()
 
     def update(self, text: str) -> None:
-        if not self._enabled or not text.strip() or not self.entry_has_focus():
+        self._cancel_pending_query()
+        if not self._can_show(text):
             self.hide()
             return
 
-        self._items = self._item_provider(text, self._MAX_ITEMS)
+        if self._async_item_provider is not None:
+            self._pending_query = self._async_item_provider(text, self._MAX_ITEMS, self._on_async_items_ready)
+            return
+
+        self._show_items(self._item_provider(text, self._MAX_ITEMS))
+
+    def _can_show(self, text: str) -> bool:
+        return self._enabled and bool(text.strip()) and self.entry_has_focus()
+
+    def _cancel_pending_query(self) -> None:
+        if self._pending_query is not None:
+            self._pending_query.cancel()
+            self._pending_query = None
+
+    def _on_async_items_ready(self, text: str, items: list[str]) -> None:
+        GLib.idle_add(self._apply_async_items, text, items)
+
+    def _apply_async_items(self, text: str, items: list[str]) -> bool:
+        # Drop responses for text that has since been edited, so a slow query
+        # never overwrites the results for what the user is typing now.
+        if text != self._entry.get_text():
+            return False
+        self._pending_query = None
+        if self._can_show(text):
+            self._show_items(items)
+        return False
+
+    def _show_items(self, items: list[str]) -> None:
+        self._items = items
         self._listbox.remove_all()
         if not self._items:
             self.hide()
@@ -90,6 +136,7 @@ class SearchCompletion:
         self._entry.grab_focus_without_selecting()
 
     def clear(self) -> None:
+        self._cancel_pending_query()
         self._items = []
         self._listbox.remove_all()
         self.hide()
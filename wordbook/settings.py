@@ -5,45 +5,16 @@ from __future__ import annotations
 
 import json
 import os
-from enum import Enum
+import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
 from wordbook import utils
-
-
-class PronunciationAccent(Enum):
-    """Enumeration of supported pronunciation accents."""
-
-    US = ("us", "American English")
-    GB = ("gb", "British English")
-
-    def __init__(self, code: str, display_name: str):
-        self.code = code
-        self.display_name = display_name
-
-    @classmethod
-    def from_code(cls, code: str) -> "PronunciationAccent":
-        """Get accent enum from code string."""
-        for accent in cls:
-            if accent.code == code:
-                return accent
-        return cls.US  # Default fallback
-
-    @classmethod
-    def from_index(cls, index: int) -> "PronunciationAccent":
-        """Get accent enum from index."""
-        accents = list(cls)
-        if 0 <= index < len(accents):
-            return accents[index]
-        return cls.US  # Default fallback
-
-    @property
-    def index(self) -> int:
-        """Get the index of this accent in the enum."""
-        return list(PronunciationAccent).index(self)
+from wordbook.constants import PronunciationAccent
 
 
 class BehaviorSettings(BaseModel):
@@ -72,18 +43,12 @@ class AppearanceSettings(BaseModel):
 class StateSettings(BaseModel):
     """State settings."""
 
+    # Kept by earlier versions, and moved into the history store on the next launch.
     history: list[str] = Field(default_factory=list, description="Search history")
     favorites: list[str] = Field(default_factory=list, description="Favorite search terms")
     window_width: int = Field(default=400, description="Window width")
     window_height: int = Field(default=600, description="Window height")
 
-    @field_validator("history")
-    @classmethod
-    def validate_history(cls, v: list[str]) -> list[str]:
-        """Validate and limit history size."""
-        # Keep only last 20 items
-        return v[-20:] if len(v) > 20 else v
-
 
 class WordbookSettings(BaseModel):
     """Main settings model for Wordbook application."""
@@ -93,9 +58,80 @@ class WordbookSettings(BaseModel):
     state: StateSettings = Field(default_factory=StateSettings)
 
 
+class _SettingsWriter:
+    """
+    Writes settings to disk on a background thread.
+
+    A write waits until no change has been scheduled for `delay` seconds, so a
+    burst of changes, such as toggling a switch back and forth, is written once.
+    Every write replaces the file atomically.
+    """
+
+    def __init__(self, path: Path, delay: float):
+        self._path = path
+        self._delay = delay
+        self._condition = threading.Condition()
+        # Held while taking and writing a snapshot, so that an older snapshot never overwrites a newer one.
+        self._write_lock = threading.Lock()
+        self._pending: dict[str, Any] | None = None
+        self._deadline = 0.0
+        self._thread: threading.Thread | None = None
+        self.writes = 0
+
+    def schedule(self, data: dict[str, Any]) -> None:
+        """Queues a snapshot of the settings, replacing any that hasn't been written yet."""
+        with self._condition:
+            self._pending = data
+            self._deadline = time.monotonic() + self._delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def flush(self) -> None:
+        """Writes the pending snapshot, if any, before returning."""
+        with self._write_lock:
+            self._write_pending()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                while (remaining := self._deadline - time.monotonic()) > 0:
+                    self._condition.wait(remaining)
+            with self._write_lock:
+                self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Must be called with the write lock held."""
+        with self._condition:
+            data, self._pending = self._pending, None
+        if data is None:
+            return
+
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._path)
+            self.writes += 1
+            utils.log_debug("Settings saved successfully")
+        except (OSError, TypeError, ValueError) as e:
+            utils.log_error(f"Failed to save settings: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+
 class Settings:
     """Manages all the settings of the application using Pydantic models."""
 
+    # Seconds without changes before settings are written.
+    SAVE_DELAY = 0.5
+
     _autosave_disabled: bool = False
     _instance: Settings | None = None
     _settings: WordbookSettings
@@ -104,6 +140,7 @@ class Settings:
         """Initialize settings."""
         self._autosave_disabled = True
         self._config_file: Path = Path(utils.CONFIG_FILE)
+        self._writer = _SettingsWriter(self._config_file, self.SAVE_DELAY)
 
         # Ensure config directory exists
         os.makedirs(utils.CONFIG_DIR, exist_ok=True)
@@ -112,7 +149,7 @@ class Settings:
         self._autosave_disabled = False
 
     def __setattr__(self, name: str, value: Any) -> None:
-        """Override setattr to automatically save settings when properties are changed."""
+        """Override setattr to automatically schedule a save when properties are changed."""
         super().__setattr__(name, value)
         # Auto-save after setting any property
         # Avoid during initialization or for private attributes
@@ -144,20 +181,19 @@ class Settings:
             self._settings = WordbookSettings.model_validate(data)
             utils.log_info("Loaded settings from JSON configuration")
 
-        except Exception as e:
+        except (OSError, ValueError) as e:
             utils.log_error(f"Failed to load JSON settings: {e}")
             utils.log_info("Creating default settings")
             self._settings = WordbookSettings()
             self._save_settings()
 
     def _save_settings(self) -> None:
-        """Save settings to JSON file."""
-        try:
-            with open(self._config_file, "w") as f:
-                json.dump(self._settings.model_dump(), f, indent=4)
-            utils.log_debug("Settings saved successfully")
-        except Exception as e:
-            utils.log_error(f"Failed to save settings: {e}")
+        """Schedule saving settings to the JSON file, coalescing it with other changes made shortly after."""
+        self._writer.schedule(self._settings.model_dump())
+
+    def flush(self) -> None:
+        """Write scheduled changes to disk now. Called on shutdown."""
+        self._writer.flush()
 
     # Behavior settings properties
     @property
@@ -214,7 +250,7 @@ class Settings:
     # State settings properties
     @property
     def history(self) -> list[str]:
-        """Get search history."""
+        """Get the search history left by earlier versions."""
         return self._settings.state.history.copy()
 
     @history.setter
@@ -222,13 +258,9 @@ class Settings:
         """Set search history."""
         self._settings.state.history = value
 
-    def clear_history(self) -> None:
-        """Clear search history."""
-        self._settings.state.history = []
-
     @property
     def favorites(self) -> list[str]:
-        """Get favorites."""
+        """Get the favorites left by earlier versions."""
         return self._settings.state.favorites.copy()
 
     @favorites.setter
@@ -236,20 +268,6 @@ class Settings:
         """Set favorites."""
         self._settings.state.favorites = value
 
-    def add_favorite(self, term: str) -> None:
-        """Add a term to favorites."""
-        if term not in self._settings.state.favorites:
-            self._settings.state.favorites.append(term)
-
-    def remove_favorite(self, term: str) -> None:
-        """Remove a term from favorites."""
-        if term in self._settings.state.favorites:
-            self._settings.state.favorites.remove(term)
-
-    def is_favorite(self, term: str) -> bool:
-        """Check if a term is favorited."""
-        return term in self._settings.state.favorites
-
     @property
     def window_width(self) -> int:
         """Get window width."""
@@ -8,8 +8,8 @@ from typing import TYPE_CHECKING
 
 from gi.repository import Adw, Gtk
 
-from wordbook.constants import RES_PATH
-from wordbook.settings import PronunciationAccent, Settings
+from wordbook.constants import RES_PATH, PronunciationAccent
+from wordbook.settings import Settings
 
 if TYPE_CHECKING:
     from wordbook.window import WordbookWindow
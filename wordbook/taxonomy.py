@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2016-2026 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Layout of the taxonomy table that scripts/generate-wn-db.py adds to the search index database.
+
+Every synset gets an integer node ID. For each relation below, the nodes a
+synset points to are stored as a packed array of little-endian 32-bit
+integers, so expanding a node is a single primary key lookup instead of
+walking WordNet relations.
+
+This module has no GTK or WordNet dependencies, so that the generator and
+the application always agree on the format.
+"""
+
+import sys
+from array import array
+
+# Table columns and the WordNet relations merged into each.
+RELATIONS: dict[str, tuple[str, ...]] = {
+    "hypernyms": ("hypernym", "instance_hypernym"),
+    "hyponyms": ("hyponym", "instance_hyponym"),
+    "meronyms": ("mero_part", "mero_member", "mero_substance"),
+    "holonyms": ("holo_part", "holo_member", "holo_substance"),
+}
+
+
+def pack_nodes(nodes: list[int]) -> bytes:
+    """Packs node IDs into the stored array format."""
+    packed = array("i", nodes)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_nodes(blob: bytes) -> array:
+    """Unpacks node IDs stored by pack_nodes()."""
+    nodes = array("i")
+    nodes.frombytes(blob)
+    if sys.byteorder == "big":
+        nodes.byteswap()
+    return nodes
@@ -5,6 +5,7 @@
 This module provides project-wide utilities, including:
 - Global constants for important file paths (CONFIG_DIR, DATA_DIR, etc.).
 - A centralized logging setup with helper functions.
+- A small thread-safe LRU cache.
 """
 
 from __future__ import annotations
@@ -12,7 +13,11 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import threading
 import traceback
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
 
 from gi.repository import GLib
 
@@ -76,3 +81,43 @@ def log_warning(message: str) -> None:
         trace = traceback.format_exc()
         if "NoneType: None" not in trace:
             LOGGER.warning(trace)
+
+
+class LRUCache:
+    """A bounded, thread-safe mapping that evicts the least recently used entries."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the cached value for a key, or None if it isn't cached."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Caches a value, evicting the oldest entry if the cache is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
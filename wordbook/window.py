@@ -3,29 +3,38 @@
 
 from __future__ import annotations
 
-import bisect
+import functools
 import random
 import sys
-import threading
 from enum import Enum, auto
 from gettext import gettext as _
+from gettext import ngettext
 from typing import TYPE_CHECKING
 
 from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk, Pango
-from rapidfuzz import fuzz, process
 
 from wordbook import base, utils
+from wordbook.backend import MATCHES_PAGE_SIZE, Backend, is_cancelled
 from wordbook.constants import RES_PATH
-from wordbook.database import DatabaseManager
+from wordbook.history import HistoryEntry, HistoryStore, fuzzy_score
+from wordbook.linkify import Link
+from wordbook.scheduler import Priority
 from wordbook.search_completion import SearchCompletion
 from wordbook.settings import Settings
 from wordbook.settings_window import SettingsDialog
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from typing import Any
 
     from wordbook.main import Application
 
+# History terms loaded into the sidebar at a time.
+HISTORY_PAGE_SIZE = 100
+
+# Most matching terms loaded into the sidebar when its history is searched.
+HISTORY_SEARCH_LIMIT = 500
+
 
 class SearchStatus(Enum):
     NONE = auto()
@@ -42,14 +51,45 @@ class Page(str, Enum):
     WELCOME = "welcome_page"
 
 
+class PronunciationControls:
+    """The IPA label and play button of a header row, updated in place when the accent changes."""
+
+    def __init__(self, lemma: str, pronunciation: base.PronunciationInfo, label: Gtk.Label):
+        self.lemma = lemma
+        self.pronunciation = pronunciation
+        self.label = label
+
+    def set_pronunciation(self, pronunciation: base.PronunciationInfo) -> None:
+        self.pronunciation = pronunciation
+        self.label.set_label(pronunciation.ipa)
+
+
+class TaxonomyItem(GObject.Object):
+    """A row of the hierarchy browser: a synset, or the heading of one of its relations."""
+
+    def __init__(self, label: str, tooltip: str | None, node: base.TaxonomyNode, relation: str, is_heading=False):
+        super().__init__()
+        self.label = label
+        self.tooltip = tooltip
+        self.node = node
+        self.relation = relation
+        self.is_heading = is_heading
+
+
 class HistoryObject(GObject.Object):
     term = ""
     is_favorite = False
+    last_seen = 0.0
 
-    def __init__(self, term, is_favorite=False):
+    def __init__(self, term, is_favorite=False, last_seen=0.0):
         super().__init__()
         self.term = term
         self.is_favorite = is_favorite
+        self.last_seen = last_seen
+
+    @classmethod
+    def from_entry(cls, entry: HistoryEntry) -> HistoryObject:
+        return cls(entry.term, entry.favorite, entry.last_seen)
 
 
 @Gtk.Template(resource_path=f"{RES_PATH}/ui/window.ui")
@@ -64,7 +104,9 @@ class WordbookWindow(Adw.ApplicationWindow):
     _menu_button: Gtk.MenuButton = Gtk.Template.Child("wordbook_menu_button")
 
     # Sidebar (History)
+    _history_search_entry: Gtk.SearchEntry = Gtk.Template.Child("history_search_entry")
     _history_stack: Adw.ViewStack = Gtk.Template.Child("history_stack")
+    _history_scroll: Gtk.ScrolledWindow = Gtk.Template.Child("history_scroll")
     _history_listbox: Gtk.ListBox = Gtk.Template.Child("history_listbox")
     _clear_history_button: Gtk.Button = Gtk.Template.Child("clear_history_button")
     _favorites_filter_button: Gtk.ToggleButton = Gtk.Template.Child("favorites_filter_button")
@@ -87,19 +129,40 @@ class WordbookWindow(Adw.ApplicationWindow):
     # Event Controllers
     _key_ctrlr: Gtk.EventControllerKey = Gtk.Template.Child("key_ctrlr")
 
-    # WordNet
-    _wn_instance: base.wn.Wordnet | None = None
-    _wn_wordlist: list[str] = []
+    # WordNet data and lookups, run off the main thread.
+    _backend: Backend
 
     # Search
     _searched_term: str | None = None
-    _active_thread: threading.Thread | None = None
-    _search_cancellation_event: threading.Event | None = None
+    _search_result: dict[str, Any] | None = None
+    _search_result_term: str | None = None
+    # The synsets of each displayed pronunciation group, with their pronunciation controls.
+    _pronunciation_rows: list[tuple[tuple[int, ...], PronunciationControls | None]]
+    # Where glossary entries are streamed to, while a glossary is shown.
+    _glossary_box: Gtk.Box | None = None
+    _glossary_spinner: Adw.Spinner | None = None
+    _search_cancellable: Gio.Cancellable | None = None
     _completion: SearchCompletion
     _live_search_delay_timer = None
 
     # History
+    _history_store: HistoryStore
+    # Loaded history, in no particular order.
     _search_history: Gio.ListStore | None = None
+    # The loaded history items, by term.
+    _history_items: dict[str, HistoryObject]
+    # Where the next page of history starts, and whether there is one.
+    _history_page_after: tuple[float, str] | None = None
+    _history_exhausted: bool = False
+    _all_favorites_loaded: bool = False
+    # The loaded history as shown: filtered, then sorted.
+    _history_model: Gtk.SortListModel | None = None
+    _favorites_filter: Gtk.CustomFilter | None = None
+    _history_query_filter: Gtk.CustomFilter | None = None
+    _history_sorter: Gtk.CustomSorter | None = None
+    # The casefolded history search, and the fuzzy_score() of each term against it.
+    _history_query: str = ""
+    _history_scores: dict[str, int | None]
     _show_favorites_only: bool = False
     _history_delay_timer = None
     _pending_history_text = None
@@ -109,6 +172,7 @@ class WordbookWindow(Adw.ApplicationWindow):
     _doubled: bool = False
     _primary_clipboard_text: str | None = None
     _auto_paste_queued: bool = False
+    _audio_player: Gtk.MediaFile | None = None
 
     def __init__(self, term="", auto_paste_requested=False, **kwargs):
         """Initializes the main application window."""
@@ -127,15 +191,30 @@ class WordbookWindow(Adw.ApplicationWindow):
             self.add_css_class("devel")
         self.set_default_icon_name(app.app_id)
 
+        self._backend = Backend()
+        self._pronunciation_rows = []
+        self._history_items = {}
+        self._history_scores = {}
         self.setup_widgets()
         self.setup_actions()
 
     def setup_widgets(self):
         """Sets up widgets, binds models, and connects signal handlers."""
         self._search_history = Gio.ListStore.new(HistoryObject)
-        self._history_listbox.bind_model(self._search_history, self._create_history_label)
+        self._favorites_filter = Gtk.CustomFilter.new(self._filter_favorites)
+        self._history_query_filter = Gtk.CustomFilter.new(self._filter_history_query)
+        history_filter = Gtk.EveryFilter.new()
+        history_filter.append(self._favorites_filter)
+        history_filter.append(self._history_query_filter)
+        self._history_sorter = Gtk.CustomSorter.new(self._compare_history_items)
+        self._history_model = Gtk.SortListModel.new(
+            Gtk.FilterListModel.new(self._search_history, history_filter), self._history_sorter
+        )
+        self._history_listbox.bind_model(self._history_model, self._create_history_label)
         self._history_listbox.connect("row-activated", self._on_history_item_activated)
-        self._search_history.connect("items-changed", self._on_history_items_changed)
+        self._history_model.connect("items-changed", self._on_history_items_changed)
+        self._history_scroll.connect("edge-reached", self._on_history_edge_reached)
+        self._history_search_entry.connect("search-changed", self._on_history_search_changed)
 
         self.connect("notify::is-active", self._on_is_active_changed)
         self._key_ctrlr.connect("key-pressed", self._on_key_pressed)
@@ -160,15 +239,17 @@ class WordbookWindow(Adw.ApplicationWindow):
         self._completion = SearchCompletion(
             parent=self,
             entry=self._search_entry,
-            item_provider=self._get_completion_items,
+            item_provider=None,
             activate=self.trigger_search,
+            async_item_provider=self._query_completion_items,
         )
         self.set_completion_enabled(not Settings.get().live_search)
 
-        history_items = [HistoryObject(term, Settings.get().is_favorite(term)) for term in Settings.get().history]
-        self._search_history.splice(0, 0, history_items)
-
-        self._update_clear_button_sensitivity()
+        self._history_store = HistoryStore.get()
+        self._history_items = {}
+        self._history_scores = {}
+        self._import_settings_history()
+        self._load_history_page()
 
         self.search_button.set_visible(not Settings.get().live_search)
         if not Settings.get().live_search:
@@ -254,7 +335,9 @@ class WordbookWindow(Adw.ApplicationWindow):
             try:
                 text = clipboard.read_text_finish(result)
                 if text:
-                    text = base.clean_search_terms(text)
+                    mode, _query = base.parse_search_mode(text)
+                    # A pasted paragraph keeps its punctuation, only its line breaks are joined.
+                    text = " ".join(text.split()) if mode is base.SearchMode.GLOSSARY else base.clean_search_terms(text)
                 if text and text.strip():
                     self.trigger_search(text)
             except GLib.Error:
@@ -270,8 +353,8 @@ class WordbookWindow(Adw.ApplicationWindow):
 
     def on_random_word(self, _action, _param):
         """Callback for the 'random-word' action. Searches for a random word."""
-        if self._wn_wordlist:
-            random_word = random.choice(self._wn_wordlist)
+        if self._backend.wordlist:
+            random_word = random.choice(self._backend.wordlist)
             self.trigger_search(random_word)
         else:
             self._new_error(
@@ -304,60 +387,56 @@ class WordbookWindow(Adw.ApplicationWindow):
             self._page_switch(Page.WELCOME)
             return
 
-        if self._active_thread and self._active_thread.is_alive():
-            if self._search_cancellation_event:
-                self._search_cancellation_event.set()
+        if self._search_cancellable is not None:
+            self._search_cancellable.cancel()
 
         self._page_switch(Page.SPINNER)
 
-        self._search_cancellation_event = threading.Event()
-        self._active_thread = threading.Thread(
-            target=self.threaded_search,
-            args=[text, self._search_cancellation_event, update_history],
-            daemon=True,
-        )
-        self._active_thread.start()
+        cancellable = self._search_cancellable = Gio.Cancellable()
 
-    def threaded_search(self, text, cancellation_event, update_history: bool):
-        """
-        Performs the search in a background thread.
-        This prevents the UI from freezing during network or intensive search operations.
-        """
-        if cancellation_event.is_set():
-            return
+        def on_defined(backend: Backend, result: Gio.AsyncResult):
+            try:
+                out = backend.define_finish(result)
+            except GLib.Error as e:
+                if not is_cancelled(e):  # Otherwise cancelled by a newer search.
+                    self._on_search_failed()
+                return
 
-        out = self._search(text)
+            if out is None and not Settings.get().live_search:
+                mode, _query = base.parse_search_mode(text)
+                if mode is base.SearchMode.DEFINE and not base.clean_search_terms(text).strip():
+                    self._new_error(
+                        _("Invalid input"),
+                        _("Nothing definable was found in your search input"),
+                    )
 
-        if cancellation_event.is_set():
-            return
+            self._on_search_finished(text, out, update_history)
 
-        if out is not None and not out.get("result"):
-            out["suggestions"] = (
-                process.extract(
-                    text,
-                    self._wn_wordlist if self._wn_wordlist else [],
-                    limit=5,
-                    scorer=fuzz.QRatio,
-                    score_cutoff=70,
+            if out is not None and out.get("glossary"):
+                backend.glossary_async(
+                    out["glossary"],
+                    functools.partial(self._on_glossary_entries_ready, cancellable),
+                    cancellable,
+                    self._on_glossary_finished,
                 )
-                if len(text) > 2
-                else []
-            )
 
-        GLib.idle_add(self._on_search_finished, text, out, update_history)
+        self._backend.define_async(text, Settings.get().pronunciations_accent.code, cancellable, on_defined)
 
     def _on_search_finished(self, search_term, result, update_history: bool = True):
         """Handles the result of a search on the main thread."""
         self._searched_term = search_term
+        self._search_result = None
+        self._search_result_term = None
 
         if not result:
             self._page_switch(Page.WELCOME)
             return
 
-        status = result.get("status", SearchStatus.SUCCESS if result.get("result") else SearchStatus.FAILURE)
+        found = result.get("matches") or result.get("glossary") or result.get("result")
+        status = result.get("status", SearchStatus.SUCCESS if found else SearchStatus.FAILURE)
 
-        if status == SearchStatus.SUCCESS:
-            self._populate_definitions(result["result"])
+        if status == SearchStatus.SUCCESS and "matches" in result:
+            self._populate_matches(result["mode"], result["matches"], result.get("more_matches"))
             self._page_switch(Page.CONTENT)
 
             if update_history:
@@ -366,38 +445,131 @@ class WordbookWindow(Adw.ApplicationWindow):
                 else:
                     self._add_to_history(result["term"])
 
-        elif status == SearchStatus.FAILURE:
-            suggestions = result.get("suggestions", [])
+        elif status == SearchStatus.SUCCESS and "glossary" in result:
+            # Pasted text isn't worth keeping in the history.
+            self._populate_glossary(len(result["glossary"]))
+            self._page_switch(Page.CONTENT)
 
-            suggestion_links = [
-                f'<a href="search;{suggestion}">{suggestion}</a>' for suggestion, score, _ in suggestions if score > 70
-            ]
+        elif status == SearchStatus.SUCCESS:
+            self._search_result = result["result"]
+            self._search_result_term = result["term"]
+            self._populate_definitions(result["result"])
+            self._page_switch(Page.CONTENT)
 
-            if suggestion_links:
-                suggestions_markup = f"Did you mean: {', '.join(suggestion_links)}?"
-                self._search_fail_description_label.set_markup(suggestions_markup)
-                self._search_fail_description_label.set_visible(True)
-            else:
-                self._search_fail_description_label.set_markup("")
-                self._search_fail_description_label.set_visible(False)
+            if self._history_store.is_favorite(result["term"]):
+                self._prerender_pronunciations()
+
+            if update_history:
+                if Settings.get().live_search:
+                    self._add_to_history_delayed(result["term"])
+                else:
+                    self._add_to_history(result["term"])
+
+        elif status == SearchStatus.FAILURE:
+            self._search_fail_description_label.set_markup("")
+            self._search_fail_description_label.set_visible(False)
+            if "matches" not in result and "glossary" not in result:
+                self._backend.suggest_async(search_term, self._search_cancellable, self._on_suggestions_ready)
 
             self._page_switch(Page.SEARCH_FAIL)
         else:  # RESET or other cases
             self._page_switch(Page.WELCOME)
 
-        self._active_thread = None
+    def _on_search_failed(self) -> None:
+        """Shows the search failure page for a search that ran into an error, rather than finding nothing."""
+        self._searched_term = None
+        self._search_result = None
+        self._search_result_term = None
+        self._search_fail_description_label.set_markup(_("Something went wrong while searching"))
+        self._search_fail_description_label.set_visible(True)
+        self._page_switch(Page.SEARCH_FAIL)
+
+    def _on_suggestions_ready(self, backend: Backend, result: Gio.AsyncResult) -> None:
+        """Offers the lemmas resembling a term that could not be defined."""
+        try:
+            suggestions = backend.suggest_finish(result)
+        except GLib.Error:
+            return
+
+        suggestion_links = [
+            f'<a href="search;{suggestion}">{suggestion}</a>' for suggestion, score, _ in suggestions if score > 70
+        ]
+
+        if suggestion_links:
+            suggestions_markup = f"Did you mean: {', '.join(suggestion_links)}?"
+            self._search_fail_description_label.set_markup(suggestions_markup)
+            self._search_fail_description_label.set_visible(True)
 
     def refresh_current_search_pronunciations(self) -> None:
-        """Refreshes the visible search result after accent changes without touching history."""
+        """
+        Switches the visible search result to the current accent.
+
+        Every accent's pronunciation from WordNet is already part of the result,
+        so the IPA labels are updated in place. The definitions are only rebuilt
+        when the new accent groups the synsets differently. Where WordNet has no
+        pronunciation for the new accent, espeak-ng's is added once it is ready.
+        """
         visible_page = self._main_stack.get_visible_child_name()
 
-        if not self._searched_term:
+        if not self._search_result or visible_page != Page.CONTENT.value:
             return
 
-        if visible_page != Page.CONTENT.value:
+        accent = Settings.get().pronunciations_accent.code
+        base.select_pronunciation_accent(self._search_result, accent)
+
+        # Lookups only ask espeak-ng for the accent selected at the time.
+        term = self._search_result_term
+        if term and base.needs_fallback_pronunciation(self._search_result, term, accent):
+            self._backend.pronunciation_async(
+                term,
+                accent,
+                self._search_cancellable,
+                functools.partial(self._on_fallback_pronunciation_ready, self._search_result, term, accent),
+            )
+
+        pronunciation_groups = [
+            pronunciation_group
+            for synsets in self._search_result.values()
+            if synsets
+            for lemma_group in base.group_synsets_by_lemma(synsets)
+            for pronunciation_group in lemma_group.pronunciation_groups
+        ]
+        layout = [
+            (tuple(id(synset) for synset in group.synsets), self._has_pronunciation(group.pronunciation))
+            for group in pronunciation_groups
+        ]
+        current_layout = [(synset_ids, controls is not None) for synset_ids, controls in self._pronunciation_rows]
+
+        if layout != current_layout:
+            self._populate_definitions(self._search_result)
+        else:
+            for group, (_synset_ids, controls) in zip(pronunciation_groups, self._pronunciation_rows, strict=True):
+                if controls is not None:
+                    controls.set_pronunciation(group.pronunciation)
+
+        if self._search_result_term and self._history_store.is_favorite(self._search_result_term):
+            self._prerender_pronunciations()
+
+    def _on_fallback_pronunciation_ready(
+        self,
+        search_result: dict[str, Any],
+        term: str,
+        accent: str,
+        backend: Backend,
+        result: Gio.AsyncResult,
+    ) -> None:
+        try:
+            ipa = backend.pronunciation_finish(result)
+        except GLib.Error:
             return
+        # The result may have been replaced while espeak-ng ran.
+        if ipa and search_result is self._search_result:
+            base.set_fallback_pronunciation(search_result, term, accent, ipa)
+            self.refresh_current_search_pronunciations()
 
-        self.on_search_clicked(text=self._searched_term, update_history=False)
+    @staticmethod
+    def _has_pronunciation(pron: base.PronunciationInfo | None) -> bool:
+        return pron is not None and bool(pron.ipa)
 
     def trigger_search(self, text):
         if not text or not text.strip():
@@ -450,7 +622,7 @@ class WordbookWindow(Adw.ApplicationWindow):
             GLib.idle_add(self.on_paste_search)
 
     def save_state(self, _window: Gtk.Window | None = None):
-        """Saves window state and history."""
+        """Saves window state."""
         if self._history_delay_timer is not None:
             GLib.source_remove(self._history_delay_timer)
             self._history_delay_timer = None
@@ -459,21 +631,19 @@ class WordbookWindow(Adw.ApplicationWindow):
             GLib.source_remove(self._live_search_delay_timer)
             self._live_search_delay_timer = None
 
-        history_list = []
-        if self._search_history:
-            for i in range(self._search_history.get_n_items()):
-                item = self._search_history.get_item(i)
-                if item:
-                    history_list.append(item.term)
-
         width, height = self.get_default_size()
         settings_to_update = {
-            "history": history_list,
             "window_width": width,
             "window_height": height,
         }
         Settings.get().batch_update(settings_to_update)
 
+    def shutdown(self) -> None:
+        """Cancels the running search and drops queued background work."""
+        if self._search_cancellable is not None:
+            self._search_cancellable.cancel()
+        self._backend.shutdown()
+
     def _on_entry_changed(self, _entry):
         """Handles text changes in the search entry, triggering live search and completions."""
         text = _entry.get_text()
@@ -494,31 +664,35 @@ class WordbookWindow(Adw.ApplicationWindow):
 
     def _on_clear_history(self, _widget):
         """Clears non-favorited items from the search history."""
-        items_to_remove = []
-        for i in range(self._search_history.get_n_items()):
-            item = self._search_history.get_item(i)
-            if not item.is_favorite:
-                items_to_remove.append((i, item))
-
-        if not items_to_remove:
+        removed_entries = self._history_store.clear()
+        if not removed_entries:
             return
+        self._backend.forget_history(entry.term for entry in removed_entries)
 
-        # Remove items from the history, iterating backwards through the indices
-        # to ensure that the indices of items yet to be removed are not affected.
-        for i, _item in reversed(items_to_remove):
-            self._search_history.remove(i)
+        kept_items, removed_items = [], []
+        for i in range(self._search_history.get_n_items()):
+            item = self._search_history.get_item(i)
+            (kept_items if item.is_favorite else removed_items).append(item)
+        self._search_history.splice(0, self._search_history.get_n_items(), kept_items)
+        for item in removed_items:
+            del self._history_items[item.term]
 
         self._update_clear_button_sensitivity()
 
         toast = Adw.Toast.new(_("History cleared"))
         toast.set_button_label(_("Undo"))
-        toast.connect("button-clicked", self._on_undo_clear_history, items_to_remove)
+        toast.connect("button-clicked", self._on_undo_clear_history, removed_entries, removed_items)
         self._toast_overlay.add_toast(toast)
 
-    def _on_undo_clear_history(self, _toast, items_to_restore):
+    def _on_undo_clear_history(self, _toast, removed_entries, removed_items):
         """Restores the history that was just cleared."""
-        for i, item in items_to_restore:
-            self._search_history.insert(i, item)
+        self._history_store.restore(removed_entries)
+        restored_entries = (self._history_store.entry(entry.term) for entry in removed_entries)
+        self._backend.learn_history(entry for entry in restored_entries if entry is not None)
+        # Terms searched again since the history was cleared are already back.
+        items = [item for item in removed_items if item.term not in self._history_items]
+        self._history_items.update((item.term, item) for item in items)
+        self._search_history.splice(self._search_history.get_n_items(), 0, items)
 
         self._update_clear_button_sensitivity()
 
@@ -530,8 +704,13 @@ class WordbookWindow(Adw.ApplicationWindow):
         has_history = self._search_history.get_n_items() > 0 if self._search_history else False
         self._clear_history_button.set_sensitive(has_history)
 
-        # Switch the stack page to 'empty' if no history
-        self._history_stack.set_visible_child_name("list" if has_history else "empty")
+        # Switch the stack page to 'empty' if no history, or 'no_matches' if it is all filtered out
+        if not has_history:
+            self._history_stack.set_visible_child_name("empty")
+        elif self._history_model.get_n_items() == 0:
+            self._history_stack.set_visible_child_name("no_matches")
+        else:
+            self._history_stack.set_visible_child_name("list")
 
     @staticmethod
     def _on_exit_clicked(_widget):
@@ -565,17 +744,18 @@ class WordbookWindow(Adw.ApplicationWindow):
     def _on_history_item_activated(self, _widget, row: Gtk.ListBoxRow):
         """Handles clicks on history items, triggering a search for that term."""
         index = row.get_index()
-        history_object: HistoryObject = self._search_history.get_item(index)
+        history_object: HistoryObject = self._history_model.get_item(index)
         if history_object:
             self.trigger_search(history_object.term)
 
             if self._main_split_view.get_collapsed():
                 self._main_split_view.set_show_sidebar(False)
 
-    def _on_history_items_changed(self, store, position, removed, added):
+    def _on_history_items_changed(self, model, position, removed, added):
         """Applies styling to newly added history rows."""
         if added > 0:
-            GLib.idle_add(self._apply_styling_to_new_rows, store, position, added)
+            GLib.idle_add(self._apply_styling_to_new_rows, model, position, added)
+        self._update_clear_button_sensitivity()
 
     def on_toggle_sidebar(self, action, param):
         """Action handler to toggle the sidebar."""
@@ -586,33 +766,122 @@ class WordbookWindow(Adw.ApplicationWindow):
         self._menu_button.grab_focus()
         self._menu_button.set_active(not self._menu_button.get_active())
 
-    def _apply_styling_to_new_rows(self, store, position, added):
+    def _apply_styling_to_new_rows(self, model, position, added):
         """Waits for rows to be created, then applies styling."""
         for i in range(position, position + added):
-            item = store.get_item(i)
+            item = model.get_item(i)
             row = self._history_listbox.get_row_at_index(i)
-            if row:
+            if row and item:
                 self._update_row_visuals(row, item)
         return False
 
     def _add_to_history(self, text):
         """Adds a term to the history, moving it to the top if it already exists."""
-        for i in range(self._search_history.get_n_items()):
-            item = self._search_history.get_item(i)
-            if item.term == text:
-                self._search_history.remove(i)
-                break
+        entry = self._history_store.record_lookup(text)
+        self._backend.learn_history([entry])
+
+        history_object = self._history_items.get(entry.term)
+        if history_object is None:
+            history_object = HistoryObject.from_entry(entry)
+            self._history_items[entry.term] = history_object
+            self._search_history.append(history_object)
+        else:
+            history_object.last_seen = entry.last_seen
+            self._refresh_history_item(history_object)
+
+        self._update_clear_button_sensitivity()
 
-        is_favorite = Settings.get().is_favorite(text)
-        history_object = HistoryObject(text, is_favorite)
-        self._search_history.insert(0, history_object)
+    def _refresh_history_item(self, item: HistoryObject) -> None:
+        """Filters and sorts a history item again after it changed."""
+        found, position = self._search_history.find(item)
+        if found:
+            self._search_history.items_changed(position, 1, 1)
 
-        if self._search_history:
-            while self._search_history.get_n_items() > 50:
-                self._search_history.remove(self._search_history.get_n_items() - 1)
+    def _append_history_entries(self, entries: Iterable[HistoryEntry]) -> None:
+        """Adds the entries that aren't loaded yet to the sidebar."""
+        items = [HistoryObject.from_entry(entry) for entry in entries if entry.term not in self._history_items]
+        self._history_items.update((item.term, item) for item in items)
+        self._search_history.splice(self._search_history.get_n_items(), 0, items)
 
+    def _import_settings_history(self):
+        """Moves history and favorites kept in the settings file by earlier versions into the history store."""
+        settings = Settings.get()
+        history, favorites = settings.history, settings.favorites
+        if history or favorites:
+            self._history_store.import_terms(history, favorites)
+            settings.batch_update({"history": [], "favorites": []})
+
+    def _load_history_page(self) -> None:
+        """Loads the next page of history into the sidebar."""
+        if self._history_exhausted:
+            return
+
+        entries = self._history_store.page(HISTORY_PAGE_SIZE, self._history_page_after)
+        self._history_exhausted = len(entries) < HISTORY_PAGE_SIZE
+        if entries:
+            self._history_page_after = (entries[-1].last_seen, entries[-1].term)
+
+        # Terms looked up, searched for or favorited since the sidebar was loaded are already there.
+        self._append_history_entries(entries)
         self._update_clear_button_sensitivity()
 
+    def _load_all_favorites(self) -> None:
+        """Loads every favorite into the sidebar, so that the favorites filter shows them all."""
+        after = None
+        while not self._all_favorites_loaded:
+            entries = self._history_store.page(HISTORY_PAGE_SIZE, after, favorites_only=True)
+            self._all_favorites_loaded = len(entries) < HISTORY_PAGE_SIZE
+            if entries:
+                after = (entries[-1].last_seen, entries[-1].term)
+            self._append_history_entries(entries)
+
+    def _on_history_search_changed(self, entry: Gtk.SearchEntry) -> None:
+        """Filters the sidebar to the terms that fuzzily match what was typed, best matches first."""
+        previous, query = self._history_query, entry.get_text().strip().casefold()
+        if query == previous:
+            return
+
+        self._history_query = query
+        self._history_scores = {}
+        if query:
+            self._append_history_entries(self._history_store.search(query, HISTORY_SEARCH_LIMIT))
+
+        # Terms matching a query also match any query it contains in order, so only the
+        # visible items need to be checked when typing more, and only the hidden ones when deleting.
+        if fuzzy_score(previous, query) is not None:
+            change = Gtk.FilterChange.MORE_STRICT
+        elif fuzzy_score(query, previous) is not None:
+            change = Gtk.FilterChange.LESS_STRICT
+        else:
+            change = Gtk.FilterChange.DIFFERENT
+        self._history_query_filter.changed(change)
+        self._history_sorter.changed(Gtk.SorterChange.DIFFERENT)
+
+    def _history_score(self, item: HistoryObject) -> int | None:
+        if item.term not in self._history_scores:
+            self._history_scores[item.term] = fuzzy_score(self._history_query, item.term)
+        return self._history_scores[item.term]
+
+    def _filter_favorites(self, item: HistoryObject) -> bool:
+        return not self._show_favorites_only or item.is_favorite
+
+    def _filter_history_query(self, item: HistoryObject) -> bool:
+        return not self._history_query or self._history_score(item) is not None
+
+    def _compare_history_items(self, a: HistoryObject, b: HistoryObject) -> int:
+        """Orders history by how well it matches the history search, then most recent first."""
+        if self._history_query:
+            score_a, score_b = self._history_score(a) or 0, self._history_score(b) or 0
+            if score_a != score_b:
+                return -1 if score_a > score_b else 1
+        if a.last_seen != b.last_seen:
+            return -1 if a.last_seen > b.last_seen else 1
+        return 0
+
+    def _on_history_edge_reached(self, _scroll: Gtk.ScrolledWindow, position: Gtk.PositionType) -> None:
+        if position == Gtk.PositionType.BOTTOM:
+            self._load_history_page()
+
     def _add_to_history_delayed(self, text):
         """Adds a term to history after a delay, cancelling any previously pending additions."""
         if self._history_delay_timer is not None:
@@ -640,19 +909,61 @@ class WordbookWindow(Adw.ApplicationWindow):
         """Callback to read a specific lemma aloud, using its wn format IPA."""
         accent = Settings.get().pronunciations_accent.code
 
-        def speak():
-            base.read_term(lemma, speed=120, accent=accent, ipa=ipa)
+        if path := base.get_cached_term_audio(lemma, accent=accent, ipa=ipa):
+            self._play_audio_file(path, lemma, accent, ipa)
+            return
+
+        def on_rendered(backend: Backend, result: Gio.AsyncResult):
+            try:
+                path = backend.speak_finish(result)
+            except GLib.Error:
+                return
+            if path:
+                self._play_audio_file(path, lemma, accent, ipa)
+
+        self._backend.speak_async(lemma, accent, ipa, None, on_rendered)
+
+    def _play_audio_file(self, path: str, lemma: str, accent: str, ipa: str | None) -> bool:
+        """Plays rendered pronunciation audio, stopping any pronunciation that is still playing."""
+        if self._audio_player is not None:
+            self._audio_player.set_playing(False)
 
-        threading.Thread(target=speak, daemon=True).start()
+        self._audio_player = Gtk.MediaFile.new_for_filename(path)
+        self._audio_player.connect("notify::error", self._on_audio_player_error, lemma, accent, ipa)
+        self._audio_player.play()
+        return False
+
+    def _on_audio_player_error(
+        self, player: Gtk.MediaFile, _pspec: GObject.ParamSpec, lemma: str, accent: str, ipa: str | None
+    ) -> None:
+        """Falls back to letting espeak-ng speak directly when GTK can't play the audio file."""
+        error = player.get_error()
+        if error is None:
+            return
+
+        utils.log_warning(f"Could not play pronunciation audio, falling back to espeak-ng: {error.message}")
+        self._backend.read_aloud_async(lemma, accent, ipa)
+
+    def _prerender_pronunciations(self) -> None:
+        """Renders the audio of every pronunciation on display in the background, so playing them is instant."""
+        accent = Settings.get().pronunciations_accent.code
+        for _synset_ids, controls in self._pronunciation_rows:
+            if controls is not None:
+                ipa = None if controls.pronunciation.is_fallback else controls.pronunciation.ipa
+                self._backend.speak_async(controls.lemma, accent, ipa, None, None, priority=Priority.IDLE)
+
+    def _on_speak_pronunciation_clicked(self, button: Gtk.Button, controls: PronunciationControls) -> None:
+        pron = controls.pronunciation
+        self._on_speak_lemma_clicked(button, controls.lemma, None if pron.is_fallback else pron.ipa)
 
     def _append_pronunciation_controls(
         self,
         box: Gtk.Box,
         pron: base.PronunciationInfo | None,
         lemma: str,
-    ) -> None:
-        if not pron or not pron.ipa:
-            return
+    ) -> PronunciationControls | None:
+        if not self._has_pronunciation(pron):
+            return None
 
         ipa_label = Gtk.Label(
             label=pron.ipa,
@@ -661,6 +972,7 @@ class WordbookWindow(Adw.ApplicationWindow):
             css_classes=["dimmed"],
         )
         box.append(ipa_label)
+        controls = PronunciationControls(lemma, pron, ipa_label)
 
         controls_box = Gtk.Box(
             orientation=Gtk.Orientation.HORIZONTAL,
@@ -674,10 +986,11 @@ class WordbookWindow(Adw.ApplicationWindow):
             tooltip_text=_("Listen to Pronunciation"),
             css_classes=["flat", "circular"],
         )
-        play_btn.connect("clicked", self._on_speak_lemma_clicked, lemma, None if pron.is_fallback else pron.ipa)
+        play_btn.connect("clicked", self._on_speak_pronunciation_clicked, controls)
         controls_box.append(play_btn)
 
         box.append(controls_box)
+        return controls
 
     def _create_header_row(
         self,
@@ -685,7 +998,7 @@ class WordbookWindow(Adw.ApplicationWindow):
         label_css_class: str,
         pron: base.PronunciationInfo | None,
         lemma: str,
-    ) -> Gtk.Box:
+    ) -> tuple[Gtk.Box, PronunciationControls | None]:
         """Creates a row: [header label] [IPA (dimmed)] [play btn] [info btn?]"""
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4, valign=Gtk.Align.CENTER)
 
@@ -699,11 +1012,24 @@ class WordbookWindow(Adw.ApplicationWindow):
         )
         box.append(header_label)
 
-        self._append_pronunciation_controls(box, pron, lemma)
+        controls = self._append_pronunciation_controls(box, pron, lemma)
 
-        return box
+        return box, controls
 
-    def _create_definition_row(self, synset: dict[str, Any], definition_number: int) -> Gtk.Box:
+    @staticmethod
+    def _linked_markup(text: str, links: Sequence[Link]) -> str:
+        """Escapes text as markup, turning the given links into links that search for their lemma."""
+        parts = []
+        position = 0
+        for link in links:
+            lemma = GLib.markup_escape_text(link.lemma)
+            parts.append(GLib.markup_escape_text(text[position : link.start]))
+            parts.append(f'<a href="search;{lemma}">{GLib.markup_escape_text(text[link.start : link.end])}</a>')
+            position = link.end
+        parts.append(GLib.markup_escape_text(text[position:]))
+        return "".join(parts)
+
+    def _create_definition_row(self, synset: base.SynsetResult, definition_number: int) -> Gtk.Box:
         def_main_box = Gtk.Box(
             orientation=Gtk.Orientation.HORIZONTAL,
             spacing=12,
@@ -728,7 +1054,8 @@ class WordbookWindow(Adw.ApplicationWindow):
         )
 
         def_label = Gtk.Label(
-            label=synset["definition"],
+            label=self._linked_markup(synset.definition, synset.definition_links),
+            use_markup=True,
             wrap=True,
             xalign=0.0,
             selectable=True,
@@ -738,6 +1065,8 @@ class WordbookWindow(Adw.ApplicationWindow):
             ],
         )
 
+        def_label.connect("activate-link", self._on_link_activated)
+
         click = Gtk.GestureClick.new()
         click.connect("pressed", self._on_def_press_event)
         click.connect("stopped", self._on_def_stop_event)
@@ -745,15 +1074,18 @@ class WordbookWindow(Adw.ApplicationWindow):
 
         content_box.append(def_label)
 
-        for example in synset.get("examples", []):
+        example_links = synset.example_links or [() for _example in synset.examples]
+        for example, links in zip(synset.examples, example_links, strict=True):
             example_label = Gtk.Label(
-                label=example,
+                label=self._linked_markup(example, links),
+                use_markup=True,
                 wrap=True,
                 xalign=0.0,
                 selectable=True,
                 extra_menu=self._def_extra_menu_model,
             )
             example_label.add_css_class("example-text")
+            example_label.connect("activate-link", self._on_link_activated)
 
             click = Gtk.GestureClick.new()
             click.connect("pressed", self._on_def_press_event)
@@ -762,18 +1094,20 @@ class WordbookWindow(Adw.ApplicationWindow):
 
             content_box.append(example_label)
 
-        for relation_type, relation_key in [
-            ("Synonyms", "syn"),
-            ("Antonyms", "ant"),
-            ("Similar to", "sim"),
-            ("Also see", "also_sees"),
+        for relation_type, words in [
+            ("Synonyms", synset.syn),
+            ("Antonyms", synset.ant),
+            ("Similar to", synset.sim),
+            ("Also see", synset.also_sees),
         ]:
-            words = synset.get(relation_key, [])
             if words:
                 relation_box = self._create_relation_widget(relation_type, words)
                 if relation_box:
                     content_box.append(relation_box)
 
+        if synset.id:
+            content_box.append(self._create_taxonomy_expander(synset.id))
+
         def_main_box.append(content_box)
         return def_main_box
 
@@ -825,21 +1159,24 @@ class WordbookWindow(Adw.ApplicationWindow):
 
     def _on_favorite_toggled(self, button: Gtk.Button, item: HistoryObject):
         """Toggles the favorite status of a history item and updates the UI."""
-        settings = Settings.get()
         is_now_favorite = not item.is_favorite
         item.is_favorite = is_now_favorite
 
-        if is_now_favorite:
-            settings.add_favorite(item.term)
-        else:
-            settings.remove_favorite(item.term)
+        self._backend.learn_history([self._history_store.set_favorite(item.term, is_now_favorite)])
+        if is_now_favorite and item.term == self._search_result_term:
+            self._prerender_pronunciations()
+
+        if self._show_favorites_only:
+            # Lets the favorites filter hide the row.
+            self._refresh_history_item(item)
+            return
 
         row = button.get_ancestor(Gtk.ListBoxRow)
         if row:
             self._update_row_visuals(row, item)
 
     def _update_row_visuals(self, row: Gtk.ListBoxRow, item: HistoryObject):
-        """Updates the icon, CSS class, and visibility of a history row."""
+        """Updates the icon and CSS class of a history row."""
         box = row.get_child()
         favorite_button: Gtk.ToggleButton = box.get_last_child()
         favorite_button.set_icon_name("starred-symbolic" if item.is_favorite else "non-starred-symbolic")
@@ -850,21 +1187,19 @@ class WordbookWindow(Adw.ApplicationWindow):
         else:
             row.remove_css_class("favorite-item")
 
-        row.set_visible(not self._show_favorites_only or item.is_favorite)
-
     def _toggle_favorites_filter(self):
-        """Toggles the visibility of history items based on their favorite status."""
+        """Toggles between showing all history and only the favorites."""
         self._show_favorites_only = not self._show_favorites_only
         self._favorites_filter_button.set_active(self._show_favorites_only)
         self._favorites_filter_button.set_icon_name(
             "starred-symbolic" if self._show_favorites_only else "non-starred-symbolic"
         )
 
-        for i in range(self._search_history.get_n_items()):
-            item = self._search_history.get_item(i)
-            row = self._history_listbox.get_row_at_index(i)
-            if row:
-                row.set_visible(not self._show_favorites_only or item.is_favorite)
+        if self._show_favorites_only:
+            self._load_all_favorites()
+            self._favorites_filter.changed(Gtk.FilterChange.MORE_STRICT)
+        else:
+            self._favorites_filter.changed(Gtk.FilterChange.LESS_STRICT)
 
     def _new_error(self, primary_text, secondary_text) -> None:
         """Shows an error dialog."""
@@ -880,65 +1215,24 @@ class WordbookWindow(Adw.ApplicationWindow):
         GLib.idle_add(self._main_stack.set_visible_child_name, page)
         return False
 
-    def _search(self, search_text: str) -> dict[str, Any] | None:
-        """Cleans input text, passes it to the backend for definition, and handles errors."""
-        text = base.clean_search_terms(search_text)
-        if text and text.strip():
-            if self._wn_instance:
-                return base.format_output(
-                    text,
-                    self._wn_instance,
-                    accent=Settings.get().pronunciations_accent.code,
-                )
-            else:
-                return None  # WordNet instance not ready yet
-        if not Settings.get().live_search:
-            GLib.idle_add(
-                self._new_error,
-                _("Invalid input"),
-                _("Nothing definable was found in your search input"),
-            )
-        return None
-
-    def _get_completion_items(self, text: str, limit: int) -> list[str]:
-        if limit <= 0 or not text.strip() or not self._wn_wordlist:
-            return []
-
-        typed_prefix = text.lstrip()
-        search_term = typed_prefix.casefold()
-        prefix_len = len(typed_prefix)
-        start_idx = bisect.bisect_left(self._wn_wordlist, search_term, key=str.casefold)
-        end_idx = bisect.bisect_right(self._wn_wordlist, f"{search_term}{chr(sys.maxunicode)}", key=str.casefold)
-        ranked_matches: list[tuple] = []
-        seen_lower: dict[str, tuple] = {}
-
-        for original_word in self._wn_wordlist[start_idx:end_idx]:
-            display_lower = original_word.casefold()
-            prev = seen_lower.get(display_lower)
-            if prev is not None:
-                prev_rank, prev_word = prev
-                # Upgrade to this variant only if the stored word doesn't already
-                # match the user's typed prefix but this one does
-                if prev_word[:prefix_len] != typed_prefix and original_word[:prefix_len] == typed_prefix:
-                    old_idx = bisect.bisect_left(ranked_matches, (prev_rank, prev_word))
-                    if old_idx < len(ranked_matches) and ranked_matches[old_idx] == (prev_rank, prev_word):
-                        ranked_matches[old_idx] = (prev_rank, original_word)
-                    seen_lower[display_lower] = (prev_rank, original_word)
-                continue
-            suffix = display_lower[len(search_term) :]
-            rank = (
-                sum(char == " " for char in suffix),
-                sum(not char.isalnum() for char in suffix),
-                len(suffix),
-                display_lower,
-            )
-            seen_lower[display_lower] = (rank, original_word)
-            bisect.insort(ranked_matches, (rank, original_word))
-            if len(ranked_matches) > limit:
-                evicted = ranked_matches.pop()
-                seen_lower.pop(evicted[1].casefold(), None)
+    def _query_completion_items(
+        self, text: str, limit: int, on_ready: Callable[[str, list[str]], None]
+    ) -> Gio.Cancellable | None:
+        """Ranks completions on the backend's workers so typing never waits for a prefix scan."""
+        if self._backend.completion_engine is None:
+            on_ready(text, [])
+            return None
 
-        return [word for _rank, word in ranked_matches]
+        def on_completed(backend: Backend, result: Gio.AsyncResult):
+            try:
+                items = backend.complete_finish(result)
+            except GLib.Error:
+                return
+            on_ready(text, items)
+
+        cancellable = Gio.Cancellable()
+        self._backend.complete_async(text, limit, cancellable, on_completed)
+        return cancellable
 
     def _set_header_sensitive(self, status):
         """Disables or enables header buttons during long-running operations."""
@@ -956,42 +1250,33 @@ class WordbookWindow(Adw.ApplicationWindow):
         # Show spinner page during setup
         self._page_switch(Page.SPINNER)
 
-        # Setup database in a background thread
-        threading.Thread(target=self._setup_database_thread, daemon=True).start()
+        self._backend.setup_async(None, self._on_setup_finished)
 
-    def _setup_database_thread(self):
-        """Setup database in a background thread."""
+    def _on_setup_finished(self, backend: Backend, result: Gio.AsyncResult) -> None:
         try:
-            # Try to setup database (extract if needed)
-            if not DatabaseManager.setup():
-                # Database setup failed
-                GLib.idle_add(self._on_database_setup_failed)
-                return
+            ready = backend.setup_finish(result)
+        except GLib.Error as e:
+            utils.log_error(f"Database setup failed: {e.message}")
+            ready = False
 
-            # Database ready, initialize WordNet
-            GLib.idle_add(self._init_wordnet)
+        if not ready:
+            self._on_database_setup_failed()
+            return
 
-        except Exception as e:
-            utils.log_error(f"Database setup failed: {e}")
-            GLib.idle_add(self._on_database_setup_failed)
+        self._complete_initialization()
+        backend.load_wordlist_async(None, self._on_wordlist_loaded)
 
     def _on_database_setup_failed(self):
         """Handle database setup failure."""
         self._page_switch(Page.DB_ERROR)
 
-    def _init_wordnet(self):
-        self._wn_instance = base.get_wn_instance()
-        if not self._wn_instance:
-            self._on_database_setup_failed()
+    def _on_wordlist_loaded(self, backend: Backend, result: Gio.AsyncResult) -> None:
+        try:
+            wordlist = backend.load_wordlist_finish(result)
+        except GLib.Error as e:
+            utils.log_warning(f"Wordlist not loaded, completions are unavailable: {e.message}")
             return
-
-        self._complete_initialization()
-        base.get_wn_wordlist(self._wn_instance, lambda wordlist: GLib.idle_add(self._on_wordlist_loaded, wordlist))
-
-    def _on_wordlist_loaded(self, wordlist):
-        wordlist.sort(key=str.casefold)
-        self._wn_wordlist = wordlist
-        utils.log_info(f"Wordlist loaded with {len(self._wn_wordlist)} words. Completions now available.")
+        utils.log_info(f"Wordlist loaded with {len(wordlist)} words. Completions now available.")
 
     def _complete_initialization(self):
         """Finalizes the initialization process and shows the main welcome screen."""
@@ -1006,10 +1291,13 @@ class WordbookWindow(Adw.ApplicationWindow):
 
     def _clear_definitions(self) -> None:
         """Clears all definitions from the listbox."""
+        self._pronunciation_rows = []
+        self._glossary_box = None
+        self._glossary_spinner = None
         while (child := self._definitions_listbox.get_first_child()) is not None:
             self._definitions_listbox.remove(child)
 
-    def _create_definition_widget(self, pos: str, synsets: list[dict[str, Any]]) -> Gtk.Widget:
+    def _create_definition_widget(self, pos: str, synsets: Sequence[base.SynsetResult]) -> Gtk.Widget:
         """Creates a widget to display definitions for a specific part of speech."""
         pos_box = Gtk.Box(
             orientation=Gtk.Orientation.VERTICAL,
@@ -1044,14 +1332,14 @@ class WordbookWindow(Adw.ApplicationWindow):
                     spacing=4,
                 )
 
-                pronunciation_box.append(
-                    self._create_header_row(
-                        lemma_group.lemma,
-                        "synset-header",
-                        pronunciation_group.pronunciation,
-                        lemma_group.lemma,
-                    )
+                header_row, controls = self._create_header_row(
+                    lemma_group.lemma,
+                    "synset-header",
+                    pronunciation_group.pronunciation,
+                    lemma_group.lemma,
                 )
+                pronunciation_box.append(header_row)
+                self._pronunciation_rows.append((tuple(id(synset) for synset in pronunciation_group.synsets), controls))
 
                 for definition_number, synset in enumerate(pronunciation_group.synsets, start=1):
                     pronunciation_box.append(self._create_definition_row(synset, definition_number))
@@ -1065,7 +1353,7 @@ class WordbookWindow(Adw.ApplicationWindow):
 
         return pos_box
 
-    def _create_relation_widget(self, relation_type: str, words: list[str]) -> Gtk.Widget | None:
+    def _create_relation_widget(self, relation_type: str, words: Sequence[str]) -> Gtk.Widget | None:
         """Creates a widget to display related words (e.g., synonyms) as clickable buttons."""
         if not words:
             return None
@@ -1093,6 +1381,124 @@ class WordbookWindow(Adw.ApplicationWindow):
 
         return wrap_box
 
+    def _create_taxonomy_expander(self, synset_id: str) -> Gtk.Expander:
+        """Creates a collapsed hierarchy browser. Its contents are only built once it is expanded."""
+        expander = Gtk.Expander(label=_("Hierarchy"), css_classes=["relation-type"])
+        expander.connect("notify::expanded", self._on_taxonomy_expanded, synset_id)
+        return expander
+
+    def _on_taxonomy_expanded(self, expander: Gtk.Expander, _pspec: GObject.ParamSpec, synset_id: str) -> None:
+        if not expander.get_expanded() or expander.get_child() is not None:
+            return
+
+        expander.set_child(Adw.Spinner(halign=Gtk.Align.START, width_request=16, height_request=16))
+        self._backend.taxonomy_async(synset_id, None, functools.partial(self._on_taxonomy_ready, expander))
+
+    def _on_taxonomy_ready(self, expander: Gtk.Expander, backend: Backend, result: Gio.AsyncResult) -> None:
+        """Shows the relations of a synset in its hierarchy browser."""
+        try:
+            node = backend.taxonomy_finish(result)
+        except GLib.Error:
+            # Failed, or dropped when the window closed.
+            node = None
+
+        if node is None:
+            expander.set_child(Gtk.Label(label=_("No hierarchy available"), xalign=0.0, css_classes=["dimmed"]))
+            return
+
+        headings = {
+            "hypernyms": _("Broader Terms"),
+            "hyponyms": _("Narrower Terms"),
+            "meronyms": _("Parts"),
+            "holonyms": _("Part Of"),
+        }
+        root = Gio.ListStore(item_type=TaxonomyItem)
+        for relation, heading in headings.items():
+            if node.relations[relation]:
+                root.append(TaxonomyItem(heading, None, node, relation, is_heading=True))
+
+        if root.get_n_items() == 0:
+            expander.set_child(Gtk.Label(label=_("No hierarchy available"), xalign=0.0, css_classes=["dimmed"]))
+            return
+
+        tree_model = Gtk.TreeListModel.new(root, False, False, self._create_taxonomy_children)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_taxonomy_item_setup)
+        factory.connect("bind", self._on_taxonomy_item_bind)
+
+        list_view = Gtk.ListView(
+            model=Gtk.NoSelection(model=tree_model),
+            factory=factory,
+            css_classes=["navigation-sidebar"],
+        )
+        list_view.connect("activate", self._on_taxonomy_item_activated)
+
+        expander.set_child(
+            Gtk.ScrolledWindow(
+                child=list_view,
+                hscrollbar_policy=Gtk.PolicyType.NEVER,
+                propagate_natural_height=True,
+                max_content_height=360,
+            )
+        )
+
+    def _create_taxonomy_children(self, item: TaxonomyItem) -> Gio.ListModel | None:
+        """
+        Loads the related synsets of a row when it is first expanded. Rows keep following the same relation.
+
+        The children are read on the backend and added to the returned model once they are ready.
+        """
+        if not item.node.relations[item.relation]:
+            return None
+
+        children = Gio.ListStore(item_type=TaxonomyItem)
+
+        def on_related(backend: Backend, result: Gio.AsyncResult):
+            try:
+                related_nodes = backend.related_nodes_finish(result)
+            except GLib.Error:
+                return
+            children.splice(
+                0,
+                0,
+                [
+                    TaxonomyItem(", ".join(related.lemmas), related.definition, related, item.relation)
+                    for related in related_nodes
+                ],
+            )
+
+        self._backend.related_nodes_async(item.node, item.relation, None, on_related)
+        return children
+
+    @staticmethod
+    def _on_taxonomy_item_setup(_factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        expander = Gtk.TreeExpander()
+        expander.set_child(Gtk.Label(xalign=0.0, ellipsize=Pango.EllipsizeMode.END))
+        list_item.set_child(expander)
+
+    @staticmethod
+    def _on_taxonomy_item_bind(_factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        expander: Gtk.TreeExpander = list_item.get_child()
+        row: Gtk.TreeListRow = list_item.get_item()
+        item: TaxonomyItem = row.get_item()
+
+        expander.set_list_row(row)
+        label: Gtk.Label = expander.get_child()
+        label.set_label(item.label)
+        label.set_tooltip_text(item.tooltip)
+        if item.is_heading:
+            label.add_css_class("heading")
+        else:
+            label.remove_css_class("heading")
+
+    def _on_taxonomy_item_activated(self, list_view: Gtk.ListView, position: int) -> None:
+        """Looks up the first lemma of an activated synset row."""
+        row: Gtk.TreeListRow = list_view.get_model().get_item(position)
+        item: TaxonomyItem = row.get_item()
+        if not item.is_heading:
+            self._on_word_button_clicked(None, item.node.lemmas[0])
+
     def _on_word_button_clicked(self, _button: Gtk.Button, word: str) -> None:
         """Handles clicks on related word buttons, triggering a new search."""
         self._search_entry.set_text(word)
@@ -1103,6 +1509,197 @@ class WordbookWindow(Adw.ApplicationWindow):
 
         self.on_search_clicked()
 
+    def _create_lemma_buttons(self, lemmas: Iterable[str]) -> Adw.WrapBox:
+        wrap_box = Adw.WrapBox(valign=Gtk.Align.START, line_spacing=4, child_spacing=6)
+        self._append_lemma_buttons(wrap_box, lemmas)
+        return wrap_box
+
+    def _append_lemma_buttons(self, wrap_box: Adw.WrapBox, lemmas: Iterable[str]) -> None:
+        for lemma in lemmas:
+            button = Gtk.Button(label=lemma, css_classes=["lemma-button"])
+            button.connect("clicked", self._on_word_button_clicked, lemma)
+            wrap_box.append(button)
+
+    def _create_matches_widget(
+        self,
+        mode: base.SearchMode,
+        matches: list[tuple[tuple[str, ...], str | None]],
+        more_matches: Iterator[tuple[tuple[str, ...], str | None]] | None,
+    ) -> Gtk.Widget:
+        """
+        Creates a widget listing the lemmas found by a search mode.
+
+        Matches with a definition get a row each, the others share one wrapping
+        list. If more matches are available, a button loads them a page at a time.
+        """
+        titles = {
+            base.SearchMode.REVERSE: _("Reverse Lookup"),
+            base.SearchMode.PATTERN: _("Pattern Matches"),
+            base.SearchMode.ANAGRAM: _("Anagrams"),
+            base.SearchMode.LETTERS: _("Words From These Letters"),
+            base.SearchMode.RHYMES: _("Rhymes"),
+            base.SearchMode.SOUNDS: _("Sounds Like"),
+        }
+        matches_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=12,
+            margin_top=12,
+            margin_bottom=12,
+            margin_start=12,
+            margin_end=12,
+        )
+        matches_box.append(Gtk.Label(label=titles[mode], xalign=0.0, css_classes=["pos-header"]))
+
+        lemmas_box = self._create_lemma_buttons(
+            lemma for lemmas, detail in matches if detail is None for lemma in lemmas
+        )
+        lemmas_box.set_visible(lemmas_box.get_first_child() is not None)
+        matches_box.append(lemmas_box)
+
+        for lemmas, detail in matches:
+            if detail is None:
+                continue
+            match_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+            match_box.append(self._create_lemma_buttons(lemmas))
+            match_box.append(
+                Gtk.Label(label=detail, wrap=True, xalign=0.0, selectable=True, css_classes=["definition"])
+            )
+            matches_box.append(match_box)
+
+        if more_matches is not None:
+            more_button = Gtk.Button(label=_("Show More"), halign=Gtk.Align.CENTER, css_classes=["pill"])
+            more_button.connect("clicked", self._on_show_more_matches_clicked, lemmas_box, more_matches)
+            matches_box.append(more_button)
+
+        return matches_box
+
+    def _on_show_more_matches_clicked(
+        self,
+        button: Gtk.Button,
+        lemmas_box: Adw.WrapBox,
+        more_matches: Iterator[tuple[tuple[str, ...], str | None]],
+    ) -> None:
+        """Takes the next page of matches off the main thread and appends it to the list."""
+        button.set_sensitive(False)
+
+        def on_loaded(backend: Backend, result: Gio.AsyncResult):
+            try:
+                page = backend.take_matches_finish(result)
+            except GLib.Error:
+                button.set_visible(False)
+                return
+            self._on_more_matches_loaded(button, lemmas_box, page)
+
+        self._backend.take_matches_async(more_matches, None, on_loaded)
+
+    def _on_more_matches_loaded(
+        self,
+        button: Gtk.Button,
+        lemmas_box: Adw.WrapBox,
+        page: list[tuple[tuple[str, ...], str | None]],
+    ) -> bool:
+        # The results may have been replaced while the page was loading.
+        if lemmas_box.get_root() is None:
+            return False
+
+        lemmas = (lemma for match_lemmas, _detail in page[:MATCHES_PAGE_SIZE] for lemma in match_lemmas)
+        self._append_lemma_buttons(lemmas_box, lemmas)
+        if len(page) > MATCHES_PAGE_SIZE:
+            button.set_sensitive(True)
+        else:
+            button.set_visible(False)
+        return False
+
+    def _populate_matches(
+        self,
+        mode: base.SearchMode,
+        matches: list[tuple[tuple[str, ...], str | None]],
+        more_matches: Iterator[tuple[tuple[str, ...], str | None]] | None = None,
+    ) -> None:
+        """Populates the definitions listbox with the lemmas found by a search mode."""
+        self._clear_definitions()
+
+        row = Gtk.ListBoxRow(
+            focusable=False,
+            margin_top=4,
+            margin_bottom=4,
+            margin_start=4,
+            margin_end=4,
+        )
+        row.set_child(self._create_matches_widget(mode, matches, more_matches))
+        self._definitions_listbox.append(row)
+        row.remove_css_class("activatable")
+
+    def _populate_glossary(self, term_count: int) -> None:
+        """Shows an empty glossary that entries are appended to as they are resolved."""
+        self._clear_definitions()
+
+        glossary_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=12,
+            margin_top=12,
+            margin_bottom=12,
+            margin_start=12,
+            margin_end=12,
+        )
+        glossary_box.append(Gtk.Label(label=_("Glossary"), xalign=0.0, css_classes=["pos-header"]))
+        glossary_box.append(
+            Gtk.Label(
+                label=ngettext("{count} term", "{count} terms", term_count).format(count=term_count),
+                xalign=0.0,
+                css_classes=["dimmed"],
+            )
+        )
+        self._glossary_spinner = Adw.Spinner(halign=Gtk.Align.CENTER, width_request=24, height_request=24)
+        glossary_box.append(self._glossary_spinner)
+        self._glossary_box = glossary_box
+
+        row = Gtk.ListBoxRow(
+            focusable=False,
+            margin_top=4,
+            margin_bottom=4,
+            margin_start=4,
+            margin_end=4,
+        )
+        row.set_child(glossary_box)
+        self._definitions_listbox.append(row)
+        row.remove_css_class("activatable")
+
+    def _on_glossary_entries_ready(self, cancellable: Gio.Cancellable, entries: list[base.GlossaryEntry]) -> bool:
+        # The glossary may have been replaced since the entries were queued.
+        if cancellable.is_cancelled() or self._glossary_box is None:
+            return False
+
+        for entry in entries:
+            self._glossary_box.insert_child_after(
+                self._create_glossary_entry(entry), self._glossary_spinner.get_prev_sibling()
+            )
+        return False
+
+    def _create_glossary_entry(self, entry: base.GlossaryEntry) -> Gtk.Box:
+        entry_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        header_box.append(self._create_lemma_buttons([entry.lemma]))
+        written = "" if entry.text.casefold() == entry.lemma.casefold() else f"“{entry.text}”, "
+        header_box.append(
+            Gtk.Label(label=f"{written}{entry.pos}", xalign=0.0, valign=Gtk.Align.CENTER, css_classes=["dimmed"])
+        )
+        entry_box.append(header_box)
+        entry_box.append(
+            Gtk.Label(label=entry.definition, wrap=True, xalign=0.0, selectable=True, css_classes=["definition"])
+        )
+        return entry_box
+
+    def _on_glossary_finished(self, backend: Backend, result: Gio.AsyncResult) -> None:
+        try:
+            backend.glossary_finish(result)
+        except GLib.Error as e:
+            # A cancelled glossary was replaced, and the spinner may already be a newer one's.
+            if is_cancelled(e):
+                return
+        if self._glossary_spinner is not None:
+            self._glossary_spinner.set_visible(False)
+
     def _populate_definitions(self, result: dict[str, Any]) -> None:
         """Populates the definitions listbox with the search results."""
         self._clear_definitions()